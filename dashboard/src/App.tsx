@@ -207,6 +207,21 @@ interface AppState {
   plugins?: Plugin[];
 }
 
+// Top-level JSON Patch op, as sent in "delta" messages
+interface StatePatchOp {
+  op: 'add' | 'replace' | 'remove';
+  path: string;
+  value?: unknown;
+}
+
+interface ServerMessage {
+  type: string;
+  data?: unknown;
+  epoch?: string;
+  rev?: number;
+  patch?: StatePatchOp[];
+}
+
 const WS_URL = 'ws://127.0.0.1:8766';
 
 // Styled components with macOS aesthetic
@@ -271,6 +286,9 @@ const App: React.FC = () => {
   const [checkingHealth, setCheckingHealth] = useState(false);
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectTimeoutRef = useRef<number | null>(null);
+  // Server state revision we hold (and the server process's epoch it
+  // belongs to); sent on reconnect to get only a delta
+  const stateRevRef = useRef<{ epoch: string; rev: number } | null>(null);
 
   // Create macOS-style theme
   const theme = useMemo(
@@ -455,11 +473,34 @@ const App: React.FC = () => {
     [darkMode]
   );
 
-  const handleMessage = useCallback((data: { type: string; data: unknown }) => {
+  const handleMessage = useCallback((data: ServerMessage) => {
     switch (data.type) {
       case 'state':
+        stateRevRef.current =
+          data.epoch !== undefined && data.rev !== undefined
+            ? { epoch: data.epoch, rev: data.rev }
+            : null;
         setState(data.data as AppState);
         break;
+      case 'delta':
+        stateRevRef.current =
+          data.epoch !== undefined && data.rev !== undefined
+            ? { epoch: data.epoch, rev: data.rev }
+            : null;
+        setState((prev) => {
+          if (!prev) return null;
+          const next: Record<string, unknown> = { ...prev };
+          for (const { op, path, value } of data.patch ?? []) {
+            const key = path.slice(1);
+            if (op === 'remove') {
+              delete next[key];
+            } else {
+              next[key] = value;
+            }
+          }
+          return next as unknown as AppState;
+        });
+        break;
       case 'project_changed':
         setState((prev) =>
           prev ? { ...prev, current_project: data.data as ProjectProfile } : null
@@ -585,7 +626,11 @@ const App: React.FC = () => {
     ws.onopen = () => {
       setConnected(true);
       setReconnectAttempts(0);
-      ws.send(JSON.stringify({ type: 'get_state' }));
+      ws.send(JSON.stringify({
+        type: 'get_state',
+        since: stateRevRef.current?.rev,
+        epoch: stateRevRef.current?.epoch,
+      }));
       ws.send(JSON.stringify({ type: 'list_plugins' }));
       ws.send(JSON.stringify({ type: 'detect_plugins' }));
     };
@@ -593,7 +638,11 @@ const App: React.FC = () => {
     ws.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
-        handleMessage(data);
+        if (data.type === 'batch') {
+          data.events.forEach(handleMessage);
+        } else {
+          handleMessage(data);
+        }
       } catch (e) {
         console.error('Failed to parse message:', e);
       }
@@ -5,6 +5,7 @@ from pydantic_settings import BaseSettings
 from pathlib import Path
 from typing import Optional
 import json
+import os
 
 
 class GuardrailsConfig(BaseModel):
@@ -150,8 +151,11 @@ class ServerConfig(BaseSettings):
     def save(self):
         """Save configuration to file."""
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, 'w') as f:
-            json.dump(self.model_dump(mode='json'), f, indent=2, default=str)
+        # Serialize in one pass and swap the file in atomically, so a crash
+        # mid-write never leaves a truncated config behind
+        tmp_path = self.config_file.with_name(self.config_file.name + ".tmp")
+        tmp_path.write_text(self.model_dump_json(indent=2))
+        os.replace(tmp_path, self.config_file)
     
     @classmethod
     def load(cls) -> "ServerConfig":
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 import uuid
 
-from sqlalchemy import select, desc, func, or_, and_
+from sqlalchemy import insert, select, desc, func, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
 
@@ -28,6 +28,27 @@ class CommandRepository(BaseRepository[Command]):
         )
         return list(result.scalars().all())
 
+    async def get_recent_summaries(self, limit: int = 50) -> List[dict]:
+        """
+        Get the most recent commands as plain dicts, without output.
+
+        Only the summary columns are selected, so stdout/stderr are never
+        loaded and no ORM objects are built.
+        """
+        result = await self.session.execute(
+            select(
+                Command.id,
+                Command.command,
+                Command.cwd,
+                Command.status,
+                Command.exit_code,
+                Command.timestamp,
+            )
+            .order_by(desc(Command.timestamp))
+            .limit(limit)
+        )
+        return [dict(row) for row in result.mappings()]
+
     async def search(
         self,
         text_query: Optional[str] = None,
@@ -111,6 +132,38 @@ class CommandRepository(BaseRepository[Command]):
         )
         return await self.add(cmd)
 
+    async def add_commands(self, commands: List[dict]) -> int:
+        """
+        Add several commands to history with a single multi-row INSERT.
+
+        Args:
+            commands: Dicts with the keyword arguments of add_command
+
+        Returns:
+            Number of commands inserted
+        """
+        if not commands:
+            return 0
+
+        now = datetime.now()
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "command": c["command"],
+                "cwd": c["cwd"],
+                "status": c["status"],
+                "exit_code": c.get("exit_code"),
+                "stdout": c.get("stdout"),
+                "stderr": c.get("stderr"),
+                "timestamp": c.get("timestamp") or now,
+                "project_id": c.get("project_id"),
+            }
+            for c in commands
+        ]
+        await self.session.execute(insert(Command), rows)
+        await self.session.commit()
+        return len(rows)
+
     async def get_by_project(
         self, project_id: str, limit: int = 50
     ) -> List[Command]:
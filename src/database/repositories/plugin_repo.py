@@ -4,8 +4,8 @@ from datetime import datetime
 from typing import Optional, List
 import uuid
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import exists, insert, literal, select
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
@@ -20,11 +20,11 @@ class PluginRepository(BaseRepository[Plugin]):
         super().__init__(session, Plugin)
 
     async def get_all_with_tools(self) -> List[Plugin]:
-        """Get all plugins with their tools loaded."""
+        """Get all plugins with their tools loaded in a single JOIN query."""
         result = await self.session.execute(
-            select(Plugin).options(selectinload(Plugin.tools))
+            select(Plugin).options(joinedload(Plugin.tools))
         )
-        return list(result.scalars().all())
+        return list(result.unique().scalars().all())
 
     async def get_with_tools(self, plugin_id: str) -> Optional[Plugin]:
         """Get a plugin with tools loaded."""
@@ -51,7 +51,8 @@ class PluginRepository(BaseRepository[Plugin]):
         author: Optional[str] = None,
         description: Optional[str] = None,
         tool_names: Optional[List[str]] = None,
-    ) -> Plugin:
+        if_absent: bool = False,
+    ) -> Optional[Plugin]:
         """
         Add a new plugin with optional tools.
 
@@ -63,23 +64,43 @@ class PluginRepository(BaseRepository[Plugin]):
             author: Plugin author
             description: Plugin description
             tool_names: List of tool names provided by the plugin
+            if_absent: Only insert if no plugin with this name exists; the
+                check and insert run as one statement
 
         Returns:
-            Created Plugin instance
+            Created Plugin instance, or None if if_absent and the name exists
         """
-        plugin = Plugin(
-            id=str(uuid.uuid4()),
-            name=name,
-            git_url=git_url,
-            version=version,
-            author=author,
-            description=description,
-            installed_at=datetime.now(),
-            enabled=True,
-            install_path=install_path,
-        )
-
-        self.session.add(plugin)
+        values = {
+            "id": str(uuid.uuid4()),
+            "name": name,
+            "git_url": git_url,
+            "version": version,
+            "author": author,
+            "description": description,
+            "installed_at": datetime.now(),
+            "enabled": True,
+            "install_path": install_path,
+        }
+
+        if if_absent:
+            # INSERT ... SELECT ... WHERE NOT EXISTS ... RETURNING
+            columns = Plugin.__table__.c
+            result = await self.session.execute(
+                insert(Plugin)
+                .from_select(
+                    list(values),
+                    select(
+                        *(literal(v, columns[k].type) for k, v in values.items())
+                    ).where(~exists().where(Plugin.name == name)),
+                )
+                .returning(Plugin)
+            )
+            plugin = result.scalar_one_or_none()
+            if plugin is None:
+                return None
+        else:
+            plugin = Plugin(**values)
+            self.session.add(plugin)
 
         # Add tools if provided
         if tool_names:
@@ -137,6 +158,16 @@ class PluginRepository(BaseRepository[Plugin]):
         )
         return list(result.scalars().all())
 
+    async def get_enabled_tool_mapping(self) -> dict[str, str]:
+        """Map enabled tool names to plugin IDs across enabled plugins."""
+        result = await self.session.execute(
+            select(PluginTool.tool_name, PluginTool.plugin_id)
+            .join(Plugin, PluginTool.plugin_id == Plugin.id)
+            .where(Plugin.enabled == True)
+            .where(PluginTool.enabled == True)
+        )
+        return dict(result.all())
+
     async def delete_plugin(self, plugin_id: str) -> bool:
         """Delete a plugin and all its tools (cascade)."""
         plugin = await self.get_by_id(plugin_id)
@@ -4,6 +4,8 @@ import asyncio
 import subprocess
 import os
 import signal
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Callable, Awaitable
 from dataclasses import dataclass, field
@@ -14,6 +16,10 @@ import psutil
 from .config import get_config, GuardrailsConfig
 
 
+# Most recent command results kept in memory by ShellExecutor
+_HISTORY_LIMIT = 500
+
+
 class CommandStatus(str, Enum):
     PENDING = "pending"
     APPROVED = "approved"
@@ -157,7 +163,7 @@ class ShellExecutor:
         self.process_manager = ProcessManager()
         self.pending_approvals: dict[str, PendingApproval] = {}
         self._approval_counter = 0
-        self.command_history: list[CommandResult] = []
+        self.command_history: deque[CommandResult] = deque(maxlen=_HISTORY_LIMIT)
     
     def _log(self, level: str, message: str):
         """Log a message."""
@@ -316,6 +322,8 @@ class ShellExecutor:
     
     def get_history(self, limit: int = 50) -> list[dict]:
         """Get recent command history."""
+        recent = list(islice(reversed(self.command_history), limit))
+        recent.reverse()
         return [
             {
                 "command": r.command,
@@ -325,5 +333,5 @@ class ShellExecutor:
                 "started_at": r.started_at.isoformat() if r.started_at else None,
                 "completed_at": r.completed_at.isoformat() if r.completed_at else None,
             }
-            for r in self.command_history[-limit:]
+            for r in recent
         ]
@@ -109,7 +109,10 @@ class DevOrchestratorMenubar(rumps.App):
                     self.connected = True
                     self._update_icon()
                     self._build_menu()
-                    
+
+                    # The server sends state only on request
+                    await ws.send(json.dumps({"type": "get_state"}))
+
                     async for message in ws:
                         try:
                             data = json.loads(message)
@@ -1,7 +1,13 @@
 """Plugin management package."""
 
 from .manager import PluginManager, get_plugin_manager
-from .models import PluginInfo, PluginToolInfo, InstallResult, PluginManifest
+from .models import (
+    PluginInfo,
+    PluginToolInfo,
+    InstallResult,
+    PluginManifest,
+    PluginListResponse,
+)
 from .installer import PluginInstaller
 
 __all__ = [
@@ -11,5 +17,6 @@ __all__ = [
     "PluginToolInfo",
     "InstallResult",
     "PluginManifest",
+    "PluginListResponse",
     "PluginInstaller",
 ]
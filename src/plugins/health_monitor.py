@@ -1,14 +1,40 @@
 """Health monitoring system for MCP servers."""
 
 import asyncio
+import io
 import json
 import os
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _PARSE_ERRORS = (json.JSONDecodeError,)
+
+# JSON-RPC tools/list request, newline-delimited for the stdio transport
+_LIST_TOOLS_REQUEST = json.dumps({
+    "jsonrpc": "2.0",
+    "method": "tools/list",
+    "params": {},
+    "id": 1
+}).encode() + b"\n"
+
+# StreamReader line limit for server stdout. The default 64 KiB is easily
+# exceeded by a tools/list response carrying full input schemas, which would
+# make readline() fail on an otherwise healthy server.
+_STDOUT_LIMIT = 16 * 1024 * 1024
+
+# ijson events that open a new element inside an array
+_ITEM_START_EVENTS = frozenset({
+    'start_map', 'start_array', 'null', 'boolean', 'integer', 'double', 'number', 'string',
+})
 
 class HealthStatus(Enum):
     """Health status levels."""
@@ -18,7 +44,7 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheck:
     """Health check result."""
     plugin_id: str
@@ -26,7 +52,13 @@ class HealthCheck:
     response_time_ms: Optional[float]
     error_message: Optional[str]
     tools_count: Optional[int]
-    last_checked: float
+    last_checked: float  # wall-clock time, for display
+    checked_at: float = field(default_factory=time.monotonic)  # for cache freshness
+    ttl: float = 0.0
+
+    def is_fresh(self) -> bool:
+        """Whether this result is still within its cache TTL."""
+        return time.monotonic() - self.checked_at < self.ttl
 
     def to_dict(self) -> Dict:
         return {
@@ -36,15 +68,58 @@ class HealthCheck:
             'error_message': self.error_message,
             'tools_count': self.tools_count,
             'last_checked': self.last_checked,
+            'fresh_until': self.last_checked + self.ttl,
         }
 
 
+def _count_tools(payload: bytes) -> Optional[int]:
+    """Count the entries of ``result.tools`` in a JSON-RPC response.
+
+    Streams the payload with ijson when available so tool schemas are never
+    materialized; stops as soon as the tools array closes.
+
+    Returns:
+        Number of tools, or None if the response has no ``result.tools`` array
+    """
+    if not IJSON_AVAILABLE:
+        response = json.loads(payload)
+        if 'result' in response and 'tools' in response['result']:
+            return len(response['result']['tools'])
+        return None
+
+    count = None
+    for prefix, event, _ in ijson.parse(io.BytesIO(payload)):
+        if prefix == 'result.tools':
+            if event == 'start_array':
+                count = 0
+            elif event == 'end_array':
+                return count
+        elif prefix == 'result.tools.item' and count is not None and event in _ITEM_START_EVENTS:
+            count += 1
+    return None
+
+
 class PluginHealthMonitor:
     """Monitors health of installed MCP servers."""
 
     def __init__(self):
         self.health_cache: Dict[str, HealthCheck] = {}
-        self.cache_ttl = 60  # Cache health checks for 60 seconds
+        self.cache_ttl = 60  # Cache healthy/degraded results for 60 seconds
+        self.negative_ttl = 5  # Re-probe down/unknown servers sooner
+        self.max_concurrent_probes = 8
+        self._probe_sem = asyncio.Semaphore(self.max_concurrent_probes)
+        self._base_env: Dict[str, str] = dict(os.environ)
+
+        # Long-lived MCP server processes, reused across probes
+        self._procs: Dict[str, asyncio.subprocess.Process] = {}
+        self._proc_locks: Dict[str, asyncio.Lock] = {}
+
+        # (base_path, candidates) -> (base_path mtime_ns, server file)
+        self._server_file_cache: Dict[tuple, tuple] = {}
+
+    def refresh_env(self):
+        """Re-snapshot os.environ for probes that override env vars."""
+        self._base_env = dict(os.environ)
 
     async def check_plugin_health(self, plugin_info: Dict) -> HealthCheck:
         """Check health of a single plugin.
@@ -58,18 +133,19 @@ class PluginHealthMonitor:
         plugin_id = plugin_info['id']
 
         # Check cache first
-        if plugin_id in self.health_cache:
-            cached = self.health_cache[plugin_id]
-            if time.time() - cached.last_checked < self.cache_ttl:
-                return cached
+        cached = self.health_cache.get(plugin_id)
+        if cached is not None and cached.is_fresh():
+            return cached
 
         # Perform health check
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Strategy 1: Check if plugin has a health endpoint
             if 'install_path' in plugin_info:
-                health = await self._check_mcp_server_health(plugin_info)
+                # Limit how many server processes are booting at once
+                async with self._probe_sem:
+                    health = await self._check_mcp_server_health(plugin_info)
             else:
                 health = HealthCheck(
                     plugin_id=plugin_id,
@@ -80,145 +156,97 @@ class PluginHealthMonitor:
                     last_checked=time.time(),
                 )
 
-            # Cache result
-            self.health_cache[plugin_id] = health
-            return health
+            return self._cache_result(health)
 
         except Exception as e:
             health = HealthCheck(
                 plugin_id=plugin_id,
                 status=HealthStatus.DOWN,
-                response_time_ms=(time.time() - start_time) * 1000,
+                response_time_ms=(time.monotonic() - start_time) * 1000,
                 error_message=str(e),
                 tools_count=None,
                 last_checked=time.time(),
             )
-            self.health_cache[plugin_id] = health
-            return health
+            return self._cache_result(health)
+
+    def _cache_result(self, health: HealthCheck) -> HealthCheck:
+        """Store a health check result with a TTL based on its status."""
+        if health.status in (HealthStatus.HEALTHY, HealthStatus.DEGRADED):
+            health.ttl = self.cache_ttl
+        else:
+            health.ttl = self.negative_ttl
+        self.health_cache[health.plugin_id] = health
+        return health
 
     async def _check_mcp_server_health(self, plugin_info: Dict) -> HealthCheck:
         """Check MCP server health by attempting to list tools.
 
-        This executes the MCP server and sends a list_tools request.
+        Sends a list_tools request over the stdio pipe of a long-lived server
+        process, spawning (or respawning) the server when needed.
         """
         plugin_id = plugin_info['id']
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
-            # Check if plugin has explicit command and args (from system configs like Claude Desktop)
-            if 'command' in plugin_info and 'args' in plugin_info:
-                command = plugin_info['command']
-                args = plugin_info['args']
-                env = plugin_info.get('env', {})
-
-                # Merge env with current environment
-                full_env = {**os.environ, **env}
-
-                # Run the MCP server with its configured command
-                process = await asyncio.create_subprocess_exec(
-                    command,
-                    *args,
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env=full_env
-                )
-            else:
-                # Fall back to detecting runtime from install_path
-                install_path = Path(plugin_info['install_path'])
-                runtime = plugin_info.get('runtime', 'python')
-
-                if runtime == 'python':
-                    # Python MCP server
-                    server_file = self._find_server_file(install_path, ['server.py', 'main.py', '__main__.py'])
-                    if not server_file:
-                        raise FileNotFoundError("No Python server file found")
-
-                    # Run server with test request
-                    process = await asyncio.create_subprocess_exec(
-                        'python3', str(server_file),
-                        stdin=asyncio.subprocess.PIPE,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        cwd=str(install_path)
+            # One request in flight per server pipe
+            async with self._proc_locks.setdefault(plugin_id, asyncio.Lock()):
+                process = await self._get_server_process(plugin_info)
+
+                try:
+                    async with asyncio.timeout(5.0):
+                        stdout = await self._send_list_tools(process)
+                except asyncio.TimeoutError:
+                    await self._discard_process(plugin_id)
+                    return HealthCheck(
+                        plugin_id=plugin_id,
+                        status=HealthStatus.DOWN,
+                        response_time_ms=(time.monotonic() - start_time) * 1000,
+                        error_message="Server timeout (>5s)",
+                        tools_count=None,
+                        last_checked=time.time(),
                     )
-
-                elif runtime == 'node':
-                    # Node.js MCP server
-                    package_json = install_path / "package.json"
-                    if not package_json.exists():
-                        raise FileNotFoundError("No package.json found")
-
-                    # Run via npm or node
-                    process = await asyncio.create_subprocess_exec(
-                        'npm', 'start',
-                        stdin=asyncio.subprocess.PIPE,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        cwd=str(install_path)
-                    )
-                else:
-                    raise ValueError(f"Unknown runtime: {runtime}")
-
-            # Send list_tools request via stdio
-            list_tools_request = json.dumps({
-                "jsonrpc": "2.0",
-                "method": "tools/list",
-                "params": {},
-                "id": 1
-            }) + "\n"
-
-            try:
-                stdout, _ = await asyncio.wait_for(
-                    process.communicate(list_tools_request.encode()),
-                    timeout=5.0
-                )
-
-                response_time = (time.time() - start_time) * 1000
-
-                # Parse response
-                if stdout:
-                    try:
-                        response = json.loads(stdout.decode())
-                        if 'result' in response and 'tools' in response['result']:
-                            tools_count = len(response['result']['tools'])
-                            return HealthCheck(
-                                plugin_id=plugin_id,
-                                status=HealthStatus.HEALTHY,
-                                response_time_ms=response_time,
-                                error_message=None,
-                                tools_count=tools_count,
-                                last_checked=time.time(),
-                            )
-                    except json.JSONDecodeError:
-                        pass
-
-                # Server responded but didn't return valid tools
-                return HealthCheck(
-                    plugin_id=plugin_id,
-                    status=HealthStatus.DEGRADED,
-                    response_time_ms=response_time,
-                    error_message="Server responded but no tools found",
-                    tools_count=0,
-                    last_checked=time.time(),
-                )
-
-            except asyncio.TimeoutError:
-                process.kill()
-                return HealthCheck(
-                    plugin_id=plugin_id,
-                    status=HealthStatus.DOWN,
-                    response_time_ms=(time.time() - start_time) * 1000,
-                    error_message="Server timeout (>5s)",
-                    tools_count=None,
-                    last_checked=time.time(),
-                )
+                except Exception:
+                    # Broken pipe; respawn on the next probe
+                    await self._discard_process(plugin_id)
+                    raise
+
+                if not stdout:
+                    # Server exited without answering
+                    await self._discard_process(plugin_id)
+
+            response_time = (time.monotonic() - start_time) * 1000
+
+            # Parse response
+            if stdout:
+                try:
+                    tools_count = _count_tools(stdout)
+                    if tools_count is not None:
+                        return HealthCheck(
+                            plugin_id=plugin_id,
+                            status=HealthStatus.HEALTHY,
+                            response_time_ms=response_time,
+                            error_message=None,
+                            tools_count=tools_count,
+                            last_checked=time.time(),
+                        )
+                except _PARSE_ERRORS:
+                    pass
+
+            # Server responded but didn't return valid tools
+            return HealthCheck(
+                plugin_id=plugin_id,
+                status=HealthStatus.DEGRADED,
+                response_time_ms=response_time,
+                error_message="Server responded but no tools found",
+                tools_count=0,
+                last_checked=time.time(),
+            )
 
         except FileNotFoundError as e:
             return HealthCheck(
                 plugin_id=plugin_id,
                 status=HealthStatus.DOWN,
-                response_time_ms=(time.time() - start_time) * 1000,
+                response_time_ms=(time.monotonic() - start_time) * 1000,
                 error_message=f"Server file not found: {e}",
                 tools_count=None,
                 last_checked=time.time(),
@@ -227,27 +255,163 @@ class PluginHealthMonitor:
             return HealthCheck(
                 plugin_id=plugin_id,
                 status=HealthStatus.DOWN,
-                response_time_ms=(time.time() - start_time) * 1000,
+                response_time_ms=(time.monotonic() - start_time) * 1000,
                 error_message=str(e),
                 tools_count=None,
                 last_checked=time.time(),
             )
 
+    async def _get_server_process(self, plugin_info: Dict) -> asyncio.subprocess.Process:
+        """Return the pooled server process for a plugin, spawning it if needed."""
+        plugin_id = plugin_info['id']
+        process = self._procs.get(plugin_id)
+        if process is not None and process.returncode is None:
+            return process
+
+        process = await self._spawn_server(plugin_info)
+        self._procs[plugin_id] = process
+        return process
+
+    async def _spawn_server(self, plugin_info: Dict) -> asyncio.subprocess.Process:
+        """Start an MCP server with stdio pipes.
+
+        stderr is discarded: nothing drains it for a long-lived process, and a
+        full pipe would block the server.
+        """
+        # Check if plugin has explicit command and args (from system configs like Claude Desktop)
+        if 'command' in plugin_info and 'args' in plugin_info:
+            command = plugin_info['command']
+            args = plugin_info['args']
+            env = plugin_info.get('env')
+
+            # Only build a merged environment when the plugin overrides
+            # something; otherwise the child inherits ours as-is
+            full_env = {**self._base_env, **env} if env else None
+
+            # Run the MCP server with its configured command
+            return await asyncio.create_subprocess_exec(
+                command,
+                *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_STDOUT_LIMIT,
+                env=full_env
+            )
+
+        # Fall back to detecting runtime from install_path
+        install_path = Path(plugin_info['install_path'])
+        runtime = plugin_info.get('runtime', 'python')
+
+        if runtime == 'python':
+            # Python MCP server
+            server_file = self._find_server_file(install_path, ['server.py', 'main.py', '__main__.py'])
+            if not server_file:
+                raise FileNotFoundError("No Python server file found")
+
+            return await asyncio.create_subprocess_exec(
+                'python3', str(server_file),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_STDOUT_LIMIT,
+                cwd=str(install_path)
+            )
+
+        if runtime == 'node':
+            # Node.js MCP server
+            package_json = install_path / "package.json"
+            if not package_json.exists():
+                raise FileNotFoundError("No package.json found")
+
+            # Run via npm or node
+            return await asyncio.create_subprocess_exec(
+                'npm', 'start',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_STDOUT_LIMIT,
+                cwd=str(install_path)
+            )
+
+        raise ValueError(f"Unknown runtime: {runtime}")
+
+    async def _send_list_tools(self, process: asyncio.subprocess.Process) -> bytes:
+        """Write a list_tools request and read the response line.
+
+        Only the first non-empty line is read; the server keeps its stdout
+        open, so waiting for EOF would always run into the timeout.
+
+        Returns:
+            The response line, or b'' if the server closed its stdout
+        """
+        process.stdin.write(_LIST_TOOLS_REQUEST)
+        await process.stdin.drain()
+
+        while True:
+            line = await process.stdout.readline()
+            if not line or line.strip():
+                return line
+
+    async def _discard_process(self, plugin_id: str):
+        """Drop a plugin's pooled server process, stopping it if still running."""
+        process = self._procs.pop(plugin_id, None)
+        if process is not None:
+            await self._stop_process(process)
+
+    async def _stop_process(self, process: asyncio.subprocess.Process):
+        """Stop a server process: SIGTERM first, SIGKILL if it ignores that."""
+        if process.returncode is not None:
+            return
+
+        try:
+            process.terminate()
+            try:
+                async with asyncio.timeout(0.5):
+                    await process.wait()
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            # Exited before it could be signalled
+            pass
+
     def _find_server_file(self, base_path: Path, candidates: List[str]) -> Optional[Path]:
-        """Find server entry point file."""
-        for candidate in candidates:
-            server_file = base_path / candidate
-            if server_file.exists():
-                return server_file
-
-        # Check in src/ subdirectory
-        src_path = base_path / "src"
-        if src_path.exists():
-            for candidate in candidates:
-                server_file = src_path / candidate
-                if server_file.exists():
-                    return server_file
+        """Find server entry point file.
+
+        Lists each directory once with os.scandir rather than stat-ing every
+        candidate, and remembers the answer until base_path's mtime changes.
+        """
+        try:
+            mtime_ns = os.stat(base_path).st_mtime_ns
+        except OSError:
+            return None
+
+        key = (str(base_path), tuple(candidates))
+        cached = self._server_file_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        server_file = self._scan_for_candidates(base_path, candidates)
+        if server_file is None:
+            # Check in src/ subdirectory
+            server_file = self._scan_for_candidates(base_path / "src", candidates)
 
+        self._server_file_cache[key] = (mtime_ns, server_file)
+        return server_file
+
+    @staticmethod
+    def _scan_for_candidates(directory: Path, candidates: List[str]) -> Optional[Path]:
+        """Return the first candidate file present in directory."""
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return None
+
+        for candidate in candidates:
+            if candidate in names:
+                return directory / candidate
         return None
 
     async def check_all_plugins_health(self, plugins: List[Dict]) -> List[HealthCheck]:
@@ -257,25 +421,66 @@ class PluginHealthMonitor:
             plugins: List of plugin info dicts from detector
 
         Returns:
-            List of HealthCheck results
+            List of HealthCheck results, in the same order as plugins
         """
-        tasks = [self.check_plugin_health(plugin) for plugin in plugins]
-        return await asyncio.gather(*tasks, return_exceptions=False)
+        results: List[Optional[HealthCheck]] = [
+            self.get_cached_health(plugin['id']) for plugin in plugins
+        ]
+
+        # Only probe plugins without a fresh cached result
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        checked = await asyncio.gather(
+            *(self.check_plugin_health(plugins[i]) for i in misses),
+            return_exceptions=False,
+        )
+        for i, health in zip(misses, checked):
+            results[i] = health
+
+        return results
 
     def get_cached_health(self, plugin_id: str) -> Optional[HealthCheck]:
         """Get cached health status if available and not stale."""
-        if plugin_id not in self.health_cache:
-            return None
-
-        cached = self.health_cache[plugin_id]
-        if time.time() - cached.last_checked > self.cache_ttl:
+        cached = self.health_cache.get(plugin_id)
+        if cached is None or not cached.is_fresh():
             return None
 
         return cached
 
     def clear_cache(self, plugin_id: Optional[str] = None):
-        """Clear health check cache."""
+        """Clear health check cache and stop the affected server processes."""
         if plugin_id:
             self.health_cache.pop(plugin_id, None)
+            processes = [self._procs.pop(plugin_id, None)]
         else:
             self.health_cache.clear()
+            processes = list(self._procs.values())
+            self._procs.clear()
+
+        # Graceful SIGTERM only; the child watcher reaps them
+        for process in processes:
+            if process is not None and process.returncode is None:
+                try:
+                    process.terminate()
+                except ProcessLookupError:
+                    pass
+
+    async def close(self):
+        """Stop all pooled server processes."""
+        processes = list(self._procs.values())
+        self._procs.clear()
+        await asyncio.gather(
+            *(self._stop_process(process) for process in processes),
+            return_exceptions=True,
+        )
+
+
+# Singleton instance
+_health_monitor: Optional[PluginHealthMonitor] = None
+
+
+def get_health_monitor() -> PluginHealthMonitor:
+    """Get or create health monitor singleton."""
+    global _health_monitor
+    if _health_monitor is None:
+        _health_monitor = PluginHealthMonitor()
+    return _health_monitor
@@ -1,7 +1,10 @@
 """Plugin installation utilities."""
 
 import asyncio
+import functools
 import json
+import os
+import re
 import shutil
 import subprocess
 from pathlib import Path
@@ -9,6 +12,129 @@ from typing import Optional, Tuple
 
 from .models import PluginManifest
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Top-level keys read from each manifest type
+_MCP_MANIFEST_KEYS = frozenset(
+    {"name", "version", "author", "description", "tools", "entry_point", "dependencies"}
+)
+_PACKAGE_JSON_KEYS = frozenset({"name", "version", "author", "description", "main"})
+
+# Last path segment of https://host/org/repo(.git) or git@host:org/repo(.git)
+_REPO_RE = re.compile(r"[:/]([^:/]+?)(?:\.git)?/?$")
+
+
+def _load_manifest_keys(
+    path: Path, keys: frozenset, key_lists: frozenset = frozenset()
+) -> dict:
+    """
+    Load selected top-level keys from a JSON manifest.
+
+    With ijson available the file is streamed and only the requested values
+    are built; everything else (scripts, devDependencies, ...) is skipped.
+
+    Args:
+        path: Manifest file path
+        keys: Top-level keys whose values should be returned
+        key_lists: Top-level object keys for which only the key names are
+            returned, as a list (e.g. package.json "dependencies")
+
+    Returns:
+        Dict containing whichever of the requested keys were present
+    """
+    if not IJSON_AVAILABLE:
+        with open(path) as f:
+            data = json.load(f)
+        result = {k: v for k, v in data.items() if k in keys}
+        for k in key_lists:
+            if isinstance(data.get(k), dict):
+                result[k] = list(data[k].keys())
+        return result
+
+    wanted = keys | key_lists
+    result = {}
+    current = None  # top-level key whose container value is being read
+    builder = None
+
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if current is not None:
+                if prefix == current and event in ("end_map", "end_array"):
+                    if builder is not None:
+                        builder.event(event, value)
+                        result[current] = builder.value
+                    current = builder = None
+                elif builder is not None:
+                    builder.event(event, value)
+                elif prefix == current and event == "map_key":
+                    result[current].append(value)
+            elif prefix in wanted and event != "map_key":
+                if event in ("start_map", "start_array"):
+                    current = prefix
+                    if prefix in key_lists:
+                        result[prefix] = []
+                    else:
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                elif prefix in keys:
+                    result[prefix] = value
+
+            if current is None and len(result) == len(wanted):
+                break
+
+    return result
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_manifest_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Optional[PluginManifest]:
+    """
+    Parse a manifest file into a PluginManifest.
+
+    mtime_ns and size are only part of the cache key, so an edited or
+    re-cloned manifest is parsed again while an unchanged one is not.
+
+    Args:
+        path_str: Path to mcp_server.json or package.json
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        PluginManifest or None if the file could not be parsed
+    """
+    path = Path(path_str)
+    try:
+        if path.name == "mcp_server.json":
+            data = _load_manifest_keys(path, _MCP_MANIFEST_KEYS)
+            return PluginManifest(
+                name=data.get("name", path.parent.name),
+                version=data.get("version"),
+                author=data.get("author"),
+                description=data.get("description"),
+                tools=data.get("tools", []),
+                entry_point=data.get("entry_point"),
+                dependencies=data.get("dependencies", {}),
+            )
+
+        data = _load_manifest_keys(
+            path, _PACKAGE_JSON_KEYS, key_lists=frozenset({"dependencies"})
+        )
+        return PluginManifest(
+            name=data.get("name", path.parent.name),
+            version=data.get("version"),
+            author=data.get("author"),
+            description=data.get("description"),
+            entry_point=data.get("main"),
+            dependencies={"npm": data.get("dependencies", [])},
+        )
+    except Exception:
+        return None
+
 
 class PluginInstaller:
     """Handles plugin installation from git repositories."""
@@ -21,7 +147,13 @@ class PluginInstaller:
             plugins_dir: Directory where plugins are installed
         """
         self.plugins_dir = plugins_dir
-        self.plugins_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_ready = False
+
+    async def _ensure_plugins_dir(self):
+        """Create the plugins directory on first use, off the event loop."""
+        if not self._dir_ready:
+            await asyncio.to_thread(self.plugins_dir.mkdir, parents=True, exist_ok=True)
+            self._dir_ready = True
 
     async def install_from_git(
         self, git_url: str, plugin_name: Optional[str] = None
@@ -40,6 +172,7 @@ class PluginInstaller:
         if not plugin_name:
             plugin_name = self._extract_repo_name(git_url)
 
+        await self._ensure_plugins_dir()
         install_path = self.plugins_dir / plugin_name
 
         # Check if already installed
@@ -48,9 +181,7 @@ class PluginInstaller:
 
         try:
             # Clone repository
-            result = await self._run_command(
-                ["git", "clone", git_url, str(install_path)]
-            )
+            result = await self._clone(git_url, install_path)
             if result.returncode != 0:
                 return (
                     False,
@@ -58,8 +189,11 @@ class PluginInstaller:
                     None,
                 )
 
+            # One directory scan answers every "does X exist" question below
+            entries = self._scan_entries(install_path)
+
             # Read manifest
-            manifest = await self._read_manifest(install_path)
+            manifest = await self._read_manifest(install_path, entries)
             if not manifest:
                 return (
                     False,
@@ -68,10 +202,12 @@ class PluginInstaller:
                 )
 
             # Install dependencies
-            dep_result = await self._install_dependencies(install_path, manifest)
+            dep_result = await self._install_dependencies(
+                install_path, manifest, entries
+            )
             if not dep_result[0]:
                 # Cleanup on failure
-                shutil.rmtree(install_path, ignore_errors=True)
+                await asyncio.to_thread(shutil.rmtree, install_path, ignore_errors=True)
                 return False, f"Dependency installation failed: {dep_result[1]}", None
 
             return True, f"Successfully installed {manifest.name}", install_path
@@ -79,7 +215,7 @@ class PluginInstaller:
         except Exception as e:
             # Cleanup on any error
             if install_path.exists():
-                shutil.rmtree(install_path, ignore_errors=True)
+                await asyncio.to_thread(shutil.rmtree, install_path, ignore_errors=True)
             return False, f"Installation error: {str(e)}", None
 
     async def uninstall(self, install_path: Path) -> Tuple[bool, str]:
@@ -96,61 +232,70 @@ class PluginInstaller:
             if not install_path.exists():
                 return False, "Plugin directory not found"
 
-            shutil.rmtree(install_path)
+            # Removing a node_modules tree can take seconds; keep the loop free
+            await asyncio.to_thread(shutil.rmtree, install_path)
+            _parse_manifest_cached.cache_clear()
             return True, f"Successfully uninstalled plugin from {install_path}"
 
         except Exception as e:
             return False, f"Uninstall error: {str(e)}"
 
-    async def _read_manifest(self, plugin_path: Path) -> Optional[PluginManifest]:
+    @staticmethod
+    def _scan_entries(plugin_path: Path) -> dict[str, os.DirEntry]:
+        """
+        List a plugin directory in a single scandir pass.
+
+        Args:
+            plugin_path: Path to plugin directory
+
+        Returns:
+            Mapping of file name to directory entry (empty if unreadable)
+        """
+        try:
+            with os.scandir(plugin_path) as it:
+                return {entry.name: entry for entry in it}
+        except OSError:
+            return {}
+
+    async def _read_manifest(
+        self, plugin_path: Path, entries: Optional[dict[str, os.DirEntry]] = None
+    ) -> Optional[PluginManifest]:
         """
         Read plugin manifest from mcp_server.json or package.json.
 
         Args:
             plugin_path: Path to plugin directory
+            entries: Directory listing from _scan_entries, scanned if omitted
 
         Returns:
             PluginManifest or None if not found
         """
-        # Try mcp_server.json first
-        mcp_manifest_path = plugin_path / "mcp_server.json"
-        if mcp_manifest_path.exists():
+        if entries is None:
+            entries = self._scan_entries(plugin_path)
+
+        # Try mcp_server.json first, then fall back to package.json
+        for filename in ("mcp_server.json", "package.json"):
+            entry = entries.get(filename)
+            if entry is None:
+                continue
             try:
-                with open(mcp_manifest_path) as f:
-                    data = json.load(f)
-                return PluginManifest(
-                    name=data.get("name", plugin_path.name),
-                    version=data.get("version"),
-                    author=data.get("author"),
-                    description=data.get("description"),
-                    tools=data.get("tools", []),
-                    entry_point=data.get("entry_point"),
-                    dependencies=data.get("dependencies", {}),
-                )
-            except Exception:
-                pass
+                st = entry.stat()
+            except OSError:
+                continue
 
-        # Fallback to package.json
-        package_json_path = plugin_path / "package.json"
-        if package_json_path.exists():
-            try:
-                with open(package_json_path) as f:
-                    data = json.load(f)
-                return PluginManifest(
-                    name=data.get("name", plugin_path.name),
-                    version=data.get("version"),
-                    author=data.get("author"),
-                    description=data.get("description"),
-                    entry_point=data.get("main"),
-                    dependencies={"npm": list(data.get("dependencies", {}).keys())},
-                )
-            except Exception:
-                pass
+            manifest = _parse_manifest_cached(
+                entry.path, st.st_mtime_ns, st.st_size
+            )
+            if manifest:
+                return manifest
 
         return None
 
     async def _install_dependencies(
-        self, plugin_path: Path, manifest: PluginManifest
+        self,
+        plugin_path: Path,
+        manifest: PluginManifest,
+        entries: Optional[dict[str, os.DirEntry]] = None,
     ) -> Tuple[bool, str]:
         """
         Install plugin dependencies.
@@ -158,46 +303,87 @@ class PluginInstaller:
         Args:
             plugin_path: Path to plugin directory
             manifest: Plugin manifest with dependency info
+            entries: Directory listing from _scan_entries, scanned if omitted
 
         Returns:
             Tuple of (success, message)
         """
-        messages = []
+        if entries is None:
+            entries = self._scan_entries(plugin_path)
+
+        # (command, failure label, success message) for each install step
+        steps = []
 
         # Install npm dependencies
-        if "npm" in manifest.dependencies or (plugin_path / "package.json").exists():
-            result = await self._run_command(
-                ["npm", "install"], cwd=plugin_path
-            )
+        if "npm" in manifest.dependencies or "package.json" in entries:
+            steps.append((["npm", "install"], "npm install", "npm dependencies installed"))
+
+        # pip dependencies and requirements.txt go through a single pip run;
+        # two concurrent pip processes would race on the same site-packages
+        pip_args = list(manifest.dependencies.get("pip") or [])
+        pip_messages = ["pip dependencies installed"] if pip_args else []
+        if "requirements.txt" in entries:
+            pip_args += ["-r", "requirements.txt"]
+            pip_messages.append("pip requirements installed")
+        if pip_args:
+            steps.append((["pip", "install"] + pip_args, "pip install", "; ".join(pip_messages)))
+
+        if not steps:
+            return True, "No dependencies to install"
+
+        # npm and pip are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(self._run_command(cmd, cwd=plugin_path) for cmd, _, _ in steps),
+            return_exceptions=True,
+        )
+
+        messages = []
+        for (_, label, success_message), result in zip(steps, results):
+            if isinstance(result, Exception):
+                return False, f"{label} failed: {result}"
             if result.returncode != 0:
-                return False, f"npm install failed: {result.stderr}"
-            messages.append("npm dependencies installed")
-
-        # Install pip dependencies
-        if "pip" in manifest.dependencies:
-            pip_deps = manifest.dependencies["pip"]
-            if pip_deps:
-                result = await self._run_command(
-                    ["pip", "install"] + pip_deps, cwd=plugin_path
-                )
-                if result.returncode != 0:
-                    return False, f"pip install failed: {result.stderr}"
-                messages.append("pip dependencies installed")
+                return False, f"{label} failed: {result.stderr}"
+            messages.append(success_message)
+
+        return True, "; ".join(messages)
+
+    async def _clone(self, git_url: str, install_path: Path) -> subprocess.CompletedProcess:
+        """
+        Shallow-clone a plugin repository.
 
-        # Check for requirements.txt
-        requirements_path = plugin_path / "requirements.txt"
-        if requirements_path.exists():
+        Only the tip of the default branch is needed, so history is skipped
+        and blobs are fetched as part of checkout. Retries without the
+        partial-clone filter for servers that reject it.
+
+        Args:
+            git_url: Git repository URL
+            install_path: Destination directory
+
+        Returns:
+            CompletedProcess result of the last clone attempt
+        """
+        # Fail fast on auth prompts instead of hanging on a missing tty
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        shallow = ["git", "clone", "--depth=1", "--single-branch"]
+
+        result = await self._run_command(
+            shallow + ["--filter=blob:none", git_url, str(install_path)], env=env
+        )
+        if result.returncode != 0 and (
+            "filter" in result.stderr or "does not support" in result.stderr
+        ):
+            if install_path.exists():
+                await asyncio.to_thread(shutil.rmtree, install_path, ignore_errors=True)
             result = await self._run_command(
-                ["pip", "install", "-r", "requirements.txt"], cwd=plugin_path
+                shallow + [git_url, str(install_path)], env=env
             )
-            if result.returncode != 0:
-                return False, f"pip install from requirements.txt failed: {result.stderr}"
-            messages.append("pip requirements installed")
-
-        return True, "; ".join(messages) if messages else "No dependencies to install"
+        return result
 
     async def _run_command(
-        self, cmd: list[str], cwd: Optional[Path] = None
+        self,
+        cmd: list[str],
+        cwd: Optional[Path] = None,
+        env: Optional[dict[str, str]] = None,
     ) -> subprocess.CompletedProcess:
         """
         Run a command asynchronously.
@@ -205,6 +391,7 @@ class PluginInstaller:
         Args:
             cmd: Command and arguments
             cwd: Working directory
+            env: Environment for the command (inherits ours if None)
 
         Returns:
             CompletedProcess result
@@ -212,6 +399,7 @@ class PluginInstaller:
         process = await asyncio.create_subprocess_exec(
             *cmd,
             cwd=str(cwd) if cwd else None,
+            env=env,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -233,8 +421,5 @@ class PluginInstaller:
         Returns:
             Repository name
         """
-        # Handle both https and git@ URLs
-        name = git_url.rstrip("/").split("/")[-1]
-        if name.endswith(".git"):
-            name = name[:-4]
-        return name
+        match = _REPO_RE.search(git_url)
+        return match.group(1) if match else git_url
@@ -1,5 +1,6 @@
 """Plugin manager for MCP servers."""
 
+import threading
 from pathlib import Path
 from typing import Optional, List
 from datetime import datetime
@@ -18,8 +19,8 @@ class PluginManager:
         """Initialize plugin manager."""
         config = get_config()
         self.plugins_dir = Path("~/.dev-orchestrator/plugins").expanduser()
-        self.plugins_dir.mkdir(parents=True, exist_ok=True)
 
+        # The installer creates plugins_dir on first install
         self.installer = PluginInstaller(self.plugins_dir)
         self.session_maker = get_session_maker()
 
@@ -34,8 +35,10 @@ class PluginManager:
             repo = PluginRepository(session)
             plugins = await repo.get_all_with_tools()
 
+            # Rows come straight from the typed ORM columns, so skip
+            # pydantic validation
             return [
-                PluginInfo(
+                PluginInfo.model_construct(
                     id=p.id,
                     name=p.name,
                     git_url=p.git_url,
@@ -46,7 +49,7 @@ class PluginManager:
                     enabled=p.enabled,
                     install_path=p.install_path,
                     tools=[
-                        PluginToolInfo(
+                        PluginToolInfo.model_construct(
                             id=t.id,
                             plugin_id=t.plugin_id,
                             tool_name=t.tool_name,
@@ -90,21 +93,9 @@ class PluginManager:
                     error="Missing or invalid manifest file",
                 )
 
-            # Check if plugin already exists in database
+            # Add to database unless a plugin with this name already exists
             async with self.session_maker() as session:
                 repo = PluginRepository(session)
-                existing = await repo.get_by_name(manifest.name)
-
-                if existing:
-                    # Cleanup files
-                    await self.installer.uninstall(install_path)
-                    return InstallResult(
-                        success=False,
-                        message=f"Plugin {manifest.name} is already installed",
-                        error="Duplicate plugin",
-                    )
-
-                # Add to database
                 plugin = await repo.add_plugin(
                     name=manifest.name,
                     git_url=git_url,
@@ -113,8 +104,18 @@ class PluginManager:
                     author=manifest.author,
                     description=manifest.description,
                     tool_names=manifest.tools,
+                    if_absent=True,
                 )
 
+                if plugin is None:
+                    # Cleanup files
+                    await self.installer.uninstall(install_path)
+                    return InstallResult(
+                        success=False,
+                        message=f"Plugin {manifest.name} is already installed",
+                        error="Duplicate plugin",
+                    )
+
                 return InstallResult(
                     success=True,
                     plugin_id=plugin.id,
@@ -216,24 +217,19 @@ class PluginManager:
         """
         async with self.session_maker() as session:
             repo = PluginRepository(session)
-            plugins = await repo.get_enabled_plugins()
-
-            tools = {}
-            for plugin in plugins:
-                for tool in plugin.tools:
-                    if tool.enabled:
-                        tools[tool.tool_name] = plugin.id
-
-            return tools
+            return await repo.get_enabled_tool_mapping()
 
 
 # Singleton instance
 _plugin_manager: Optional[PluginManager] = None
+_manager_lock = threading.Lock()
 
 
 def get_plugin_manager() -> PluginManager:
     """Get or create plugin manager singleton."""
     global _plugin_manager
     if _plugin_manager is None:
-        _plugin_manager = PluginManager()
+        with _manager_lock:
+            if _plugin_manager is None:
+                _plugin_manager = PluginManager()
     return _plugin_manager
@@ -2,12 +2,15 @@
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PluginManifest(BaseModel):
     """Plugin manifest from mcp_server.json or package.json."""
 
+    # Parsed manifests are cached and shared between callers
+    model_config = ConfigDict(frozen=True)
+
     name: str
     version: Optional[str] = None
     author: Optional[str] = None
@@ -48,3 +51,10 @@ class InstallResult(BaseModel):
     plugin_id: Optional[str] = None
     message: str
     error: Optional[str] = None
+
+
+class PluginListResponse(BaseModel):
+    """Response body for listing installed plugins."""
+
+    total_plugins: int
+    plugins: List[PluginInfo] = Field(default_factory=list)
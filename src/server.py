@@ -5,9 +5,11 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 
+import psutil
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -19,37 +21,142 @@ from mcp.types import (
 from .config import get_config, ProjectProfile
 from .detector import ProjectDetector
 from .executor import ShellExecutor, PendingApproval, CommandStatus
-from .notifications import get_notifier
-from .state import get_state_manager, ServiceInfo
+from .notifications import NotificationHandler, get_notifier
+from .state import StateManager, get_state_manager, ServiceInfo
 from .workspace_manager import WorkspaceManager
-from .plugins import get_plugin_manager
+from .plugins import PluginListResponse, PluginManager, get_plugin_manager
 from .plugins.detector import PluginDetector
-from .plugins.health_monitor import PluginHealthMonitor
+from .plugins.health_monitor import get_health_monitor
 from .templates.plugin_creator import PluginCreator
 from .templates.extension_creator import ExtensionCreator
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+@dataclass
+class OrchestratorContext:
+    """Server state shared by the tool handlers."""
+    state_manager: StateManager
+    notifier: NotificationHandler
+    plugin_creator: PluginCreator
+    extension_creator: ExtensionCreator
+    executor: Optional[ShellExecutor] = None
+    detector: Optional[ProjectDetector] = None
+    # Profile of detector; replaced only by detect_project/switch_project
+    profile: Optional[ProjectProfile] = None
+    workspace_manager: Optional[WorkspaceManager] = None
+    # Working directory, tracked here so handlers don't call os.getcwd();
+    # only switch_project changes it
+    cwd: str = field(default_factory=os.getcwd)
+    # Pending approvals: id -> {"evt": asyncio.Event, "approved": bool}
+    approvals: dict[str, dict] = field(default_factory=dict)
+    _plugin_manager: Optional[PluginManager] = field(default=None, repr=False)
+
+    @property
+    def plugin_manager(self) -> PluginManager:
+        """Plugin manager, resolved on the first plugin tool call."""
+        if self._plugin_manager is None:
+            self._plugin_manager = get_plugin_manager()
+        return self._plugin_manager
+
 
 # Initialize components
 server = Server("dev-orchestrator")
-state_manager = get_state_manager()
-notifier = get_notifier()
-executor: Optional[ShellExecutor] = None
-current_detector: Optional[ProjectDetector] = None
-workspace_manager: Optional[WorkspaceManager] = None
-plugin_creator = PluginCreator()
-extension_creator = ExtensionCreator()
+ctx = OrchestratorContext(
+    state_manager=get_state_manager(),
+    notifier=get_notifier(),
+    plugin_creator=PluginCreator(),
+    extension_creator=ExtensionCreator(),
+)
 
-# Pending approval futures
-approval_futures: dict[str, asyncio.Future] = {}
+
+def _dumps(obj) -> str:
+    """Serialize a tool result as indented JSON.
+
+    Uses orjson when installed. datetimes are written as ISO 8601 either
+    way; other values json can't encode natively (Path, ...) fall back to
+    str().
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+    return json.dumps(
+        obj, indent=2,
+        default=lambda o: o.isoformat() if isinstance(o, datetime) else str(o)
+    )
+
+
+def _cap(text: Optional[str], limit: int) -> str:
+    """Truncate command output to limit characters; None becomes ""."""
+    if not text:
+        return ""
+    return text if len(text) <= limit else text[:limit]
+
+
+# Constant tool responses, shared instead of rebuilt on every call
+_RESP_NO_PROJECT_RUN_DETECT = [TextContent(type="text", text='{"error": "No project detected. Run detect_project first."}')]
+_RESP_ALL_STOPPED = [TextContent(type="text", text='{"status": "all services stopped"}')]
+_RESP_APPROVED = [TextContent(type="text", text='{"approved": true}')]
+_RESP_REJECTED = [TextContent(type="text", text='{"rejected": true}')]
+_RESP_APPROVAL_NOT_FOUND = [TextContent(type="text", text='{"error": "Approval not found"}')]
+_RESP_NO_PROJECT = [TextContent(type="text", text='{"error": "No project detected"}')]
+_RESP_NO_TEST_FRAMEWORK = [TextContent(type="text", text='{"error": "No test framework detected"}')]
+_RESP_NO_VENV = [TextContent(type="text", text='{"error": "No virtual environment found"}')]
+
+# toggle_plugin / toggle_plugin_tool replies, keyed by (kind, enabled)
+_TOGGLE_RESP: dict[tuple[str, bool], list[TextContent]] = {
+    (kind, enabled): [TextContent(type="text", text=_dumps({
+        "success": True,
+        "message": f"{label} {'enabled' if enabled else 'disabled'} successfully"
+    }))]
+    for kind, label in (("plugin", "Plugin"), ("tool", "Tool"))
+    for enabled in (True, False)
+}
+_TOGGLE_NOT_FOUND: dict[str, list[TextContent]] = {
+    kind: [TextContent(type="text", text=_dumps({
+        "success": False,
+        "error": f"{label} not found"
+    }))]
+    for kind, label in (("plugin", "Plugin"), ("tool", "Tool"))
+}
+
+def resolve_approval(approval_id: str, approved: bool) -> bool:
+    """
+    Record a decision for a pending approval and wake its waiter.
+
+    Args:
+        approval_id: ID of the pending approval
+        approved: Whether the command was approved
+
+    Returns:
+        True if the approval was pending, False otherwise
+    """
+    entry = ctx.approvals.get(approval_id)
+    if entry is None or entry["evt"].is_set():
+        return False
+    entry["approved"] = approved
+    entry["evt"].set()
+    return True
 
 
 async def approval_handler(pending: PendingApproval) -> bool:
     """Handle approval requests by waiting for user response."""
     # Notify user
-    await notifier.notify_approval_required(pending.command, pending.reason)
+    await ctx.notifier.notify_approval_required(pending.command, pending.reason)
     
     # Broadcast to dashboard
-    await state_manager.add_pending_approval({
+    await ctx.state_manager.add_pending_approval({
         "id": pending.id,
         "command": pending.command,
         "cwd": pending.cwd,
@@ -57,1007 +164,1187 @@ async def approval_handler(pending: PendingApproval) -> bool:
         "requested_at": pending.requested_at.isoformat()
     })
     
-    # Create a future to wait for approval
-    future = asyncio.get_event_loop().create_future()
-    approval_futures[pending.id] = future
+    # Wait on an event; resolve_approval() fills in the decision
+    entry = {"evt": asyncio.Event(), "approved": False}
+    ctx.approvals[pending.id] = entry
     
     try:
         # Wait for approval (with timeout)
-        result = await asyncio.wait_for(future, timeout=300)  # 5 minute timeout
-        return result
+        async with asyncio.timeout(300):  # 5 minute timeout
+            await entry["evt"].wait()
+        return entry["approved"]
     except asyncio.TimeoutError:
-        await state_manager.log("WARN", f"Approval timeout for: {pending.command}")
+        await ctx.state_manager.log("WARN", f"Approval timeout for: {pending.command}")
         return False
     finally:
-        approval_futures.pop(pending.id, None)
-        await state_manager.remove_pending_approval(pending.id)
+        ctx.approvals.pop(pending.id, None)
+        await ctx.state_manager.remove_pending_approval(pending.id)
 
 
 def log_handler(level: str, message: str):
     """Handle log messages."""
-    asyncio.create_task(state_manager.log(level, message, "executor"))
+    ctx.state_manager.log_nowait(level, message, "executor")
 
 
 def init_executor():
     """Initialize the shell executor."""
-    global executor
     config = get_config()
-    executor = ShellExecutor(
+    ctx.executor = ShellExecutor(
         guardrails=config.guardrails,
         approval_handler=approval_handler,
         log_handler=log_handler
     )
 
 
-# Define MCP tools
-@server.list_tools()
-async def list_tools():
-    """List available tools."""
-    return [
-        Tool(
-            name="detect_project",
-            description="Detect project type and configuration from the current or specified directory",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Project directory path (defaults to current directory)"
-                    }
+# Define MCP tools. Built once at import; list_tools() returns the same list
+_TOOLS: list[Tool] = [
+    Tool(
+        name="detect_project",
+        description="Detect project type and configuration from the current or specified directory",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Project directory path (defaults to current directory)"
                 }
             }
-        ),
-        Tool(
-            name="run_command",
-            description="Execute a shell command with guardrails. Commands matching dangerous patterns require approval.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "command": {
-                        "type": "string",
-                        "description": "The command to execute"
-                    },
-                    "cwd": {
-                        "type": "string",
-                        "description": "Working directory (defaults to current project)"
-                    },
-                    "timeout": {
-                        "type": "integer",
-                        "description": "Timeout in seconds (default 300)"
-                    },
-                    "background": {
-                        "type": "boolean",
-                        "description": "Run in background (for long-running services)"
-                    }
+        }
+    ),
+    Tool(
+        name="run_command",
+        description="Execute a shell command with guardrails. Commands matching dangerous patterns require approval.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "command": {
+                    "type": "string",
+                    "description": "The command to execute"
                 },
-                "required": ["command"]
-            }
-        ),
-        Tool(
-            name="start_service",
-            description="Start a dev service (backend, frontend, etc.) based on project detection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service": {
-                        "type": "string",
-                        "enum": ["backend", "frontend", "test", "all"],
-                        "description": "Which service to start"
-                    },
-                    "port": {
-                        "type": "integer",
-                        "description": "Override default port"
-                    }
+                "cwd": {
+                    "type": "string",
+                    "description": "Working directory (defaults to current project)"
                 },
-                "required": ["service"]
-            }
-        ),
-        Tool(
-            name="stop_service",
-            description="Stop a running service by ID or name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "service_id": {
-                        "type": "string",
-                        "description": "Service ID or 'all' to stop all"
-                    }
+                "timeout": {
+                    "type": "integer",
+                    "description": "Timeout in seconds (default 300)"
                 },
-                "required": ["service_id"]
-            }
-        ),
-        Tool(
-            name="list_services",
-            description="List all running services",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="get_status",
-            description="Get current orchestrator status including project, services, and pending approvals",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="approve_command",
-            description="Approve a pending command execution",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "approval_id": {
-                        "type": "string",
-                        "description": "The approval request ID"
-                    }
+                "background": {
+                    "type": "boolean",
+                    "description": "Run in background (for long-running services)"
+                }
+            },
+            "required": ["command"]
+        }
+    ),
+    Tool(
+        name="start_service",
+        description="Start a dev service (backend, frontend, etc.) based on project detection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service": {
+                    "type": "string",
+                    "enum": ["backend", "frontend", "test", "all"],
+                    "description": "Which service to start"
                 },
-                "required": ["approval_id"]
-            }
-        ),
-        Tool(
-            name="reject_command",
-            description="Reject a pending command execution",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "approval_id": {
-                        "type": "string",
-                        "description": "The approval request ID"
-                    }
+                "port": {
+                    "type": "integer",
+                    "description": "Override default port"
+                }
+            },
+            "required": ["service"]
+        }
+    ),
+    Tool(
+        name="stop_service",
+        description="Stop a running service by ID or name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "service_id": {
+                    "type": "string",
+                    "description": "Service ID or 'all' to stop all"
+                }
+            },
+            "required": ["service_id"]
+        }
+    ),
+    Tool(
+        name="list_services",
+        description="List all running services",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="get_status",
+        description="Get current orchestrator status including project, services, and pending approvals",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="approve_command",
+        description="Approve a pending command execution",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "approval_id": {
+                    "type": "string",
+                    "description": "The approval request ID"
+                }
+            },
+            "required": ["approval_id"]
+        }
+    ),
+    Tool(
+        name="reject_command",
+        description="Reject a pending command execution",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "approval_id": {
+                    "type": "string",
+                    "description": "The approval request ID"
+                }
+            },
+            "required": ["approval_id"]
+        }
+    ),
+    Tool(
+        name="run_tests",
+        description="Run project tests based on detected test framework",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "filter": {
+                    "type": "string",
+                    "description": "Test filter pattern"
                 },
-                "required": ["approval_id"]
-            }
-        ),
-        Tool(
-            name="run_tests",
-            description="Run project tests based on detected test framework",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filter": {
-                        "type": "string",
-                        "description": "Test filter pattern"
-                    },
-                    "verbose": {
-                        "type": "boolean",
-                        "description": "Verbose output"
-                    }
+                "verbose": {
+                    "type": "boolean",
+                    "description": "Verbose output"
                 }
             }
-        ),
-        Tool(
-            name="git_status",
-            description="Get git status for current project",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="check_ports",
-            description="Check which ports are in use",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "ports": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                        "description": "Specific ports to check (defaults to common dev ports)"
-                    }
+        }
+    ),
+    Tool(
+        name="git_status",
+        description="Get git status for current project",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="check_ports",
+        description="Check which ports are in use",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "ports": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Specific ports to check (defaults to common dev ports)"
                 }
             }
-        ),
-        Tool(
-            name="activate_venv",
-            description="Get the activation command for the project's virtual environment",
-            inputSchema={
-                "type": "object",
-                "properties": {}
+        }
+    ),
+    Tool(
+        name="activate_venv",
+        description="Get the activation command for the project's virtual environment",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="list_workspace_repos",
+        description="Discover all git repositories in the workspace with their current status",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_root": {
+                    "type": "string",
+                    "description": "Root directory to search (defaults to parent of current directory)"
+                },
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Maximum directory depth to search (default: 2)"
+                }
             }
-        ),
-        Tool(
-            name="list_workspace_repos",
-            description="Discover all git repositories in the workspace with their current status",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_root": {
-                        "type": "string",
-                        "description": "Root directory to search (defaults to parent of current directory)"
-                    },
-                    "max_depth": {
-                        "type": "integer",
-                        "description": "Maximum directory depth to search (default: 2)"
-                    }
+        }
+    ),
+    Tool(
+        name="switch_project",
+        description="Switch to a different project in the workspace by name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "repo_name": {
+                    "type": "string",
+                    "description": "Name of the repository to switch to"
+                }
+            },
+            "required": ["repo_name"]
+        }
+    ),
+    Tool(
+        name="workspace_status",
+        description="Get summary status of all repositories in workspace (uncommitted changes, ahead/behind)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "workspace_root": {
+                    "type": "string",
+                    "description": "Root directory to check (defaults to current workspace)"
                 }
             }
-        ),
-        Tool(
-            name="switch_project",
-            description="Switch to a different project in the workspace by name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "repo_name": {
-                        "type": "string",
-                        "description": "Name of the repository to switch to"
-                    }
+        }
+    ),
+    Tool(
+        name="list_plugins",
+        description="List all installed MCP server plugins with their status and tools",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="install_plugin",
+        description="Install a new MCP server plugin from a git repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "git_url": {
+                    "type": "string",
+                    "description": "Git repository URL for the plugin"
+                }
+            },
+            "required": ["git_url"]
+        }
+    ),
+    Tool(
+        name="uninstall_plugin",
+        description="Uninstall an MCP server plugin",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "plugin_id": {
+                    "type": "string",
+                    "description": "Plugin ID to uninstall"
+                }
+            },
+            "required": ["plugin_id"]
+        }
+    ),
+    Tool(
+        name="toggle_plugin",
+        description="Enable or disable an MCP server plugin and all its tools",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "plugin_id": {
+                    "type": "string",
+                    "description": "Plugin ID to toggle"
                 },
-                "required": ["repo_name"]
-            }
-        ),
-        Tool(
-            name="workspace_status",
-            description="Get summary status of all repositories in workspace (uncommitted changes, ahead/behind)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_root": {
-                        "type": "string",
-                        "description": "Root directory to check (defaults to current workspace)"
-                    }
+                "enabled": {
+                    "type": "boolean",
+                    "description": "True to enable, False to disable"
                 }
-            }
-        ),
-        Tool(
-            name="list_plugins",
-            description="List all installed MCP server plugins with their status and tools",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="install_plugin",
-            description="Install a new MCP server plugin from a git repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "git_url": {
-                        "type": "string",
-                        "description": "Git repository URL for the plugin"
-                    }
+            },
+            "required": ["plugin_id", "enabled"]
+        }
+    ),
+    Tool(
+        name="toggle_plugin_tool",
+        description="Enable or disable a specific tool from a plugin",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "plugin_id": {
+                    "type": "string",
+                    "description": "Plugin ID"
                 },
-                "required": ["git_url"]
-            }
-        ),
-        Tool(
-            name="uninstall_plugin",
-            description="Uninstall an MCP server plugin",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "plugin_id": {
-                        "type": "string",
-                        "description": "Plugin ID to uninstall"
-                    }
+                "tool_name": {
+                    "type": "string",
+                    "description": "Name of the tool to toggle"
                 },
-                "required": ["plugin_id"]
-            }
-        ),
-        Tool(
-            name="toggle_plugin",
-            description="Enable or disable an MCP server plugin and all its tools",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "plugin_id": {
-                        "type": "string",
-                        "description": "Plugin ID to toggle"
-                    },
-                    "enabled": {
-                        "type": "boolean",
-                        "description": "True to enable, False to disable"
-                    }
+                "enabled": {
+                    "type": "boolean",
+                    "description": "True to enable, False to disable"
+                }
+            },
+            "required": ["plugin_id", "tool_name", "enabled"]
+        }
+    ),
+    Tool(
+        name="create_plugin",
+        description="Create a new MCP plugin from template (basic or advanced)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Plugin name (kebab-case, e.g., my-custom-plugin)"
                 },
-                "required": ["plugin_id", "enabled"]
-            }
-        ),
-        Tool(
-            name="toggle_plugin_tool",
-            description="Enable or disable a specific tool from a plugin",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "plugin_id": {
-                        "type": "string",
-                        "description": "Plugin ID"
-                    },
-                    "tool_name": {
-                        "type": "string",
-                        "description": "Name of the tool to toggle"
-                    },
-                    "enabled": {
-                        "type": "boolean",
-                        "description": "True to enable, False to disable"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Plugin description"
                 },
-                "required": ["plugin_id", "tool_name", "enabled"]
-            }
-        ),
-        Tool(
-            name="create_plugin",
-            description="Create a new MCP plugin from template (basic or advanced)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Plugin name (kebab-case, e.g., my-custom-plugin)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Plugin description"
-                    },
-                    "author": {
-                        "type": "string",
-                        "description": "Author name"
-                    },
-                    "template_type": {
-                        "type": "string",
-                        "enum": ["basic", "advanced"],
-                        "description": "Template type: 'basic' for simple tools, 'advanced' for state management"
-                    },
-                    "runtime": {
-                        "type": "string",
-                        "enum": ["python", "node"],
-                        "description": "Runtime environment (default: python)"
-                    },
-                    "tools": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "description": {"type": "string"}
-                            }
-                        },
-                        "description": "Tool definitions for the plugin"
-                    }
+                "author": {
+                    "type": "string",
+                    "description": "Author name"
                 },
-                "required": ["name", "description", "author", "template_type"]
-            }
-        ),
-        Tool(
-            name="create_widget",
-            description="Create a new dashboard widget from template",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Widget name (kebab-case, e.g., my-widget)"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Widget description"
-                    },
-                    "author": {
-                        "type": "string",
-                        "description": "Author name"
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "Widget category (monitoring, tools, analytics, etc.)"
-                    },
-                    "template_type": {
-                        "type": "string",
-                        "enum": ["basic", "interactive", "realtime"],
-                        "description": "Template type"
-                    },
-                    "permissions": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Permissions (read-state, execute-commands, read-logs)"
-                    },
-                    "grid_size": {
+                "template_type": {
+                    "type": "string",
+                    "enum": ["basic", "advanced"],
+                    "description": "Template type: 'basic' for simple tools, 'advanced' for state management"
+                },
+                "runtime": {
+                    "type": "string",
+                    "enum": ["python", "node"],
+                    "description": "Runtime environment (default: python)"
+                },
+                "tools": {
+                    "type": "array",
+                    "items": {
                         "type": "object",
                         "properties": {
-                            "xs": {"type": "integer"},
-                            "md": {"type": "integer"},
-                            "lg": {"type": "integer"}
-                        },
-                        "description": "Grid size configuration"
-                    }
-                },
-                "required": ["name", "description", "author", "category", "template_type"]
-            }
-        ),
-        Tool(
-            name="create_workflow",
-            description="Create a new workflow from template",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Workflow name"
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Workflow description"
-                    },
-                    "author": {
-                        "type": "string",
-                        "description": "Author name"
+                            "name": {"type": "string"},
+                            "description": {"type": "string"}
+                        }
                     },
-                    "parameters": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": "Workflow parameters"
-                    },
-                    "steps": {
-                        "type": "array",
-                        "items": {"type": "object"},
-                        "description": "Workflow steps"
-                    }
+                    "description": "Tool definitions for the plugin"
+                }
+            },
+            "required": ["name", "description", "author", "template_type"]
+        }
+    ),
+    Tool(
+        name="create_widget",
+        description="Create a new dashboard widget from template",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Widget name (kebab-case, e.g., my-widget)"
                 },
-                "required": ["name", "description", "author"]
-            }
-        ),
-        Tool(
-            name="create_integration",
-            description="Create a new integration from template (Slack, GitHub, Jira, or custom)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": "string",
-                        "description": "Integration name (kebab-case)"
-                    },
-                    "service_type": {
-                        "type": "string",
-                        "enum": ["slack", "github", "jira", "custom"],
-                        "description": "Service type"
+                "description": {
+                    "type": "string",
+                    "description": "Widget description"
+                },
+                "author": {
+                    "type": "string",
+                    "description": "Author name"
+                },
+                "category": {
+                    "type": "string",
+                    "description": "Widget category (monitoring, tools, analytics, etc.)"
+                },
+                "template_type": {
+                    "type": "string",
+                    "enum": ["basic", "interactive", "realtime"],
+                    "description": "Template type"
+                },
+                "permissions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Permissions (read-state, execute-commands, read-logs)"
+                },
+                "grid_size": {
+                    "type": "object",
+                    "properties": {
+                        "xs": {"type": "integer"},
+                        "md": {"type": "integer"},
+                        "lg": {"type": "integer"}
                     },
-                    "config": {
-                        "type": "object",
-                        "description": "Integration configuration"
-                    }
+                    "description": "Grid size configuration"
+                }
+            },
+            "required": ["name", "description", "author", "category", "template_type"]
+        }
+    ),
+    Tool(
+        name="create_workflow",
+        description="Create a new workflow from template",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Workflow name"
                 },
-                "required": ["name", "service_type"]
-            }
-        ),
-        Tool(
-            name="detect_installed_plugins",
-            description="Detect all MCP servers already installed on the system (dev-orchestrator, Claude Desktop, Cursor, etc.). Returns list of detected plugins with their installation locations and metadata.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="check_plugin_health",
-            description="Check health status of a specific MCP server plugin. Verifies the plugin is functioning correctly by sending a list_tools request and measuring response time.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "plugin_id": {
-                        "type": "string",
-                        "description": "Plugin ID to check"
-                    }
+                "description": {
+                    "type": "string",
+                    "description": "Workflow description"
                 },
-                "required": ["plugin_id"]
-            }
-        ),
-        Tool(
-            name="check_all_plugins_health",
-            description="Check health status of all installed MCP server plugins. Returns health status for each plugin including response times and tool counts.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
+                "author": {
+                    "type": "string",
+                    "description": "Author name"
+                },
+                "parameters": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Workflow parameters"
+                },
+                "steps": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Workflow steps"
+                }
+            },
+            "required": ["name", "description", "author"]
+        }
+    ),
+    Tool(
+        name="create_integration",
+        description="Create a new integration from template (Slack, GitHub, Jira, or custom)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Integration name (kebab-case)"
+                },
+                "service_type": {
+                    "type": "string",
+                    "enum": ["slack", "github", "jira", "custom"],
+                    "description": "Service type"
+                },
+                "config": {
+                    "type": "object",
+                    "description": "Integration configuration"
+                }
+            },
+            "required": ["name", "service_type"]
+        }
+    ),
+    Tool(
+        name="detect_installed_plugins",
+        description="Detect all MCP servers already installed on the system (dev-orchestrator, Claude Desktop, Cursor, etc.). Returns list of detected plugins with their installation locations and metadata.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="check_plugin_health",
+        description="Check health status of a specific MCP server plugin. Verifies the plugin is functioning correctly by sending a list_tools request and measuring response time.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "plugin_id": {
+                    "type": "string",
+                    "description": "Plugin ID to check"
+                }
+            },
+            "required": ["plugin_id"]
+        }
+    ),
+    Tool(
+        name="check_all_plugins_health",
+        description="Check health status of all installed MCP server plugins. Returns health status for each plugin including response times and tool counts.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools():
+    """List available tools."""
+    return _TOOLS
+
+
+# Common dev-server ports checked when check_ports gets no list
+_DEFAULT_DEV_PORTS: tuple[int, ...] = (3000, 3333, 5173, 8000, 8080, 8765, 8766)
+
+
+@dataclass(slots=True)
+class RunCommandArgs:
+    """Arguments for run_command."""
+    command: str
+    cwd: Optional[str] = None
+    timeout: int = 300
+    background: bool = False
+
+
+@dataclass(slots=True)
+class RunTestsArgs:
+    """Arguments for run_tests."""
+    filter: str = ""
+    verbose: bool = False
+
+
+@dataclass(slots=True)
+class CheckPortsArgs:
+    """Arguments for check_ports."""
+    ports: Iterable[int] = _DEFAULT_DEV_PORTS
+
+
+@dataclass(slots=True)
+class ListWorkspaceReposArgs:
+    """Arguments for list_workspace_repos."""
+    workspace_root: Optional[str] = None
+    max_depth: int = 2
+
+
+async def _handle_detect_project(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Detect the project at a path and make it current."""
+    path = arguments.get("path", ctx.cwd)
+    ctx.detector = ProjectDetector(path)
+    profile = ctx.profile = ctx.detector.detect()
+    await ctx.state_manager.set_project(profile)
+    await ctx.notifier.notify_project_detected(profile.name, profile.project_type)
+
+    result = {
+        "project": profile.name,
+        "path": str(profile.path),
+        "types": profile.project_type,
+        "venv": str(profile.venv_path) if profile.venv_path else None,
+        "git_branch": profile.git_branch,
+        "git_user": profile.git_user_email,
+        "suggested_commands": ctx.detector.get_start_commands()
+    }
+    return [TextContent(type="text", text=_dumps(result))]
+
+
+async def _handle_run_command(ctx: OrchestratorContext, args: RunCommandArgs) -> list[TextContent]:
+    """Execute a shell command through the guardrailed executor."""
+    command = args.command
+    cwd = args.cwd or ctx.cwd
+    timeout = args.timeout
+    background = args.background
+
+    result = await ctx.executor.execute(command, cwd, timeout, background=background)
+
+    ctx.state_manager.add_command_nowait({
+        "command": command,
+        "cwd": cwd,
+        "status": result.status.value,
+        "exit_code": result.exit_code,
+        "timestamp": datetime.now().isoformat()
+    })
+
+    response = {
+        "status": result.status.value,
+        "exit_code": result.exit_code,
+        "stdout": _cap(result.stdout, 5000),
+        "stderr": _cap(result.stderr, 2000),
+    }
+
+    if result.blocked_reason:
+        response["blocked_reason"] = result.blocked_reason
+    if result.approval_reason:
+        response["approval_reason"] = result.approval_reason
+
+    return [TextContent(type="text", text=_dumps(response))]
+
+
+async def _handle_start_service(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Start one or all detected services for the current project."""
+    if ctx.detector is None:
+        return _RESP_NO_PROJECT_RUN_DETECT
+
+    service = arguments["service"]
+    commands = ctx.detector.get_start_commands()
+
+    if service == "all":
+        # Background launches are independent, so start them together
+        cwd = str(ctx.detector.path)
+        launched = await asyncio.gather(*(
+            ctx.executor.execute(cmd, cwd, background=True) for cmd in commands.values()
+        ))
+        results = [
+            {"service": svc_name, "status": result.status.value, "output": result.stdout}
+            for svc_name, result in zip(commands, launched)
+        ]
+        return [TextContent(type="text", text=_dumps(results))]
+
+    if service not in commands:
+        return [TextContent(type="text", text=f'{{"error": "No {service} command detected for this project"}}')]
+
+    cmd = commands[service]
+    port_override = arguments.get("port")
+    if port_override:
+        cmd = cmd.replace(f"--port {ctx.profile.backend_port}", f"--port {port_override}")
+
+    result = await ctx.executor.execute(cmd, str(ctx.detector.path), background=True)
+
+    if result.status == CommandStatus.COMPLETED:
+        port = port_override or (
+            ctx.profile.backend_port if service == "backend" else ctx.profile.frontend_port
+        )
+        await ctx.notifier.notify_service_started(service, port or 0)
+
+    return [TextContent(type="text", text=_dumps({
+        "service": service,
+        "status": result.status.value,
+        "output": result.stdout
+    }))]
+
+
+async def _handle_stop_service(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Stop one or all background services."""
+    service_id = arguments["service_id"]
+
+    # stop_process waits up to 5s per process, so run it off the event loop
+    process_manager = ctx.executor.process_manager
+
+    if service_id == "all":
+        proc_ids = list(process_manager.processes)
+        await asyncio.gather(*(
+            asyncio.to_thread(process_manager.stop_process, proc_id) for proc_id in proc_ids
+        ))
+        await asyncio.gather(*(
+            ctx.state_manager.remove_service(proc_id) for proc_id in proc_ids
+        ))
+        return _RESP_ALL_STOPPED
+
+    success = await asyncio.to_thread(process_manager.stop_process, service_id)
+    if success:
+        await ctx.state_manager.remove_service(service_id)
+        await ctx.notifier.notify_service_stopped(service_id)
+
+    return [TextContent(type="text", text=json.dumps({"stopped": success}))]
+
+
+async def _handle_list_services(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """List background services."""
+    services = ctx.executor.process_manager.list_processes()
+    return [TextContent(type="text", text=_dumps(services))]
+
+
+async def _handle_get_status(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Return the current orchestrator status."""
+    status = await ctx.state_manager.get_cached_snapshot()
+    return [TextContent(type="text", text=_dumps(status))]
+
+
+async def _handle_approve_command(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Approve a pending command."""
+    approval_id = arguments["approval_id"]
+    if resolve_approval(approval_id, True):
+        ctx.state_manager.log_nowait("INFO", f"Approved: {approval_id}")
+        return _RESP_APPROVED
+    return _RESP_APPROVAL_NOT_FOUND
+
+
+async def _handle_reject_command(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Reject a pending command."""
+    approval_id = arguments["approval_id"]
+    if resolve_approval(approval_id, False):
+        ctx.state_manager.log_nowait("INFO", f"Rejected: {approval_id}")
+        return _RESP_REJECTED
+    return _RESP_APPROVAL_NOT_FOUND
+
+
+async def _handle_run_tests(ctx: OrchestratorContext, args: RunTestsArgs) -> list[TextContent]:
+    """Run the current project's test suite."""
+    if ctx.detector is None:
+        return _RESP_NO_PROJECT
+
+    profile = ctx.profile
+    filter_pattern = args.filter
+    verbose = args.verbose
+
+    if profile.has_pytest:
+        cmd = "pytest"
+        if verbose:
+            cmd += " -v"
+        if filter_pattern:
+            cmd += f" -k '{filter_pattern}'"
+
+        if profile.venv_path:
+            result = await ctx.executor.execute_with_venv(cmd, str(profile.path), str(profile.venv_path))
+        else:
+            result = await ctx.executor.execute(cmd, str(profile.path))
+    elif profile.has_node:
+        pm = profile.package_manager or "npm"
+        cmd = f"{pm} test"
+        result = await ctx.executor.execute(cmd, str(profile.path))
+    else:
+        return _RESP_NO_TEST_FRAMEWORK
+
+    return [TextContent(type="text", text=_dumps({
+        "status": result.status.value,
+        "exit_code": result.exit_code,
+        "stdout": result.stdout,
+        "stderr": result.stderr
+    }))]
+
+
+async def _handle_git_status(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Show git status for the current project."""
+    cwd = str(ctx.detector.path) if ctx.detector else ctx.cwd
+    result = await ctx.executor.execute("git status --porcelain && git log -1 --oneline", cwd)
+
+    return [TextContent(type="text", text=_dumps({
+        "status": result.status.value,
+        "output": result.stdout,
+        "branch": ctx.profile.git_branch if ctx.profile else None
+    }))]
+
+
+def _listening_sockets(ports: Iterable[int]) -> list[str]:
+    """
+    List listening TCP/UDP sockets bound to any of the given ports.
+
+    Args:
+        ports: Port numbers to look for
+
+    Returns:
+        One "ip:port pid=<pid>" entry per listening socket
+    """
+    wanted = set(ports)
+    return [
+        f"{conn.laddr.ip}:{conn.laddr.port} pid={conn.pid}"
+        for conn in psutil.net_connections(kind="inet")
+        if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.laddr.port in wanted
     ]
 
 
+async def _handle_check_ports(ctx: OrchestratorContext, args: CheckPortsArgs) -> list[TextContent]:
+    """Report which of the given ports are listening."""
+    ports = args.ports
+    try:
+        in_use = await asyncio.to_thread(_listening_sockets, ports)
+    except psutil.AccessDenied:
+        # Some platforms (macOS) need root for net_connections; use lsof there
+        ports_pattern = "|".join(map(str, ports))
+        result = await ctx.executor.execute(
+            f"lsof -i -P -n | grep LISTEN | grep -E ':({ports_pattern}) '",
+            ctx.cwd
+        )
+        in_use = result.stdout.strip().split('\n') if result.stdout.strip() else []
+
+    return [TextContent(type="text", text=_dumps({
+        "ports_checked": ports,
+        "in_use": in_use
+    }))]
+
+
+async def _handle_activate_venv(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Return the activation command for the project's virtualenv."""
+    if ctx.detector is None:
+        return _RESP_NO_PROJECT
+
+    profile = ctx.profile
+    if profile.venv_path:
+        activate_cmd = f"source {profile.venv_path}/bin/activate"
+        return [TextContent(type="text", text=_dumps({
+            "venv_path": str(profile.venv_path),
+            "activate_command": activate_cmd
+        }))]
+
+    return _RESP_NO_VENV
+
+
+async def _handle_list_workspace_repos(ctx: OrchestratorContext, args: ListWorkspaceReposArgs) -> list[TextContent]:
+    """Discover git repositories in the workspace."""
+    workspace_root = args.workspace_root
+    max_depth = args.max_depth
+
+    if ctx.workspace_manager is None or (workspace_root and workspace_root != str(ctx.workspace_manager.workspace_root)):
+        ctx.workspace_manager = WorkspaceManager(workspace_root)
+
+    repos = ctx.workspace_manager.discover_repos(max_depth=max_depth)
+
+    ctx.state_manager.log_nowait("INFO", f"Discovered {len(repos)} repositories in workspace")
+
+    return [TextContent(type="text", text=_dumps({
+        "workspace_root": str(ctx.workspace_manager.workspace_root),
+        "repo_count": len(repos),
+        "repos": [repo.to_dict() for repo in repos]
+    }))]
+
+
+async def _handle_switch_project(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Switch to a workspace repository and re-detect it."""
+    repo_name = arguments["repo_name"]
+
+    if ctx.workspace_manager is None:
+        ctx.workspace_manager = WorkspaceManager()
+
+    repo = ctx.workspace_manager.find_repo_by_name(repo_name)
+
+    if repo is None:
+        available = [r.name for r in ctx.workspace_manager.discover_repos()]
+        return [TextContent(type="text", text=_dumps({
+            "error": f"Repository '{repo_name}' not found",
+            "available_repos": available
+        }))]
+
+    # Change to the repo directory
+    os.chdir(repo.path)
+    ctx.cwd = repo.path
+
+    # Re-detect project
+    ctx.detector = ProjectDetector(repo.path)
+    profile = ctx.profile = ctx.detector.detect()
+    await ctx.state_manager.set_project(profile)
+
+    ctx.state_manager.log_nowait("INFO", f"Switched to project: {repo_name}")
+    await ctx.notifier.notify_project_detected(profile.name, profile.project_type)
+
+    return [TextContent(type="text", text=_dumps({
+        "switched_to": repo.name,
+        "path": repo.path,
+        "branch": repo.branch,
+        "project": profile.name,
+        "types": profile.project_type
+    }))]
+
+
+async def _handle_workspace_status(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Summarize the status of all workspace repositories."""
+    workspace_root = arguments.get("workspace_root")
+
+    if ctx.workspace_manager is None or (workspace_root and workspace_root != str(ctx.workspace_manager.workspace_root)):
+        ctx.workspace_manager = WorkspaceManager(workspace_root)
+
+    summary = ctx.workspace_manager.get_workspace_summary()
+
+    ctx.state_manager.log_nowait("INFO",
+        f"Workspace status: {summary['total_repos']} repos, "
+        f"{summary['repos_with_changes']} with changes"
+    )
+
+    return [TextContent(type="text", text=_dumps(summary))]
+
+
+async def _handle_list_plugins(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """List installed plugins."""
+    plugin_manager = ctx.plugin_manager
+    plugins = await plugin_manager.list_installed()
+
+    # Serialize straight from the models; no intermediate dicts
+    result = PluginListResponse.model_construct(
+        total_plugins=len(plugins),
+        plugins=plugins
+    )
+
+    ctx.state_manager.log_nowait("INFO", f"Listed {len(plugins)} installed plugins")
+    return [TextContent(type="text", text=result.model_dump_json(indent=2))]
+
+
+async def _handle_install_plugin(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Install a plugin from a git URL."""
+    plugin_manager = ctx.plugin_manager
+    git_url = arguments["git_url"]
+
+    ctx.state_manager.log_nowait("INFO", f"Installing plugin from {git_url}")
+    result = await plugin_manager.install(git_url)
+
+    if result.success:
+        ctx.state_manager.log_nowait("INFO", f"Successfully installed plugin: {result.message}")
+    else:
+        ctx.state_manager.log_nowait("ERROR", f"Plugin installation failed: {result.message}")
+
+    return [TextContent(type="text", text=result.model_dump_json(indent=2))]
+
+
+async def _handle_uninstall_plugin(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Uninstall a plugin."""
+    plugin_manager = ctx.plugin_manager
+    plugin_id = arguments["plugin_id"]
+
+    ctx.state_manager.log_nowait("INFO", f"Uninstalling plugin {plugin_id}")
+    result = await plugin_manager.uninstall(plugin_id)
+
+    if result.success:
+        ctx.state_manager.log_nowait("INFO", f"Successfully uninstalled plugin: {result.message}")
+    else:
+        ctx.state_manager.log_nowait("ERROR", f"Plugin uninstall failed: {result.message}")
+
+    return [TextContent(type="text", text=result.model_dump_json(indent=2))]
+
+
+async def _handle_toggle_plugin(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Enable or disable a plugin."""
+    plugin_manager = ctx.plugin_manager
+    plugin_id = arguments["plugin_id"]
+    enabled = arguments["enabled"]
+
+    success = await plugin_manager.toggle(plugin_id, enabled)
+    action = "enabled" if enabled else "disabled"
+
+    if success:
+        ctx.state_manager.log_nowait("INFO", f"Plugin {plugin_id} {action}")
+        return _TOGGLE_RESP[("plugin", bool(enabled))]
+    else:
+        return _TOGGLE_NOT_FOUND["plugin"]
+
+
+async def _handle_toggle_plugin_tool(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Enable or disable a single plugin tool."""
+    plugin_manager = ctx.plugin_manager
+    plugin_id = arguments["plugin_id"]
+    tool_name = arguments["tool_name"]
+    enabled = arguments["enabled"]
+
+    success = await plugin_manager.toggle_tool(plugin_id, tool_name, enabled)
+    action = "enabled" if enabled else "disabled"
+
+    if success:
+        ctx.state_manager.log_nowait("INFO", f"Tool {tool_name} {action} for plugin {plugin_id}")
+        return _TOGGLE_RESP[("tool", bool(enabled))]
+    else:
+        return _TOGGLE_NOT_FOUND["tool"]
+
+
+async def _handle_create_plugin(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Scaffold a new MCP plugin."""
+    try:
+        created_files = await asyncio.to_thread(
+            ctx.plugin_creator.create_plugin,
+            name=arguments["name"],
+            description=arguments["description"],
+            author=arguments["author"],
+            template_type=arguments["template_type"],
+            runtime=arguments.get("runtime", "python"),
+            tools=arguments.get("tools", [])
+        )
+
+        ctx.state_manager.log_nowait("INFO", f"Created plugin: {arguments['name']}")
+        return [TextContent(type="text", text=_dumps({
+            "success": True,
+            "message": f"Plugin created successfully",
+            "files": created_files
+        }))]
+    except Exception as e:
+        return [TextContent(type="text", text=_dumps({
+            "success": False,
+            "error": str(e)
+        }))]
+
+
+async def _handle_create_widget(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Scaffold a new dashboard widget."""
+    try:
+        created_files = await asyncio.to_thread(
+            ctx.extension_creator.create_widget,
+            name=arguments["name"],
+            description=arguments["description"],
+            author=arguments["author"],
+            category=arguments["category"],
+            template_type=arguments["template_type"],
+            permissions=arguments.get("permissions"),
+            grid_size=arguments.get("grid_size")
+        )
+
+        ctx.state_manager.log_nowait("INFO", f"Created widget: {arguments['name']}")
+        return [TextContent(type="text", text=_dumps({
+            "success": True,
+            "message": f"Widget created successfully",
+            "files": created_files
+        }))]
+    except Exception as e:
+        return [TextContent(type="text", text=_dumps({
+            "success": False,
+            "error": str(e)
+        }))]
+
+
+async def _handle_create_workflow(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Create a workflow definition."""
+    try:
+        workflow_path = await asyncio.to_thread(
+            ctx.extension_creator.create_workflow,
+            name=arguments["name"],
+            description=arguments["description"],
+            author=arguments["author"],
+            version=arguments.get("version", "1.0.0"),
+            parameters=arguments.get("parameters"),
+            steps=arguments.get("steps")
+        )
+
+        ctx.state_manager.log_nowait("INFO", f"Created workflow: {arguments['name']}")
+        return [TextContent(type="text", text=_dumps({
+            "success": True,
+            "message": f"Workflow created successfully",
+            "path": workflow_path
+        }))]
+    except Exception as e:
+        return [TextContent(type="text", text=_dumps({
+            "success": False,
+            "error": str(e)
+        }))]
+
+
+async def _handle_create_integration(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Scaffold a new service integration."""
+    try:
+        created_files = await asyncio.to_thread(
+            ctx.extension_creator.create_integration,
+            name=arguments["name"],
+            service_type=arguments["service_type"],
+            config=arguments.get("config")
+        )
+
+        ctx.state_manager.log_nowait("INFO", f"Created integration: {arguments['name']}")
+        return [TextContent(type="text", text=_dumps({
+            "success": True,
+            "message": f"Integration created successfully",
+            "files": created_files
+        }))]
+    except Exception as e:
+        return [TextContent(type="text", text=_dumps({
+            "success": False,
+            "error": str(e)
+        }))]
+
+
+async def _handle_detect_installed_plugins(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Detect MCP servers installed on this system."""
+    detector = PluginDetector()
+    plugins = await detector.detect_installed_plugins()
+
+    ctx.state_manager.log_nowait("INFO", f"Detected {len(plugins)} installed MCP servers")
+    return [TextContent(type="text", text=_dumps({
+        "total_detected": len(plugins),
+        "plugins": plugins
+    }))]
+
+
+async def _handle_check_plugin_health(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Check the health of a single plugin."""
+    plugin_id = arguments["plugin_id"]
+
+    # First detect the plugin to get its info
+    detector = PluginDetector()
+    plugins = await detector.detect_installed_plugins()
+
+    plugin_info = next((p for p in plugins if p['id'] == plugin_id), None)
+
+    if not plugin_info:
+        return [TextContent(type="text", text=_dumps({
+            "error": f"Plugin '{plugin_id}' not found"
+        }))]
+
+    # Check health
+    monitor = get_health_monitor()
+    health = await monitor.check_plugin_health(plugin_info)
+
+    ctx.state_manager.log_nowait("INFO", f"Health check for {plugin_id}: {health.status.value}")
+    return [TextContent(type="text", text=_dumps(health.to_dict()))]
+
+
+async def _handle_check_all_plugins_health(ctx: OrchestratorContext, arguments: dict) -> list[TextContent]:
+    """Check the health of all detected plugins."""
+    # Detect all installed plugins
+    detector = PluginDetector()
+    plugins = await detector.detect_installed_plugins()
+
+    # Check health of all plugins
+    monitor = get_health_monitor()
+    health_results = await monitor.check_all_plugins_health(plugins)
+
+    ctx.state_manager.log_nowait("INFO", f"Checked health of {len(health_results)} plugins")
+    return [TextContent(type="text", text=_dumps({
+        "total_checked": len(health_results),
+        "health_results": [h.to_dict() for h in health_results]
+    }))]
+
+
+# Tool name -> handler, built once at import
+_HANDLERS: dict[
+    str, Callable[[OrchestratorContext, Any], Awaitable[list[TextContent]]]
+] = {
+    "detect_project": _handle_detect_project,
+    "run_command": _handle_run_command,
+    "start_service": _handle_start_service,
+    "stop_service": _handle_stop_service,
+    "list_services": _handle_list_services,
+    "get_status": _handle_get_status,
+    "approve_command": _handle_approve_command,
+    "reject_command": _handle_reject_command,
+    "run_tests": _handle_run_tests,
+    "git_status": _handle_git_status,
+    "check_ports": _handle_check_ports,
+    "activate_venv": _handle_activate_venv,
+    "list_workspace_repos": _handle_list_workspace_repos,
+    "switch_project": _handle_switch_project,
+    "workspace_status": _handle_workspace_status,
+    "list_plugins": _handle_list_plugins,
+    "install_plugin": _handle_install_plugin,
+    "uninstall_plugin": _handle_uninstall_plugin,
+    "toggle_plugin": _handle_toggle_plugin,
+    "toggle_plugin_tool": _handle_toggle_plugin_tool,
+    "create_plugin": _handle_create_plugin,
+    "create_widget": _handle_create_widget,
+    "create_workflow": _handle_create_workflow,
+    "create_integration": _handle_create_integration,
+    "detect_installed_plugins": _handle_detect_installed_plugins,
+    "check_plugin_health": _handle_check_plugin_health,
+    "check_all_plugins_health": _handle_check_all_plugins_health,
+}
+
+# Tools whose handlers take a typed argument object instead of the raw dict
+_ARG_TYPES: dict[str, type] = {
+    "run_command": RunCommandArgs,
+    "run_tests": RunTestsArgs,
+    "check_ports": CheckPortsArgs,
+    "list_workspace_repos": ListWorkspaceReposArgs,
+}
+_ARG_FIELDS: dict[type, frozenset[str]] = {
+    arg_type: frozenset(f.name for f in fields(arg_type))
+    for arg_type in _ARG_TYPES.values()
+}
+
+
+def _parse_args(arg_type: type, arguments: dict):
+    """Build a typed argument object, ignoring keys it doesn't declare."""
+    known = _ARG_FIELDS[arg_type]
+    return arg_type(**{k: v for k, v in arguments.items() if k in known})
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls."""
-    global current_detector, executor, workspace_manager
-    
-    if executor is None:
+    if ctx.executor is None:
         init_executor()
     
-    try:
-        if name == "detect_project":
-            path = arguments.get("path", os.getcwd())
-            current_detector = ProjectDetector(path)
-            profile = current_detector.detect()
-            await state_manager.set_project(profile)
-            await notifier.notify_project_detected(profile.name, profile.project_type)
-            
-            result = {
-                "project": profile.name,
-                "path": str(profile.path),
-                "types": profile.project_type,
-                "venv": str(profile.venv_path) if profile.venv_path else None,
-                "git_branch": profile.git_branch,
-                "git_user": profile.git_user_email,
-                "suggested_commands": current_detector.get_start_commands()
-            }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "run_command":
-            command = arguments["command"]
-            cwd = arguments.get("cwd", os.getcwd())
-            timeout = arguments.get("timeout", 300)
-            background = arguments.get("background", False)
-            
-            result = await executor.execute(command, cwd, timeout, background=background)
-            
-            await state_manager.add_command({
-                "command": command,
-                "cwd": cwd,
-                "status": result.status.value,
-                "exit_code": result.exit_code,
-                "timestamp": datetime.now().isoformat()
-            })
-            
-            response = {
-                "status": result.status.value,
-                "exit_code": result.exit_code,
-                "stdout": result.stdout[:5000] if result.stdout else "",
-                "stderr": result.stderr[:2000] if result.stderr else "",
-            }
-            
-            if result.blocked_reason:
-                response["blocked_reason"] = result.blocked_reason
-            if result.approval_reason:
-                response["approval_reason"] = result.approval_reason
-            
-            return [TextContent(type="text", text=json.dumps(response, indent=2))]
-        
-        elif name == "start_service":
-            if current_detector is None:
-                return [TextContent(type="text", text='{"error": "No project detected. Run detect_project first."}')]
-            
-            service = arguments["service"]
-            commands = current_detector.get_start_commands()
-            
-            if service == "all":
-                results = []
-                for svc_name, cmd in commands.items():
-                    result = await executor.execute(cmd, str(current_detector.path), background=True)
-                    results.append({"service": svc_name, "status": result.status.value, "output": result.stdout})
-                return [TextContent(type="text", text=json.dumps(results, indent=2))]
-            
-            if service not in commands:
-                return [TextContent(type="text", text=f'{{"error": "No {service} command detected for this project"}}')]
-            
-            cmd = commands[service]
-            port_override = arguments.get("port")
-            if port_override:
-                cmd = cmd.replace(f"--port {current_detector.detect().backend_port}", f"--port {port_override}")
-            
-            result = await executor.execute(cmd, str(current_detector.path), background=True)
-            
-            if result.status == CommandStatus.COMPLETED:
-                profile = current_detector.detect()
-                port = port_override or (profile.backend_port if service == "backend" else profile.frontend_port)
-                await notifier.notify_service_started(service, port or 0)
-            
-            return [TextContent(type="text", text=json.dumps({
-                "service": service,
-                "status": result.status.value,
-                "output": result.stdout
-            }, indent=2))]
-        
-        elif name == "stop_service":
-            service_id = arguments["service_id"]
-            
-            if service_id == "all":
-                for proc_id in list(executor.process_manager.processes.keys()):
-                    executor.process_manager.stop_process(proc_id)
-                    await state_manager.remove_service(proc_id)
-                return [TextContent(type="text", text='{"status": "all services stopped"}')]
-            
-            success = executor.process_manager.stop_process(service_id)
-            if success:
-                await state_manager.remove_service(service_id)
-                await notifier.notify_service_stopped(service_id)
-            
-            return [TextContent(type="text", text=json.dumps({"stopped": success}))]
-        
-        elif name == "list_services":
-            services = executor.process_manager.list_processes()
-            return [TextContent(type="text", text=json.dumps(services, indent=2))]
-        
-        elif name == "get_status":
-            status = state_manager.state.to_dict()
-            return [TextContent(type="text", text=json.dumps(status, indent=2))]
-        
-        elif name == "approve_command":
-            approval_id = arguments["approval_id"]
-            if approval_id in approval_futures:
-                approval_futures[approval_id].set_result(True)
-                await state_manager.log("INFO", f"Approved: {approval_id}")
-                return [TextContent(type="text", text='{"approved": true}')]
-            return [TextContent(type="text", text='{"error": "Approval not found"}')]
-        
-        elif name == "reject_command":
-            approval_id = arguments["approval_id"]
-            if approval_id in approval_futures:
-                approval_futures[approval_id].set_result(False)
-                await state_manager.log("INFO", f"Rejected: {approval_id}")
-                return [TextContent(type="text", text='{"rejected": true}')]
-            return [TextContent(type="text", text='{"error": "Approval not found"}')]
-        
-        elif name == "run_tests":
-            if current_detector is None:
-                return [TextContent(type="text", text='{"error": "No project detected"}')]
-            
-            profile = current_detector.detect()
-            filter_pattern = arguments.get("filter", "")
-            verbose = arguments.get("verbose", False)
-            
-            if profile.has_pytest:
-                cmd = "pytest"
-                if verbose:
-                    cmd += " -v"
-                if filter_pattern:
-                    cmd += f" -k '{filter_pattern}'"
-                
-                if profile.venv_path:
-                    result = await executor.execute_with_venv(cmd, str(profile.path), str(profile.venv_path))
-                else:
-                    result = await executor.execute(cmd, str(profile.path))
-            elif profile.has_node:
-                pm = profile.package_manager or "npm"
-                cmd = f"{pm} test"
-                result = await executor.execute(cmd, str(profile.path))
-            else:
-                return [TextContent(type="text", text='{"error": "No test framework detected"}')]
-            
-            return [TextContent(type="text", text=json.dumps({
-                "status": result.status.value,
-                "exit_code": result.exit_code,
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }, indent=2))]
-        
-        elif name == "git_status":
-            cwd = str(current_detector.path) if current_detector else os.getcwd()
-            result = await executor.execute("git status --porcelain && git log -1 --oneline", cwd)
-            
-            return [TextContent(type="text", text=json.dumps({
-                "status": result.status.value,
-                "output": result.stdout,
-                "branch": current_detector.detect().git_branch if current_detector else None
-            }, indent=2))]
-        
-        elif name == "check_ports":
-            ports = arguments.get("ports", [3000, 3333, 5173, 8000, 8080, 8765, 8766])
-            ports_pattern = "|".join(map(str, ports))
-            result = await executor.execute(
-                f"lsof -i -P -n | grep LISTEN | grep -E ':{ports_pattern}'",
-                os.getcwd()
-            )
-            
-            return [TextContent(type="text", text=json.dumps({
-                "ports_checked": ports,
-                "in_use": result.stdout.strip().split('\n') if result.stdout.strip() else []
-            }, indent=2))]
-        
-        elif name == "activate_venv":
-            if current_detector is None:
-                return [TextContent(type="text", text='{"error": "No project detected"}')]
-
-            profile = current_detector.detect()
-            if profile.venv_path:
-                activate_cmd = f"source {profile.venv_path}/bin/activate"
-                return [TextContent(type="text", text=json.dumps({
-                    "venv_path": str(profile.venv_path),
-                    "activate_command": activate_cmd
-                }, indent=2))]
-
-            return [TextContent(type="text", text='{"error": "No virtual environment found"}')]
-
-        elif name == "list_workspace_repos":
-            workspace_root = arguments.get("workspace_root")
-            max_depth = arguments.get("max_depth", 2)
-
-            if workspace_manager is None or (workspace_root and workspace_root != str(workspace_manager.workspace_root)):
-                workspace_manager = WorkspaceManager(workspace_root)
-
-            repos = workspace_manager.discover_repos(max_depth=max_depth)
-
-            await state_manager.log("INFO", f"Discovered {len(repos)} repositories in workspace")
-
-            return [TextContent(type="text", text=json.dumps({
-                "workspace_root": str(workspace_manager.workspace_root),
-                "repo_count": len(repos),
-                "repos": [repo.to_dict() for repo in repos]
-            }, indent=2))]
-
-        elif name == "switch_project":
-            repo_name = arguments["repo_name"]
-
-            if workspace_manager is None:
-                workspace_manager = WorkspaceManager()
-
-            repo = workspace_manager.find_repo_by_name(repo_name)
-
-            if repo is None:
-                available = [r.name for r in workspace_manager.discover_repos()]
-                return [TextContent(type="text", text=json.dumps({
-                    "error": f"Repository '{repo_name}' not found",
-                    "available_repos": available
-                }, indent=2))]
-
-            # Change to the repo directory
-            os.chdir(repo.path)
-
-            # Re-detect project
-            current_detector = ProjectDetector(repo.path)
-            profile = current_detector.detect()
-            await state_manager.set_project(profile)
-
-            await state_manager.log("INFO", f"Switched to project: {repo_name}")
-            await notifier.notify_project_detected(profile.name, profile.project_type)
-
-            return [TextContent(type="text", text=json.dumps({
-                "switched_to": repo.name,
-                "path": repo.path,
-                "branch": repo.branch,
-                "project": profile.name,
-                "types": profile.project_type
-            }, indent=2))]
-
-        elif name == "workspace_status":
-            workspace_root = arguments.get("workspace_root")
-
-            if workspace_manager is None or (workspace_root and workspace_root != str(workspace_manager.workspace_root)):
-                workspace_manager = WorkspaceManager(workspace_root)
-
-            summary = workspace_manager.get_workspace_summary()
-
-            await state_manager.log("INFO",
-                f"Workspace status: {summary['total_repos']} repos, "
-                f"{summary['repos_with_changes']} with changes"
-            )
-
-            return [TextContent(type="text", text=json.dumps(summary, indent=2))]
-
-        elif name == "list_plugins":
-            plugin_manager = get_plugin_manager()
-            plugins = await plugin_manager.list_installed()
-
-            result = {
-                "total_plugins": len(plugins),
-                "plugins": [p.model_dump(mode="json") for p in plugins]
-            }
-
-            await state_manager.log("INFO", f"Listed {len(plugins)} installed plugins")
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "install_plugin":
-            plugin_manager = get_plugin_manager()
-            git_url = arguments["git_url"]
-
-            await state_manager.log("INFO", f"Installing plugin from {git_url}")
-            result = await plugin_manager.install(git_url)
-
-            if result.success:
-                await state_manager.log("INFO", f"Successfully installed plugin: {result.message}")
-            else:
-                await state_manager.log("ERROR", f"Plugin installation failed: {result.message}")
-
-            return [TextContent(type="text", text=json.dumps(result.model_dump(mode="json"), indent=2))]
-
-        elif name == "uninstall_plugin":
-            plugin_manager = get_plugin_manager()
-            plugin_id = arguments["plugin_id"]
-
-            await state_manager.log("INFO", f"Uninstalling plugin {plugin_id}")
-            result = await plugin_manager.uninstall(plugin_id)
-
-            if result.success:
-                await state_manager.log("INFO", f"Successfully uninstalled plugin: {result.message}")
-            else:
-                await state_manager.log("ERROR", f"Plugin uninstall failed: {result.message}")
-
-            return [TextContent(type="text", text=json.dumps(result.model_dump(mode="json"), indent=2))]
-
-        elif name == "toggle_plugin":
-            plugin_manager = get_plugin_manager()
-            plugin_id = arguments["plugin_id"]
-            enabled = arguments["enabled"]
-
-            success = await plugin_manager.toggle(plugin_id, enabled)
-            action = "enabled" if enabled else "disabled"
-
-            if success:
-                await state_manager.log("INFO", f"Plugin {plugin_id} {action}")
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "message": f"Plugin {action} successfully"
-                }, indent=2))]
-            else:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": "Plugin not found"
-                }, indent=2))]
-
-        elif name == "toggle_plugin_tool":
-            plugin_manager = get_plugin_manager()
-            plugin_id = arguments["plugin_id"]
-            tool_name = arguments["tool_name"]
-            enabled = arguments["enabled"]
-
-            success = await plugin_manager.toggle_tool(plugin_id, tool_name, enabled)
-            action = "enabled" if enabled else "disabled"
-
-            if success:
-                await state_manager.log("INFO", f"Tool {tool_name} {action} for plugin {plugin_id}")
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "message": f"Tool {action} successfully"
-                }, indent=2))]
-            else:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": "Tool not found"
-                }, indent=2))]
-
-        elif name == "create_plugin":
-            try:
-                created_files = plugin_creator.create_plugin(
-                    name=arguments["name"],
-                    description=arguments["description"],
-                    author=arguments["author"],
-                    template_type=arguments["template_type"],
-                    runtime=arguments.get("runtime", "python"),
-                    tools=arguments.get("tools", [])
-                )
-
-                await state_manager.log("INFO", f"Created plugin: {arguments['name']}")
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "message": f"Plugin created successfully",
-                    "files": created_files
-                }, indent=2))]
-            except Exception as e:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": str(e)
-                }, indent=2))]
-
-        elif name == "create_widget":
-            try:
-                created_files = extension_creator.create_widget(
-                    name=arguments["name"],
-                    description=arguments["description"],
-                    author=arguments["author"],
-                    category=arguments["category"],
-                    template_type=arguments["template_type"],
-                    permissions=arguments.get("permissions"),
-                    grid_size=arguments.get("grid_size")
-                )
-
-                await state_manager.log("INFO", f"Created widget: {arguments['name']}")
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "message": f"Widget created successfully",
-                    "files": created_files
-                }, indent=2))]
-            except Exception as e:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": str(e)
-                }, indent=2))]
-
-        elif name == "create_workflow":
-            try:
-                workflow_path = extension_creator.create_workflow(
-                    name=arguments["name"],
-                    description=arguments["description"],
-                    author=arguments["author"],
-                    version=arguments.get("version", "1.0.0"),
-                    parameters=arguments.get("parameters"),
-                    steps=arguments.get("steps")
-                )
-
-                await state_manager.log("INFO", f"Created workflow: {arguments['name']}")
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "message": f"Workflow created successfully",
-                    "path": workflow_path
-                }, indent=2))]
-            except Exception as e:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": str(e)
-                }, indent=2))]
-
-        elif name == "create_integration":
-            try:
-                created_files = extension_creator.create_integration(
-                    name=arguments["name"],
-                    service_type=arguments["service_type"],
-                    config=arguments.get("config")
-                )
-
-                await state_manager.log("INFO", f"Created integration: {arguments['name']}")
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "message": f"Integration created successfully",
-                    "files": created_files
-                }, indent=2))]
-            except Exception as e:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": str(e)
-                }, indent=2))]
-
-        elif name == "detect_installed_plugins":
-            detector = PluginDetector()
-            plugins = await detector.detect_installed_plugins()
-
-            await state_manager.log("INFO", f"Detected {len(plugins)} installed MCP servers")
-            return [TextContent(type="text", text=json.dumps({
-                "total_detected": len(plugins),
-                "plugins": plugins
-            }, indent=2))]
-
-        elif name == "check_plugin_health":
-            plugin_id = arguments["plugin_id"]
-
-            # First detect the plugin to get its info
-            detector = PluginDetector()
-            plugins = await detector.detect_installed_plugins()
-
-            plugin_info = next((p for p in plugins if p['id'] == plugin_id), None)
-
-            if not plugin_info:
-                return [TextContent(type="text", text=json.dumps({
-                    "error": f"Plugin '{plugin_id}' not found"
-                }, indent=2))]
-
-            # Check health
-            monitor = PluginHealthMonitor()
-            health = await monitor.check_plugin_health(plugin_info)
-
-            await state_manager.log("INFO", f"Health check for {plugin_id}: {health.status.value}")
-            return [TextContent(type="text", text=json.dumps(health.to_dict(), indent=2))]
-
-        elif name == "check_all_plugins_health":
-            # Detect all installed plugins
-            detector = PluginDetector()
-            plugins = await detector.detect_installed_plugins()
-
-            # Check health of all plugins
-            monitor = PluginHealthMonitor()
-            health_results = await monitor.check_all_plugins_health(plugins)
-
-            await state_manager.log("INFO", f"Checked health of {len(health_results)} plugins")
-            return [TextContent(type="text", text=json.dumps({
-                "total_checked": len(health_results),
-                "health_results": [h.to_dict() for h in health_results]
-            }, indent=2))]
-
-        else:
-            return [TextContent(type="text", text=f'{{"error": "Unknown tool: {name}"}}')]
+    # Keys are interned literals; interning the name lets a hit compare by identity
+    handler = _HANDLERS.get(sys.intern(name))
+    if handler is None:
+        return [TextContent(type="text", text=f'{{"error": "Unknown tool: {name}"}}')]
     
+    try:
+        arg_type = _ARG_TYPES.get(name)
+        if arg_type is not None:
+            arguments = _parse_args(arg_type, arguments)
+        return await handler(ctx, arguments)
     except Exception as e:
-        await state_manager.log("ERROR", f"Tool error: {str(e)}")
+        ctx.state_manager.log_nowait("ERROR", f"Tool error: {str(e)}")
         return [TextContent(type="text", text=f'{{"error": "{str(e)}"}}')]
 
 
 async def run_mcp_server():
     """Run the MCP server."""
     init_executor()
-    await state_manager.initialize_db()
+    await ctx.state_manager.initialize_db()
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+    finally:
+        await get_health_monitor().close()
 
 
 def main():
     """Main entry point."""
-    asyncio.run(run_mcp_server())
+    # uvloop isn't available on Windows; fall back to the default loop
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_mcp_server())
 
 
 if __name__ == "__main__":
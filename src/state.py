@@ -2,10 +2,13 @@
 
 import asyncio
 import json
-from dataclasses import dataclass
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field, is_dataclass
 from datetime import datetime
 from typing import Optional, Any
-import websockets
+from websockets.asyncio.server import broadcast as ws_broadcast
+from websockets.protocol import State
 from websockets.server import WebSocketServerProtocol
 
 from .config import get_config, ProjectProfile
@@ -13,10 +16,60 @@ from .database.engine import get_session_maker, init_db
 from .database.repositories import (
     CommandRepository,
     SavedCommandRepository,
-    ProjectRepository,
 )
 
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def encode_message(payload: Any) -> bytes:
+    """Serialize a WebSocket message to UTF-8 JSON.
+
+    datetime values are written as ISO 8601 strings, natively by orjson or
+    through the json fallback's default hook.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_json_default).encode()
+
+
+def decode_message(message: bytes | str) -> Any:
+    """Parse an incoming WebSocket frame.
+
+    Raises:
+        json.JSONDecodeError: If the frame isn't valid JSON (orjson's error
+            subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(message)
+    return json.loads(message)
+
+
+def _encode_parts(snapshot: dict) -> dict[str, bytes]:
+    """Encode each top-level value of a state snapshot separately."""
+    return {key: encode_message(value) for key, value in snapshot.items()}
+
+
+def _join_parts(parts: dict[str, bytes]) -> bytes:
+    """Assemble per-key encoded values into one JSON object."""
+    return b"{" + b",".join(
+        encode_message(key) + b":" + value for key, value in parts.items()
+    ) + b"}"
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dumps hook matching orjson's datetime and dataclass output."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 @dataclass
 class ServiceInfo:
     """Information about a running service."""
@@ -28,10 +81,67 @@ class ServiceInfo:
     pid: int
     started_at: datetime
     status: str = "running"
+    # State-broadcast form, built once; update_service_status() keeps
+    # its "status" key in step with the field
+    _cached_dict: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._cached_dict = {
+            "id": self.id,
+            "name": self.name,
+            "command": self.command,
+            "cwd": self.cwd,
+            "port": self.port,
+            "pid": self.pid,
+            "started_at": self.started_at,
+            "status": self.status,
+        }
+
+    def to_dict(self) -> dict:
+        """Return the service as it appears in the state snapshot."""
+        return self._cached_dict
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """A log line broadcast to clients as the data of a "log" event."""
+    level: str
+    message: str
+    source: str
+    timestamp: datetime
+
+
+def _saved_command_dict(sc) -> dict:
+    """Convert a SavedCommand row (tags loaded) to its broadcast form."""
+    return {
+        "id": sc.id,
+        "name": sc.name,
+        "command": sc.command,
+        "cwd": sc.cwd,
+        "description": sc.description,
+        "created_at": sc.created_at,
+        "tags": [tag.name for tag in sc.tags],
+    }
 
 
 # Removed AppState dataclass - now using database repositories
 
+# Max log entries broadcast per wakeup of the log worker
+_LOG_BATCH_SIZE = 64
+
+# Commands queued within this window are written with one INSERT
+_COMMAND_FLUSH_DELAY = 0.025
+
+# Broadcasts made within this window go out as a single "batch" frame
+_BROADCAST_FLUSH_DELAY = 0.005
+
+# State snapshots with more list rows than this are encoded off the loop
+_OFFLOAD_ENCODE_ROWS = 200
+
+# Mutations remembered for "get_state" with "since"; older revisions get
+# full state
+_STATE_REVISION_HISTORY = 256
+
 
 class StateManager:
     """Manages application state and broadcasts updates."""
@@ -39,19 +149,52 @@ class StateManager:
     def __init__(self):
         # WebSocket clients
         self.clients: set[WebSocketServerProtocol] = set()
-        self._lock = asyncio.Lock()
 
-        # Ephemeral state (not persisted to database)
+        # Ephemeral state (not persisted to database). Mutators update it
+        # without awaiting in between, so no lock is needed on the event loop.
         self.current_project: Optional[ProjectProfile] = None
+        # current_project.model_dump(mode="json"), refreshed by set_project()
+        self._project_dumped: Optional[dict] = None
         self.services: dict[str, ServiceInfo] = {}
-        self.pending_approvals: list[dict] = []
+        self.pending_approvals: dict[str, dict] = {}  # keyed by approval id
         self.workspace: Optional[dict] = None
 
-        # Database session and repositories
+        # Last _get_state_dict() result; None once any state changes
+        self._snapshot: Optional[dict] = None
+        # _snapshot encoded as JSON, shared by every full-state send
+        self._snapshot_json: Optional[bytes] = None
+        # _snapshot's top-level values, each encoded on its own for deltas
+        self._snapshot_parts: Optional[dict[str, bytes]] = None
+        # Bumped on every mutation so in-flight rebuilds can tell they're
+        # stale; doubles as the state revision sent to clients
+        self._state_version = 0
+        # (revision, top-level keys it touched) for recent mutations, so a
+        # reconnecting client can be sent just those keys
+        self._touched: deque[tuple[int, frozenset[str]]] = deque(
+            maxlen=_STATE_REVISION_HISTORY
+        )
+        # Identifies this process's revision numbering; a client holding a
+        # revision from another epoch (e.g. before a restart) gets full state
+        self._epoch = uuid.uuid4().hex
+
+        # Log entries queued by log_nowait(), broadcast by _drain_logs()
+        self._log_queue: asyncio.Queue[LogEntry] = asyncio.Queue()
+        self._log_task: Optional[asyncio.Task] = None
+
+        # (queued_at, command_info) pairs from add_command_nowait()
+        self._command_queue: asyncio.Queue[tuple[datetime, dict]] = asyncio.Queue()
+        self._command_task: Optional[asyncio.Task] = None
+
+        # Encoded events waiting for the next broadcast flush
+        self._outbox: list[bytes] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # Saved commands as broadcast dicts, loaded once then kept in sync
+        # by add_saved_command()/remove_saved_command()
+        self._saved_commands_cache: Optional[list[dict]] = None
+
+        # Database session maker; each operation opens its own session
         self.session_maker = None
-        self.command_repo: Optional[CommandRepository] = None
-        self.saved_command_repo: Optional[SavedCommandRepository] = None
-        self.project_repo: Optional[ProjectRepository] = None
         self._db_initialized = False
 
     async def initialize_db(self):
@@ -65,13 +208,6 @@ class StateManager:
         # Create session maker
         self.session_maker = get_session_maker()
 
-        # Create a session for repositories
-        # We'll use a long-lived session for the state manager
-        session = self.session_maker()
-        self.command_repo = CommandRepository(session)
-        self.saved_command_repo = SavedCommandRepository(session)
-        self.project_repo = ProjectRepository(session)
-
         self._db_initialized = True
     
     async def broadcast(self, event_type: str, data: Any):
@@ -79,28 +215,182 @@ class StateManager:
         if not self.clients:
             return
 
-        message = json.dumps({
+        # Encode once; every client gets the same bytes, sent as a text frame
+        self._enqueue(encode_message({
             "type": event_type,
             "data": data,
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": datetime.now(),
+        }))
+
+    def _enqueue(self, message: bytes):
+        """Queue an encoded event and arm the broadcast flush timer."""
+        self._outbox.append(message)
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                _BROADCAST_FLUSH_DELAY, self._flush
+            )
 
-        # Send to all clients, removing disconnected ones
-        # Use a copy of the set to avoid RuntimeError during iteration
-        disconnected = set()
-        for client in list(self.clients):
-            try:
-                await client.send(message)
-            except websockets.ConnectionClosed:
-                disconnected.add(client)
+    def _flush(self):
+        """Send queued events, batching them when more than one is pending.
 
-        self.clients -= disconnected
+        A lone event is sent unchanged; several become
+        {"type": "batch", "events": [...]} in the order they were queued.
+        """
+        self._flush_handle = None
+        outbox, self._outbox = self._outbox, []
+        if not outbox or not self.clients:
+            return
+        if len(outbox) == 1:
+            message = outbox[0]
+        else:
+            message = b'{"type":"batch","events":[' + b",".join(outbox) + b"]}"
+        self._send_all(message)
+
+    def _send_all(self, message: bytes):
+        """Send an encoded message to every client."""
+        # broadcast() writes the frame to each open connection without
+        # awaiting, skipping closed ones; drop those from the client set
+        ws_broadcast(self.clients, message, text=True)
+        self.clients = {c for c in self.clients if c.state is State.OPEN}
     
     async def broadcast_state(self):
         """Broadcast full state to all clients."""
-        # Gather state from repositories and in-memory data
-        state_dict = await self._get_state_dict()
-        await self.broadcast("state", state_dict)
+        if not self.clients:
+            return
+        self._enqueue(await self._state_message())
+
+    async def get_cached_snapshot(self) -> dict:
+        """Get the state dictionary, rebuilding it only after a mutation."""
+        if self._snapshot is not None:
+            return self._snapshot
+        version = self._state_version
+        snapshot = await self._get_state_dict()
+        # Don't cache a snapshot that a mutation overtook while querying
+        if version == self._state_version:
+            self._snapshot = snapshot
+        return snapshot
+
+    def _invalidate_snapshot(self, *keys: str):
+        """Drop the cached state snapshot after a mutation.
+
+        Args:
+            keys: Top-level state keys the mutation changed
+        """
+        self._state_version += 1
+        self._snapshot = None
+        self._snapshot_json = None
+        self._snapshot_parts = None
+        self._touched.append((self._state_version, frozenset(keys)))
+
+    async def _encoded_snapshot(self) -> tuple[bytes, Optional[int]]:
+        """Return the encoded state snapshot and its revision.
+
+        The revision is None when a mutation overtook the rebuild, since
+        that snapshot doesn't match any single revision.
+        """
+        snapshot_json = self._snapshot_json
+        if snapshot_json is not None:
+            return snapshot_json, self._state_version
+
+        revision = self._state_version
+        snapshot = await self.get_cached_snapshot()
+        rows = (
+            len(snapshot["command_history"])
+            + len(snapshot["saved_commands"])
+            + len(snapshot["services"])
+            + len(snapshot["pending_approvals"])
+        )
+        if rows > _OFFLOAD_ENCODE_ROWS:
+            # Large payload: keep the loop serving sockets meanwhile
+            parts = await asyncio.to_thread(_encode_parts, snapshot)
+        else:
+            parts = _encode_parts(snapshot)
+        snapshot_json = _join_parts(parts)
+        if snapshot is not self._snapshot or revision != self._state_version:
+            return snapshot_json, None
+        self._snapshot_json = snapshot_json
+        self._snapshot_parts = parts
+        return snapshot_json, revision
+
+    def _envelope_head(self, message_type: bytes, revision: Optional[int]) -> bytes:
+        """Start a "state"/"delta" message with its epoch and revision."""
+        head = b'{"type":"%s","epoch":"%s"' % (message_type, self._epoch.encode())
+        if revision is not None:
+            head += b',"rev":%d' % revision
+        return head
+
+    async def _state_message(self) -> bytes:
+        """Build a "state" message around the cached, pre-encoded snapshot.
+
+        Only the envelope and timestamp are encoded per call; the state
+        itself is serialized once per mutation.
+        """
+        snapshot_json, revision = await self._encoded_snapshot()
+        return b"".join((
+            self._envelope_head(b"state", revision),
+            b',"data":',
+            snapshot_json,
+            b',"timestamp":"',
+            datetime.now().isoformat().encode(),
+            b'"}',
+        ))
+
+    async def state_delta(self, since: int, epoch: Optional[str]) -> Optional[bytes]:
+        """Build a "delta" message for a client holding an older revision.
+
+        Every mutation after ``since`` is covered, including ones the client
+        only saw as incremental events (or missed while disconnected): each
+        key they touched is sent with its current value as a JSON Patch
+        "add" (which replaces an existing member), or "remove" if it's gone.
+
+        Args:
+            since: Revision from the last "state"/"delta" the client received
+            epoch: Epoch from that same message
+
+        Returns:
+            The encoded message, or None if the client must get full state
+            (another process's epoch, unknown revision, or history aged out)
+        """
+        if epoch != self._epoch:
+            return None
+        _, revision = await self._encoded_snapshot()
+        if revision is None or not 0 <= since <= revision:
+            return None
+        touched = [keys for rev, keys in self._touched if rev > since]
+        if len(touched) != revision - since:
+            return None
+        parts = self._snapshot_parts
+        ops = []
+        for key in sorted(frozenset().union(*touched)):
+            path = encode_message(f"/{key}")
+            if key in parts:
+                ops.append(b'{"op":"add","path":%s,"value":%s}' % (path, parts[key]))
+            else:
+                ops.append(b'{"op":"remove","path":%s}' % path)
+        return b"".join((
+            self._envelope_head(b"delta", revision),
+            b',"since":%d,"patch":[' % since,
+            b",".join(ops),
+            b'],"timestamp":"',
+            datetime.now().isoformat().encode(),
+            b'"}',
+        ))
+
+    async def _get_recent_commands(self, limit: int) -> list[dict]:
+        """Fetch recent command history in a dedicated session."""
+        async with self.session_maker() as session:
+            return await CommandRepository(session).get_recent_summaries(limit)
+
+    async def _get_saved_commands(self) -> list[dict]:
+        """Return saved commands, querying the database only on first use."""
+        if self._saved_commands_cache is None:
+            async with self.session_maker() as session:
+                saved_list = await SavedCommandRepository(session).get_all_with_tags()
+            self._saved_commands_cache = [
+                _saved_command_dict(sc) for sc in saved_list
+            ]
+        return self._saved_commands_cache
 
     async def _get_state_dict(self) -> dict:
         """Build state dictionary from repos and in-memory data."""
@@ -109,57 +399,24 @@ class StateManager:
         saved_commands = []
         logs = []
 
-        if self.command_repo:
-            cmd_list = await self.command_repo.get_recent(50)
-            commands = [
-                {
-                    "id": cmd.id,
-                    "command": cmd.command,
-                    "cwd": cmd.cwd,
-                    "status": cmd.status,
-                    "exit_code": cmd.exit_code,
-                    "timestamp": cmd.timestamp.isoformat(),
-                }
-                for cmd in cmd_list
-            ]
-
-        if self.saved_command_repo:
-            saved_list = await self.saved_command_repo.get_all_with_tags()
-            saved_commands = [
-                {
-                    "id": sc.id,
-                    "name": sc.name,
-                    "command": sc.command,
-                    "cwd": sc.cwd,
-                    "description": sc.description,
-                    "created_at": sc.created_at.isoformat(),
-                    "tags": [tag.name for tag in sc.tags],
-                }
-                for sc in saved_list
-            ]
+        if self._db_initialized:
+            if self._saved_commands_cache is None:
+                # Separate sessions so both queries run concurrently
+                commands, saved_commands = await asyncio.gather(
+                    self._get_recent_commands(50),
+                    self._get_saved_commands(),
+                )
+            else:
+                # Saved commands are in memory; only history needs a query
+                commands = await self._get_recent_commands(50)
+                saved_commands = self._saved_commands_cache
 
         # Build state dictionary
         result = {
-            "current_project": (
-                self.current_project.model_dump(mode="json")
-                if self.current_project
-                else None
-            ),
-            "services": {
-                k: {
-                    "id": v.id,
-                    "name": v.name,
-                    "command": v.command,
-                    "cwd": v.cwd,
-                    "port": v.port,
-                    "pid": v.pid,
-                    "started_at": v.started_at.isoformat(),
-                    "status": v.status,
-                }
-                for k, v in self.services.items()
-            },
+            "current_project": self._project_dumped,
+            "services": {k: v.to_dict() for k, v in self.services.items()},
             "command_history": commands,
-            "pending_approvals": self.pending_approvals,
+            "pending_approvals": list(self.pending_approvals.values()),
             "logs": logs,  # Will add log repo later
             "saved_commands": saved_commands,
         }
@@ -170,17 +427,33 @@ class StateManager:
         return result
     
     async def add_client(self, websocket: WebSocketServerProtocol):
-        """Add a new WebSocket client."""
+        """Add a new WebSocket client.
+
+        State isn't pushed here: clients ask with "get_state", passing
+        "since" on reconnect so they get a delta instead of full state.
+        """
         self.clients.add(websocket)
-        # Send current state to new client
-        state_dict = await self._get_state_dict()
-        await websocket.send(
-            json.dumps({
-                "type": "state",
-                "data": state_dict,
-                "timestamp": datetime.now().isoformat(),
-            })
-        )
+
+    async def send_state(
+        self,
+        websocket: WebSocketServerProtocol,
+        since: Optional[int] = None,
+        epoch: Optional[str] = None,
+    ):
+        """Send state to a single client.
+
+        Args:
+            websocket: Client connection
+            since: Revision the client holds; when the mutations after it are
+                still known a "delta" is sent instead of full state
+            epoch: Epoch the client's revision belongs to
+        """
+        message = None
+        if since is not None:
+            message = await self.state_delta(since, epoch)
+        if message is None:
+            message = await self._state_message()
+        await websocket.send(message, text=True)
     
     def remove_client(self, websocket: WebSocketServerProtocol):
         """Remove a WebSocket client."""
@@ -188,20 +461,23 @@ class StateManager:
     
     async def set_project(self, profile: ProjectProfile):
         """Set current project and broadcast update."""
-        async with self._lock:
-            self.current_project = profile
-        await self.broadcast("project_changed", profile.model_dump(mode="json"))
+        self.current_project = profile
+        self._project_dumped = profile.model_dump(mode="json")
+        self._invalidate_snapshot("current_project")
+        await self.broadcast("project_changed", self._project_dumped)
 
     async def set_workspace(self, workspace_data: dict):
         """Set workspace data and broadcast update."""
-        async with self._lock:
+        # get_state sets the workspace every time; only a change is a mutation
+        if workspace_data != self.workspace:
             self.workspace = workspace_data
+            self._invalidate_snapshot("workspace")
         await self.broadcast("workspace", workspace_data)
     
     async def add_service(self, service: ServiceInfo):
         """Add a running service and broadcast update."""
-        async with self._lock:
-            self.services[service.id] = service
+        self.services[service.id] = service
+        self._invalidate_snapshot("services")
         await self.broadcast(
             "service_started",
             {
@@ -214,57 +490,132 @@ class StateManager:
 
     async def remove_service(self, service_id: str):
         """Remove a service and broadcast update."""
-        async with self._lock:
-            if service_id in self.services:
-                del self.services[service_id]
+        if service_id in self.services:
+            del self.services[service_id]
+            self._invalidate_snapshot("services")
         await self.broadcast("service_stopped", {"id": service_id})
 
     async def update_service_status(self, service_id: str, status: str):
         """Update service status and broadcast."""
-        async with self._lock:
-            if service_id in self.services:
-                self.services[service_id].status = status
+        if service_id in self.services:
+            service = self.services[service_id]
+            service.status = status
+            service._cached_dict["status"] = status
+            self._invalidate_snapshot("services")
         await self.broadcast("service_status", {"id": service_id, "status": status})
     
     async def add_command(self, command_info: dict):
         """Add command to history and broadcast."""
-        if self.command_repo:
-            await self.command_repo.add_command(
-                command=command_info.get("command", ""),
-                cwd=command_info.get("cwd", "."),
-                status=command_info.get("status", "unknown"),
-                exit_code=command_info.get("exit_code"),
-                stdout=command_info.get("stdout"),
-                stderr=command_info.get("stderr"),
-                project_id=command_info.get("project_id"),
-            )
+        if self._db_initialized:
+            async with self.session_maker() as session:
+                await CommandRepository(session).add_command(
+                    command=command_info.get("command", ""),
+                    cwd=command_info.get("cwd", "."),
+                    status=command_info.get("status", "unknown"),
+                    exit_code=command_info.get("exit_code"),
+                    stdout=command_info.get("stdout"),
+                    stderr=command_info.get("stderr"),
+                    project_id=command_info.get("project_id"),
+                )
+        # Clients append the event to their history either way
+        self._invalidate_snapshot("command_history")
         await self.broadcast("command", command_info)
+
+    def add_command_nowait(self, command_info: dict):
+        """Queue a command for history without waiting on the database.
+
+        Commands queued within _COMMAND_FLUSH_DELAY of each other are
+        inserted together and then broadcast in order.
+        """
+        self._command_queue.put_nowait((datetime.now(), command_info))
+        if self._command_task is None or self._command_task.done():
+            self._command_task = asyncio.create_task(self._flush_commands())
+
+    async def add_commands(self, entries: list[tuple[datetime, dict]]):
+        """Add a batch of (timestamp, command_info) to history and broadcast."""
+        if self._db_initialized:
+            async with self.session_maker() as session:
+                await CommandRepository(session).add_commands([
+                    {
+                        "command": info.get("command", ""),
+                        "cwd": info.get("cwd", "."),
+                        "status": info.get("status", "unknown"),
+                        "exit_code": info.get("exit_code"),
+                        "stdout": info.get("stdout"),
+                        "stderr": info.get("stderr"),
+                        "project_id": info.get("project_id"),
+                        "timestamp": queued_at,
+                    }
+                    for queued_at, info in entries
+                ])
+        self._invalidate_snapshot("command_history")
+        for _, info in entries:
+            await self.broadcast("command", info)
+
+    async def _flush_commands(self):
+        """Write queued commands in coalesced batches until cancelled."""
+        while True:
+            batch = [await self._command_queue.get()]
+            await asyncio.sleep(_COMMAND_FLUSH_DELAY)
+            while not self._command_queue.empty():
+                batch.append(self._command_queue.get_nowait())
+            try:
+                await self.add_commands(batch)
+            except Exception as e:
+                await self.log("ERROR", f"Failed to record {len(batch)} commands: {e}")
     
     async def add_pending_approval(self, approval: dict):
         """Add pending approval and broadcast."""
-        async with self._lock:
-            self.pending_approvals.append(approval)
+        self.pending_approvals[approval["id"]] = approval
+        self._invalidate_snapshot("pending_approvals")
         await self.broadcast("approval_required", approval)
 
     async def remove_pending_approval(self, approval_id: str):
         """Remove pending approval and broadcast."""
-        async with self._lock:
-            self.pending_approvals = [
-                a for a in self.pending_approvals if a.get("id") != approval_id
-            ]
+        if self.pending_approvals.pop(approval_id, None) is not None:
+            self._invalidate_snapshot("pending_approvals")
         await self.broadcast("approval_resolved", {"id": approval_id})
     
     async def log(self, level: str, message: str, source: str = "system"):
         """Add log entry and broadcast."""
-        entry = {
-            "level": level,
-            "message": message,
-            "source": source,
-            "timestamp": datetime.now().isoformat(),
-        }
         # TODO: Add to database when log repository is implemented
         # For now, logs are not persisted
-        await self.broadcast("log", entry)
+        self._broadcast_log(LogEntry(level, message, source, datetime.now()))
+
+    def log_nowait(self, level: str, message: str, source: str = "system"):
+        """Queue a log entry for broadcast without waiting on clients.
+
+        Entries are stamped now and broadcast in order by a background task,
+        so callers on a request path don't block on WebSocket sends.
+        """
+        self._log_queue.put_nowait(
+            LogEntry(level, message, source, datetime.now())
+        )
+        if self._log_task is None or self._log_task.done():
+            self._log_task = asyncio.create_task(self._drain_logs())
+
+    async def log_many(self, entries: list[LogEntry]):
+        """Broadcast a batch of prepared log entries."""
+        for entry in entries:
+            self._broadcast_log(entry)
+
+    def _broadcast_log(self, entry: LogEntry):
+        """Queue a "log" event; the entry is encoded straight from its slots."""
+        if not self.clients:
+            return
+        self._enqueue(encode_message({
+            "type": "log",
+            "data": entry,
+            "timestamp": entry.timestamp,
+        }))
+
+    async def _drain_logs(self):
+        """Broadcast queued log entries in batches until cancelled."""
+        while True:
+            batch = [await self._log_queue.get()]
+            while len(batch) < _LOG_BATCH_SIZE and not self._log_queue.empty():
+                batch.append(self._log_queue.get_nowait())
+            await self.log_many(batch)
 
     async def clear_logs(self):
         """Clear all logs and broadcast update."""
@@ -273,48 +624,34 @@ class StateManager:
 
     async def add_saved_command(self, command_data: dict):
         """Add a saved command and broadcast update."""
-        if self.saved_command_repo:
-            await self.saved_command_repo.add_saved_command(
-                name=command_data.get("name", ""),
-                command=command_data.get("command", ""),
-                cwd=command_data.get("cwd"),
-                description=command_data.get("description"),
-            )
-            # Get all saved commands to broadcast
-            saved_list = await self.saved_command_repo.get_all_with_tags()
-            saved_commands = [
-                {
-                    "id": sc.id,
-                    "name": sc.name,
-                    "command": sc.command,
-                    "cwd": sc.cwd,
-                    "description": sc.description,
-                    "created_at": sc.created_at.isoformat(),
-                    "tags": [tag.name for tag in sc.tags],
-                }
-                for sc in saved_list
-            ]
-            await self.broadcast("saved_commands", saved_commands)
+        if self._db_initialized:
+            async with self.session_maker() as session:
+                saved_cmd = await SavedCommandRepository(session).add_saved_command(
+                    name=command_data.get("name", ""),
+                    command=command_data.get("command", ""),
+                    cwd=command_data.get("cwd"),
+                    description=command_data.get("description"),
+                )
+            # Replace rather than append so cached snapshots keep their list
+            if self._saved_commands_cache is not None:
+                self._saved_commands_cache = [
+                    *self._saved_commands_cache,
+                    _saved_command_dict(saved_cmd),
+                ]
+            self._invalidate_snapshot("saved_commands")
+            await self.broadcast("saved_commands", await self._get_saved_commands())
 
     async def remove_saved_command(self, command_id: str):
         """Remove a saved command and broadcast update."""
-        if self.saved_command_repo:
-            await self.saved_command_repo.delete_by_id(command_id)
-            # Get all saved commands to broadcast
-            saved_list = await self.saved_command_repo.get_all_with_tags()
-            saved_commands = [
-                {
-                    "id": sc.id,
-                    "name": sc.name,
-                    "command": sc.command,
-                    "cwd": sc.cwd,
-                    "description": sc.description,
-                    "created_at": sc.created_at.isoformat(),
-                    "tags": [tag.name for tag in sc.tags],
-                }
-                for sc in saved_list
-            ]
-            await self.broadcast("saved_commands", saved_commands)
+        if self._db_initialized:
+            async with self.session_maker() as session:
+                await SavedCommandRepository(session).delete_by_id(command_id)
+            if self._saved_commands_cache is not None:
+                self._saved_commands_cache = [
+                    sc for sc in self._saved_commands_cache if sc["id"] != command_id
+                ]
+            self._invalidate_snapshot("saved_commands")
+            await self.broadcast("saved_commands", await self._get_saved_commands())
 
 
 # Singleton instance
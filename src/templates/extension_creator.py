@@ -2,21 +2,189 @@
 Extension Creator - Template-based scaffolding for widgets, workflows, and integrations
 """
 import os
+import re
 import json
-import yaml
 from pathlib import Path
-from typing import Dict, List, Literal
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Literal, Optional
+
+from .files import dump_json, write_files
+
+_EXTENSION_SUBDIRS = ("widgets", "workflows", "integrations")
+
+# Grid bounds shared by every widget manifest (only ever serialized)
+_WIDGET_MIN_SIZE = {"xs": 12, "md": 6}
+_WIDGET_MAX_SIZE = {"xs": 12, "md": 12, "lg": 12}
+
+
+def _yaml_dump_args():
+    """
+    Import PyYAML on first use and pick its fastest safe dumper.
+
+    Most workflows are written by _emit_workflow_yaml(), so PyYAML is only
+    loaded for the few that need the full emitter.
+
+    Returns:
+        Tuple of (yaml.dump, Dumper class)
+    """
+    import yaml
+    # CSafeDumper only exists when PyYAML was built with libyaml
+    return yaml.dump, getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Mapping keys that can be written unquoted
+_YAML_PLAIN_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*")
+# Keys YAML 1.1 would read back as booleans or null
+_YAML_RESERVED_KEYS = frozenset(
+    ("y", "n", "yes", "no", "true", "false", "on", "off", "null")
+)
+# Characters JSON leaves raw that YAML double-quoted scalars can't hold as-is
+_YAML_UNSAFE_CHARS = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff-\uffff]")
+
+
+def _yaml_key(key: Any) -> Optional[str]:
+    """Format a mapping key, or None if it needs the full emitter."""
+    if not isinstance(key, str):
+        return None
+    if _YAML_PLAIN_KEY.fullmatch(key) and key.lower() not in _YAML_RESERVED_KEYS:
+        return key
+    return _yaml_scalar(key)
+
+
+def _yaml_scalar(value: Any) -> Optional[str]:
+    """Format a scalar as YAML, or None if it needs the full emitter.
+
+    Strings are written JSON-quoted, which is valid YAML double-quoted
+    syntax once the few characters YAML treats specially are ruled out.
+    """
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, str) and not _YAML_UNSAFE_CHARS.search(value):
+        return json.dumps(value, ensure_ascii=False)
+    return None
+
+
+def _emit_workflow_yaml(workflow: Dict) -> Optional[str]:
+    """
+    Write a workflow as block-style YAML without going through PyYAML.
+
+    Handles the shape create_workflow() builds: top-level scalars and lists
+    of flat mappings (parameters, steps, hooks). Returns None for anything
+    else (nested containers, floats, ...) so the caller can fall back to
+    yaml.dump().
+    """
+    lines = []
+    for key, value in workflow.items():
+        key_text = _yaml_key(key)
+        if key_text is None:
+            return None
+        if not isinstance(value, list):
+            text = _yaml_scalar(value)
+            if text is None:
+                return None
+            lines.append(f"{key_text}: {text}")
+        elif not value:
+            lines.append(f"{key_text}: []")
+        else:
+            lines.append(f"{key_text}:")
+            for item in value:
+                if not isinstance(item, dict):
+                    text = _yaml_scalar(item)
+                    if text is None:
+                        return None
+                    lines.append(f"- {text}")
+                    continue
+                if not item:
+                    lines.append("- {}")
+                    continue
+                prefix = "- "
+                for item_key, item_value in item.items():
+                    item_key_text = _yaml_key(item_key)
+                    text = _yaml_scalar(item_value)
+                    if item_key_text is None or text is None:
+                        return None
+                    lines.append(f"{prefix}{item_key_text}: {text}")
+                    prefix = "  "
+    lines.append("")
+    return "\n".join(lines)
+
+
+# Default config.json contents per integration service type
+_DEFAULT_CONFIGS: Dict[str, Dict] = {
+    "slack": {
+        "enabled": True,
+        "webhook_url": "",
+        "channel": "#dev-notifications",
+        "notify_on_failure": True,
+        "notify_on_long_running": True,
+        "long_running_threshold_seconds": 300
+    },
+    "github": {
+        "enabled": True,
+        "token": "",
+        "repo": "",
+        "auto_create_issues": False
+    },
+    "jira": {
+        "enabled": True,
+        "url": "",
+        "email": "",
+        "api_token": "",
+        "default_project": ""
+    },
+    "custom": {
+        "enabled": True
+    }
+}
+
+
+@lru_cache(maxsize=256)
+def _component_name(name: str) -> str:
+    """PascalCase React component name for a kebab-case widget name."""
+    return ''.join(word.capitalize() for word in name.split('-'))
+
+
+@lru_cache(maxsize=256)
+def _title(name: str) -> str:
+    """Human-readable title for a kebab-case name."""
+    return name.replace('-', ' ').title()
+
+
+def _widget_fields(name: str, description: str, author: str) -> Dict[str, str]:
+    """Values shared by every file of a widget: manifest, Widget.tsx, README."""
+    return {
+        "name": name,
+        "title": _title(name),
+        "component_name": _component_name(name),
+        "description": description,
+        "author": author,
+    }
 
 
 class ExtensionCreator:
     """Creates extension templates for widgets, workflows, and integrations."""
 
+    # extensions_dir paths whose subdirectories were set up in this process
+    _verified_dirs: ClassVar[set] = set()
+
     def __init__(self, extensions_dir: Path = None):
         self.extensions_dir = extensions_dir or Path.home() / ".dev-orchestrator" / "extensions"
-        self.extensions_dir.mkdir(parents=True, exist_ok=True)
-        (self.extensions_dir / "widgets").mkdir(exist_ok=True)
-        (self.extensions_dir / "workflows").mkdir(exist_ok=True)
-        (self.extensions_dir / "integrations").mkdir(exist_ok=True)
+        if self.extensions_dir in self._verified_dirs:
+            return
+
+        # Usually the tree exists already: one stat per subdirectory,
+        # and only create (with parents) what is missing
+        for sub in _EXTENSION_SUBDIRS:
+            path = self.extensions_dir / sub
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+        self._verified_dirs.add(self.extensions_dir)
 
     def create_widget(
         self,
@@ -44,41 +212,59 @@ class ExtensionCreator:
             Dict with created file paths
         """
         widget_dir = self.extensions_dir / "widgets" / name
-        if widget_dir.exists():
-            raise ValueError(f"Widget directory already exists: {widget_dir}")
-
-        widget_dir.mkdir(parents=True, exist_ok=True)
 
-        created_files = {}
+        fields = _widget_fields(name, description, author)
 
         # Create manifest
-        manifest_path = widget_dir / "manifest.json"
         manifest = self._create_widget_manifest(
-            name, description, author, category,
+            fields, category,
             permissions or ["read-state"],
             grid_size or {"xs": 12, "md": 6, "lg": 4}
         )
-        manifest_path.write_text(json.dumps(manifest, indent=2))
-        created_files["manifest"] = str(manifest_path)
 
         # Create Widget.tsx
-        widget_path = widget_dir / "Widget.tsx"
         if template_type == "basic":
-            content = self._create_basic_widget(name, description)
+            content = self._create_basic_widget(fields)
         elif template_type == "interactive":
-            content = self._create_interactive_widget(name, description)
+            content = self._create_interactive_widget(fields)
         else:  # realtime
-            content = self._create_realtime_widget(name, description)
+            content = self._create_realtime_widget(fields)
 
-        widget_path.write_text(content)
-        created_files["widget"] = str(widget_path)
+        return write_files(widget_dir, "Widget directory", {
+            "manifest": ("manifest.json", dump_json(manifest)),
+            "widget": ("Widget.tsx", content),
+            "readme": ("README.md", self._create_widget_readme(fields)),
+        })
 
-        # Create README
-        readme_path = widget_dir / "README.md"
-        readme_path.write_text(self._create_widget_readme(name, description, author))
-        created_files["readme"] = str(readme_path)
+    def create_widgets_bulk(self, specs: List[Dict]) -> List[Dict[str, str]]:
+        """
+        Create several widgets, checking every name before creating any.
 
-        return created_files
+        Args:
+            specs: Keyword arguments for create_widget(), one dict per widget
+
+        Returns:
+            List of created file path dicts, in the order of specs
+
+        Raises:
+            ValueError: If a name is repeated or a widget directory already exists
+        """
+        # One directory listing instead of a stat per name
+        with os.scandir(self.extensions_dir / "widgets") as entries:
+            existing = {entry.name for entry in entries}
+
+        seen = set()
+        for spec in specs:
+            name = spec["name"]
+            if name in existing:
+                raise ValueError(
+                    f"Widget directory already exists: {self.extensions_dir / 'widgets' / name}"
+                )
+            if name in seen:
+                raise ValueError(f"Duplicate widget name: {name}")
+            seen.add(name)
+
+        return [self.create_widget(**spec) for spec in specs]
 
     def create_workflow(
         self,
@@ -104,8 +290,6 @@ class ExtensionCreator:
             Path to created workflow file
         """
         workflow_path = self.extensions_dir / "workflows" / f"{name}.yaml"
-        if workflow_path.exists():
-            raise ValueError(f"Workflow already exists: {workflow_path}")
 
         workflow = {
             "name": name,
@@ -125,7 +309,29 @@ class ExtensionCreator:
             "on_failure": []
         }
 
-        workflow_path.write_text(yaml.dump(workflow, default_flow_style=False, sort_keys=False))
+        content = _emit_workflow_yaml(workflow)
+
+        # Exclusive create doubles as the existence check
+        try:
+            f = open(workflow_path, "xb")
+        except FileExistsError:
+            raise ValueError(f"Workflow already exists: {workflow_path}") from None
+
+        with f:
+            if content is not None:
+                f.write(content.encode())
+            else:
+                # Values outside the simple workflow shape: stream the full
+                # emitter's UTF-8 output straight into the file
+                yaml_dump, dumper = _yaml_dump_args()
+                yaml_dump(
+                    workflow,
+                    f,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    encoding="utf-8",
+                )
         return str(workflow_path)
 
     def create_integration(
@@ -146,21 +352,11 @@ class ExtensionCreator:
             Dict with created file paths
         """
         integration_dir = self.extensions_dir / "integrations" / name
-        if integration_dir.exists():
-            raise ValueError(f"Integration directory already exists: {integration_dir}")
-
-        integration_dir.mkdir(parents=True, exist_ok=True)
-
-        created_files = {}
 
         # Create config.json
-        config_path = integration_dir / "config.json"
         integration_config = config or self._get_default_config(service_type)
-        config_path.write_text(json.dumps(integration_config, indent=2))
-        created_files["config"] = str(config_path)
 
         # Create integration.py
-        integration_path = integration_dir / "integration.py"
         if service_type == "slack":
             content = self._create_slack_integration(name)
         elif service_type == "github":
@@ -170,263 +366,50 @@ class ExtensionCreator:
         else:  # custom
             content = self._create_custom_integration(name)
 
-        integration_path.write_text(content)
-        created_files["integration"] = str(integration_path)
-
-        # Create README
-        readme_path = integration_dir / "README.md"
-        readme_path.write_text(self._create_integration_readme(name, service_type))
-        created_files["readme"] = str(readme_path)
-
-        return created_files
+        return write_files(integration_dir, "Integration directory", {
+            "config": ("config.json", dump_json(integration_config)),
+            "integration": ("integration.py", content),
+            "readme": ("README.md", self._create_integration_readme(name, service_type)),
+        })
 
     def _create_widget_manifest(
-        self, name: str, description: str, author: str, category: str,
+        self, fields: Dict[str, str], category: str,
         permissions: List[str], grid_size: Dict[str, int]
     ) -> Dict:
         """Create widget manifest."""
         return {
-            "id": name,
-            "name": name.replace("-", " ").title(),
+            "id": fields["name"],
+            "name": fields["title"],
             "version": "1.0.0",
-            "description": description,
-            "author": author,
+            "description": fields["description"],
+            "author": fields["author"],
             "entry": "Widget.tsx",
             "permissions": permissions,
             "grid": {
                 "defaultSize": grid_size,
-                "minSize": {"xs": 12, "md": 6},
-                "maxSize": {"xs": 12, "md": 12, "lg": 12}
+                "minSize": _WIDGET_MIN_SIZE,
+                "maxSize": _WIDGET_MAX_SIZE
             },
             "category": category,
             "updateInterval": 5000
         }
 
-    def _create_basic_widget(self, name: str, description: str) -> str:
+    def _create_basic_widget(self, fields: Dict[str, str]) -> str:
         """Create basic widget template."""
-        component_name = ''.join(word.capitalize() for word in name.split('-'))
-        return f'''import React from 'react';
-import {{ Card, CardHeader, CardContent, Typography, Box }} from '@mui/material';
+        return _BASIC_WIDGET_TEMPLATE.format_map(fields)
 
-interface WidgetProps {{
-  state: any;
-  sendMessage: (msg: any) => void;
-  theme: any;
-  config: Record<string, any>;
-}}
-
-const {component_name}Widget: React.FC<WidgetProps> = ({{ state }}) => {{
-  return (
-    <Card>
-      <CardHeader title="{name.replace('-', ' ').title()}" />
-      <CardContent>
-        <Typography variant="body2" color="text.secondary">
-          {description}
-        </Typography>
-        <Box sx={{ mt: 2 }}>
-          <Typography variant="body1">
-            Current Project: {{state?.current_project?.name || 'None'}}
-          </Typography>
-        </Box>
-      </CardContent>
-    </Card>
-  );
-}};
-
-export default {component_name}Widget;
-'''
-
-    def _create_interactive_widget(self, name: str, description: str) -> str:
+    def _create_interactive_widget(self, fields: Dict[str, str]) -> str:
         """Create interactive widget template with buttons."""
-        component_name = ''.join(word.capitalize() for word in name.split('-'))
-        return f'''import React, {{ useState }} from 'react';
-import {{
-  Card,
-  CardHeader,
-  CardContent,
-  Typography,
-  Button,
-  Stack,
-  TextField,
-  Alert,
-}} from '@mui/material';
-
-interface WidgetProps {{
-  state: any;
-  sendMessage: (msg: any) => void;
-  theme: any;
-  config: Record<string, any>;
-}}
-
-const {component_name}Widget: React.FC<WidgetProps> = ({{ state, sendMessage }}) => {{
-  const [input, setInput] = useState('');
-  const [result, setResult] = useState<string | null>(null);
-
-  const handleAction = () => {{
-    // Send message to backend
-    sendMessage({{
-      type: 'custom_action',
-      plugin: '{name}',
-      data: {{ input }}
-    }});
-    setResult(`Action executed with: ${{input}}`);
-  }};
-
-  return (
-    <Card>
-      <CardHeader title="{name.replace('-', ' ').title()}" />
-      <CardContent>
-        <Typography variant="body2" color="text.secondary" gutterBottom>
-          {description}
-        </Typography>
-
-        <Stack spacing={2} sx={{ mt: 2 }}>
-          <TextField
-            size="small"
-            label="Input"
-            value={{input}}
-            onChange={{(e) => setInput(e.target.value)}}
-            fullWidth
-          />
-
-          <Button
-            variant="contained"
-            onClick={{handleAction}}
-            disabled={{!input}}
-          >
-            Execute Action
-          </Button>
+        return _INTERACTIVE_WIDGET_TEMPLATE.format_map(fields)
 
-          {{result && (
-            <Alert severity="success">{{result}}</Alert>
-          )}}
-        </Stack>
-      </CardContent>
-    </Card>
-  );
-}};
-
-export default {component_name}Widget;
-'''
-
-    def _create_realtime_widget(self, name: str, description: str) -> str:
+    def _create_realtime_widget(self, fields: Dict[str, str]) -> str:
         """Create realtime widget template with auto-refresh."""
-        component_name = ''.join(word.capitalize() for word in name.split('-'))
-        return f'''import React, {{ useState, useEffect }} from 'react';
-import {{
-  Card,
-  CardHeader,
-  CardContent,
-  Typography,
-  CircularProgress,
-  Box,
-  Chip,
-}} from '@mui/material';
-
-interface WidgetProps {{
-  state: any;
-  sendMessage: (msg: any) => void;
-  theme: any;
-  config: Record<string, any>;
-}}
-
-const {component_name}Widget: React.FC<WidgetProps> = ({{ state, config }}) => {{
-  const [data, setData] = useState<any>(null);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {{
-    // Auto-refresh every config.updateInterval ms
-    const interval = setInterval(() => {{
-      updateData();
-    }}, config.updateInterval || 5000);
-
-    updateData();
-
-    return () => clearInterval(interval);
-  }}, [state]);
-
-  const updateData = () => {{
-    setLoading(true);
-    // Extract data from state
-    const newData = {{
-      services: state?.services?.length || 0,
-      projects: state?.workspace?.total_repos || 0,
-      status: state?.services?.some((s: any) => s.status === 'running') ? 'active' : 'idle',
-    }};
-    setData(newData);
-    setLoading(false);
-  }};
-
-  if (loading && !data) {{
-    return (
-      <Card>
-        <CardHeader title="{name.replace('-', ' ').title()}" />
-        <CardContent>
-          <CircularProgress size={{24}} />
-        </CardContent>
-      </Card>
-    );
-  }}
-
-  return (
-    <Card>
-      <CardHeader
-        title="{name.replace('-', ' ').title()}"
-        subheader="Real-time monitoring"
-      />
-      <CardContent>
-        <Typography variant="body2" color="text.secondary" gutterBottom>
-          {description}
-        </Typography>
-
-        <Box sx={{ mt: 2 }}>
-          <Stack direction="row" spacing={1} flexWrap="wrap">
-            <Chip label={{`Services: ${{data?.services || 0}}`}} size="small" />
-            <Chip label={{`Projects: ${{data?.projects || 0}}`}} size="small" />
-            <Chip
-              label={{data?.status || 'unknown'}}
-              size="small"
-              color={{data?.status === 'active' ? 'success' : 'default'}}
-            />
-          </Stack>
-        </Box>
-      </CardContent>
-    </Card>
-  );
-}};
-
-export default {component_name}Widget;
-'''
+        return _REALTIME_WIDGET_TEMPLATE.format_map(fields)
 
     def _get_default_config(self, service_type: str) -> Dict:
         """Get default config for service type."""
-        configs = {
-            "slack": {
-                "enabled": True,
-                "webhook_url": "",
-                "channel": "#dev-notifications",
-                "notify_on_failure": True,
-                "notify_on_long_running": True,
-                "long_running_threshold_seconds": 300
-            },
-            "github": {
-                "enabled": True,
-                "token": "",
-                "repo": "",
-                "auto_create_issues": False
-            },
-            "jira": {
-                "enabled": True,
-                "url": "",
-                "email": "",
-                "api_token": "",
-                "default_project": ""
-            },
-            "custom": {
-                "enabled": True
-            }
-        }
-        return configs.get(service_type, configs["custom"])
+        # Shared across calls; callers only serialize it
+        return _DEFAULT_CONFIGS.get(service_type, _DEFAULT_CONFIGS["custom"])
 
     def _create_slack_integration(self, name: str) -> str:
         """Create Slack integration template."""
@@ -682,13 +665,222 @@ class JiraIntegration:
 
     def _create_custom_integration(self, name: str) -> str:
         """Create custom integration template."""
-        return f'''"""
+        return _CUSTOM_INTEGRATION_TEMPLATE.format_map({
+            "class_name": name.replace('-', '_').title().replace('_', ''),
+        })
+
+    def _create_widget_readme(self, fields: Dict[str, str]) -> str:
+        """Create widget README."""
+        return _WIDGET_README_TEMPLATE.format_map(fields)
+
+    def _create_integration_readme(self, name: str, service_type: str) -> str:
+        """Create integration README."""
+        return _INTEGRATION_README_TEMPLATE.format_map({
+            "title": _title(name),
+            "service_title": service_type.title(),
+        })
+
+
+# Templates below are str.format_map() patterns: literal braces are doubled,
+# {placeholders} are filled by the _create_* methods above.
+
+_BASIC_WIDGET_TEMPLATE = '''import React from 'react';
+import {{ Card, CardHeader, CardContent, Typography, Box }} from '@mui/material';
+
+interface WidgetProps {{
+  state: any;
+  sendMessage: (msg: any) => void;
+  theme: any;
+  config: Record<string, any>;
+}}
+
+const {component_name}Widget: React.FC<WidgetProps> = ({{ state }}) => {{
+  return (
+    <Card>
+      <CardHeader title="{title}" />
+      <CardContent>
+        <Typography variant="body2" color="text.secondary">
+          {description}
+        </Typography>
+        <Box sx={{ mt: 2 }}>
+          <Typography variant="body1">
+            Current Project: {{state?.current_project?.name || 'None'}}
+          </Typography>
+        </Box>
+      </CardContent>
+    </Card>
+  );
+}};
+
+export default {component_name}Widget;
+'''
+
+
+_INTERACTIVE_WIDGET_TEMPLATE = '''import React, {{ useState }} from 'react';
+import {{
+  Card,
+  CardHeader,
+  CardContent,
+  Typography,
+  Button,
+  Stack,
+  TextField,
+  Alert,
+}} from '@mui/material';
+
+interface WidgetProps {{
+  state: any;
+  sendMessage: (msg: any) => void;
+  theme: any;
+  config: Record<string, any>;
+}}
+
+const {component_name}Widget: React.FC<WidgetProps> = ({{ state, sendMessage }}) => {{
+  const [input, setInput] = useState('');
+  const [result, setResult] = useState<string | null>(null);
+
+  const handleAction = () => {{
+    // Send message to backend
+    sendMessage({{
+      type: 'custom_action',
+      plugin: '{name}',
+      data: {{ input }}
+    }});
+    setResult(`Action executed with: ${{input}}`);
+  }};
+
+  return (
+    <Card>
+      <CardHeader title="{title}" />
+      <CardContent>
+        <Typography variant="body2" color="text.secondary" gutterBottom>
+          {description}
+        </Typography>
+
+        <Stack spacing=2 sx={{ mt: 2 }}>
+          <TextField
+            size="small"
+            label="Input"
+            value={{input}}
+            onChange={{(e) => setInput(e.target.value)}}
+            fullWidth
+          />
+
+          <Button
+            variant="contained"
+            onClick={{handleAction}}
+            disabled={{!input}}
+          >
+            Execute Action
+          </Button>
+
+          {{result && (
+            <Alert severity="success">{{result}}</Alert>
+          )}}
+        </Stack>
+      </CardContent>
+    </Card>
+  );
+}};
+
+export default {component_name}Widget;
+'''
+
+
+_REALTIME_WIDGET_TEMPLATE = '''import React, {{ useState, useEffect }} from 'react';
+import {{
+  Card,
+  CardHeader,
+  CardContent,
+  Typography,
+  CircularProgress,
+  Box,
+  Chip,
+}} from '@mui/material';
+
+interface WidgetProps {{
+  state: any;
+  sendMessage: (msg: any) => void;
+  theme: any;
+  config: Record<string, any>;
+}}
+
+const {component_name}Widget: React.FC<WidgetProps> = ({{ state, config }}) => {{
+  const [data, setData] = useState<any>(null);
+  const [loading, setLoading] = useState(true);
+
+  useEffect(() => {{
+    // Auto-refresh every config.updateInterval ms
+    const interval = setInterval(() => {{
+      updateData();
+    }}, config.updateInterval || 5000);
+
+    updateData();
+
+    return () => clearInterval(interval);
+  }}, [state]);
+
+  const updateData = () => {{
+    setLoading(true);
+    // Extract data from state
+    const newData = {{
+      services: state?.services?.length || 0,
+      projects: state?.workspace?.total_repos || 0,
+      status: state?.services?.some((s: any) => s.status === 'running') ? 'active' : 'idle',
+    }};
+    setData(newData);
+    setLoading(false);
+  }};
+
+  if (loading && !data) {{
+    return (
+      <Card>
+        <CardHeader title="{title}" />
+        <CardContent>
+          <CircularProgress size={{24}} />
+        </CardContent>
+      </Card>
+    );
+  }}
+
+  return (
+    <Card>
+      <CardHeader
+        title="{title}"
+        subheader="Real-time monitoring"
+      />
+      <CardContent>
+        <Typography variant="body2" color="text.secondary" gutterBottom>
+          {description}
+        </Typography>
+
+        <Box sx={{ mt: 2 }}>
+          <Stack direction="row" spacing=1 flexWrap="wrap">
+            <Chip label={{`Services: ${{data?.services || 0}}`}} size="small" />
+            <Chip label={{`Projects: ${{data?.projects || 0}}`}} size="small" />
+            <Chip
+              label={{data?.status || 'unknown'}}
+              size="small"
+              color={{data?.status === 'active' ? 'success' : 'default'}}
+            />
+          </Stack>
+        </Box>
+      </CardContent>
+    </Card>
+  );
+}};
+
+export default {component_name}Widget;
+'''
+
+
+_CUSTOM_INTEGRATION_TEMPLATE = '''"""
 Custom Integration for Dev Orchestrator
 """
 from typing import Dict, Any
 
 
-class {name.replace('-', '_').title().replace('_', '')}Integration:
+class {class_name}Integration:
     """Custom integration template."""
 
     def __init__(self, config: Dict[str, Any]):
@@ -728,9 +920,8 @@ class {name.replace('-', '_').title().replace('_', '')}Integration:
         return True
 '''
 
-    def _create_widget_readme(self, name: str, description: str, author: str) -> str:
-        """Create widget README."""
-        return f'''# {name.replace('-', ' ').title()} Widget
+
+_WIDGET_README_TEMPLATE = '''# {title} Widget
 
 {description}
 
@@ -763,11 +954,10 @@ To modify the widget, edit `Widget.tsx` and reload the dashboard.
 MIT
 '''
 
-    def _create_integration_readme(self, name: str, service_type: str) -> str:
-        """Create integration README."""
-        return f'''# {name.replace('-', ' ').title()} Integration
 
-{service_type.title()} integration for Dev Orchestrator.
+_INTEGRATION_README_TEMPLATE = '''# {title} Integration
+
+{service_title} integration for Dev Orchestrator.
 
 ## Setup
 
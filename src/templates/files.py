@@ -0,0 +1,53 @@
+"""
+Shared output helpers for the plugin and extension creators
+"""
+import json
+from pathlib import Path
+from typing import Dict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dump_json(obj: Dict) -> bytes:
+    """Serialize a manifest/config file as indented JSON with a final newline."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    # ensure_ascii (the default) guarantees ASCII, so this encode is a copy
+    return json.dumps(obj, indent=2).encode("ascii") + b"\n"
+
+
+def write_files(directory: Path, kind: str, files: Dict[str, tuple]) -> Dict[str, str]:
+    """
+    Create a directory and write rendered files into it.
+
+    Everything is rendered before this is called, so a template error
+    never leaves a half-written directory behind.
+
+    Args:
+        directory: Directory to create; must not exist yet
+        kind: What the directory is, for the "already exists" error
+        files: Mapping of result key to (filename, str or bytes content)
+
+    Returns:
+        Dict mapping each key to the created file path
+
+    Raises:
+        ValueError: If the directory already exists
+    """
+    # mkdir failing doubles as the existence check
+    try:
+        directory.mkdir(parents=True)
+    except FileExistsError:
+        raise ValueError(f"{kind} already exists: {directory}") from None
+    created_files = {}
+    for key, (filename, content) in files.items():
+        path = directory / filename
+        if isinstance(content, str):
+            content = content.encode()
+        path.write_bytes(content)
+        created_files[key] = str(path)
+    return created_files
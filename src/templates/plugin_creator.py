@@ -2,9 +2,43 @@
 Plugin Creator - Template-based scaffolding for MCP plugins
 """
 import os
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Tuple
+
+from .files import dump_json, write_files
+
+ToolsKey = Tuple[Tuple[str, str], ...]
+
+# README (install, test) commands per runtime
+_RUNTIME_COMMANDS = {
+    "python": ("pip install -r requirements.txt", "pytest"),
+    "node": ("npm install", "npm test"),
+}
+
+
+def _tools_key(tools: List[Dict]) -> ToolsKey:
+    """Reduce tool definitions to the hashable fields the templates use."""
+    return tuple((tool["name"], tool["description"]) for tool in tools)
+
+
+@lru_cache(maxsize=256)
+def _render_basic_python(name: str, tools_key: ToolsKey) -> str:
+    """Render the basic Python plugin, memoized on name and tool signature."""
+    tools_code = "".join(
+        _TOOL_FRAGMENT.format(tool_name=tool_name, tool_desc=tool_desc)
+        for tool_name, tool_desc in tools_key
+    )
+    call_tool_code = "".join(
+        _CALL_TOOL_FRAGMENT.format(tool_name=tool_name)
+        for tool_name, _ in tools_key
+    )
+
+    return _BASIC_PYTHON_TEMPLATE.format_map({
+        "name": name,
+        "tools_code": tools_code,
+        "call_tool_code": call_tool_code,
+    })
 
 
 class PluginCreator:
@@ -38,45 +72,31 @@ class PluginCreator:
             Dict with created file paths
         """
         plugin_dir = self.plugins_dir / name
-        if plugin_dir.exists():
-            raise ValueError(f"Plugin directory already exists: {plugin_dir}")
-
-        plugin_dir.mkdir(parents=True, exist_ok=True)
-
-        created_files = {}
-
-        # Create manifest
-        manifest_path = plugin_dir / "mcp_server.json"
-        manifest = self._create_manifest(name, description, author, runtime)
-        manifest_path.write_text(json.dumps(manifest, indent=2))
-        created_files["manifest"] = str(manifest_path)
+        tools_key = _tools_key(tools or [])
+
+        # Render everything up front; files are written in one pass below
+        files = {
+            "manifest": (
+                "mcp_server.json",
+                dump_json(self._create_manifest(name, description, author, runtime)),
+            ),
+        }
 
         # Create implementation based on runtime
         if runtime == "python":
-            impl_path = plugin_dir / "server.py"
             if template_type == "basic":
-                content = self._create_basic_python(name, tools or [])
+                content = self._create_basic_python(name, tools_key)
             else:
-                content = self._create_advanced_python(name, tools or [])
-            impl_path.write_text(content)
-            created_files["implementation"] = str(impl_path)
-
-            # Create requirements.txt
-            req_path = plugin_dir / "requirements.txt"
-            req_path.write_text("mcp>=0.9.0\naiohttp>=3.9.0\n")
-            created_files["requirements"] = str(req_path)
+                content = self._create_advanced_python(name, tools_key)
+            files["implementation"] = ("server.py", content)
+            files["requirements"] = ("requirements.txt", b"mcp>=0.9.0\naiohttp>=3.9.0\n")
 
         elif runtime == "node":
-            impl_path = plugin_dir / "index.js"
             if template_type == "basic":
-                content = self._create_basic_node(name, tools or [])
+                content = self._create_basic_node(name, tools_key)
             else:
-                content = self._create_advanced_node(name, tools or [])
-            impl_path.write_text(content)
-            created_files["implementation"] = str(impl_path)
-
-            # Create package.json
-            pkg_path = plugin_dir / "package.json"
+                content = self._create_advanced_node(name, tools_key)
+            files["implementation"] = ("index.js", content)
             pkg = {
                 "name": name,
                 "version": "1.0.0",
@@ -86,15 +106,11 @@ class PluginCreator:
                     "@modelcontextprotocol/sdk": "^0.5.0"
                 }
             }
-            pkg_path.write_text(json.dumps(pkg, indent=2))
-            created_files["package"] = str(pkg_path)
+            files["package"] = ("package.json", dump_json(pkg))
 
-        # Create README
-        readme_path = plugin_dir / "README.md"
-        readme_path.write_text(self._create_readme(name, description, author, runtime))
-        created_files["readme"] = str(readme_path)
+        files["readme"] = ("README.md", self._create_readme(name, description, author, runtime))
 
-        return created_files
+        return write_files(plugin_dir, "Plugin directory", files)
 
     def _create_manifest(self, name: str, description: str, author: str, runtime: str) -> Dict:
         """Create plugin manifest."""
@@ -108,13 +124,40 @@ class PluginCreator:
             "dependencies": []
         }
 
-    def _create_basic_python(self, name: str, tools: List[Dict]) -> str:
+    def _create_basic_python(self, name: str, tools_key: ToolsKey) -> str:
         """Create basic Python plugin template."""
-        tools_code = ""
-        for tool in tools:
-            tool_name = tool["name"]
-            tool_desc = tool["description"]
-            tools_code += f'''
+        return _render_basic_python(name, tools_key)
+
+    def _create_advanced_python(self, name: str, tools_key: ToolsKey) -> str:
+        """Create advanced Python plugin template with state management."""
+        return _ADVANCED_PYTHON_TEMPLATE.format_map({"name": name})
+
+    def _create_basic_node(self, name: str, tools_key: ToolsKey) -> str:
+        """Create basic Node.js plugin template."""
+        return _BASIC_NODE_TEMPLATE.format_map({"name": name})
+
+    def _create_advanced_node(self, name: str, tools_key: ToolsKey) -> str:
+        """Create advanced Node.js plugin template."""
+        return _ADVANCED_NODE_TEMPLATE.format_map({"name": name})
+
+    def _create_readme(self, name: str, description: str, author: str, runtime: str) -> str:
+        """Create README template."""
+        install_command, test_command = _RUNTIME_COMMANDS.get(
+            runtime, _RUNTIME_COMMANDS["node"]
+        )
+        return _README_TEMPLATE.format_map({
+            "name": name,
+            "description": description,
+            "author": author,
+            "install_command": install_command,
+            "test_command": test_command,
+        })
+
+
+# Templates below are str.format_map() patterns: literal braces are doubled,
+# {placeholders} are filled by the _create_* methods above.
+
+_TOOL_FRAGMENT = '''
         Tool(
             name="{tool_name}",
             description="{tool_desc}",
@@ -127,17 +170,14 @@ class PluginCreator:
             }}
         ),'''
 
-        call_tool_code = ""
-        for tool in tools:
-            tool_name = tool["name"]
-            call_tool_code += f'''
+_CALL_TOOL_FRAGMENT = '''
     if name == "{tool_name}":
         param = arguments["param"]
         result = f"{{param}} processed by {tool_name}"
         return [TextContent(type="text", text=result)]
     '''
 
-        return f'''"""
+_BASIC_PYTHON_TEMPLATE = '''"""
 {name} - MCP Plugin
 """
 from mcp.server import Server
@@ -163,9 +203,8 @@ if __name__ == "__main__":
     asyncio.run(server.run())
 '''
 
-    def _create_advanced_python(self, name: str, tools: List[Dict]) -> str:
-        """Create advanced Python plugin template with state management."""
-        return f'''"""
+
+_ADVANCED_PYTHON_TEMPLATE = '''"""
 {name} - Advanced MCP Plugin with State Management
 """
 from mcp.server import Server
@@ -265,9 +304,8 @@ if __name__ == "__main__":
     asyncio.run(main())
 '''
 
-    def _create_basic_node(self, name: str, tools: List[Dict]) -> str:
-        """Create basic Node.js plugin template."""
-        return f'''/**
+
+_BASIC_NODE_TEMPLATE = '''/**
  * {name} - MCP Plugin (Node.js)
  */
 import {{ Server }} from '@modelcontextprotocol/sdk/server/index.js';
@@ -326,9 +364,8 @@ const transport = new StdioServerTransport();
 await server.connect(transport);
 '''
 
-    def _create_advanced_node(self, name: str, tools: List[Dict]) -> str:
-        """Create advanced Node.js plugin template."""
-        return f'''/**
+
+_ADVANCED_NODE_TEMPLATE = '''/**
  * {name} - Advanced MCP Plugin with State (Node.js)
  */
 import {{ Server }} from '@modelcontextprotocol/sdk/server/index.js';
@@ -442,9 +479,8 @@ process.on('SIGINT', async () => {{
 }});
 '''
 
-    def _create_readme(self, name: str, description: str, author: str, runtime: str) -> str:
-        """Create README template."""
-        return f'''# {name}
+
+_README_TEMPLATE = '''# {name}
 
 {description}
 
@@ -457,7 +493,7 @@ process.on('SIGINT', async () => {{
 ```bash
 cd ~/.dev-orchestrator/plugins/{name}
 
-{"pip install -r requirements.txt" if runtime == "python" else "npm install"}
+{install_command}
 ```
 
 ## Usage
@@ -471,7 +507,7 @@ This plugin provides the following tools:
 ### Running Tests
 
 ```bash
-{"pytest" if runtime == "python" else "npm test"}
+{test_command}
 ```
 
 ### Contributing
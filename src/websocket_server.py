@@ -6,17 +6,33 @@ from typing import Optional
 import websockets
 from websockets import serve, ConnectionClosed
 
-from .state import get_state_manager
+from .state import decode_message, encode_message, get_state_manager
 from .config import get_config
 from .executor import ShellExecutor
 from .nlp_service import get_nlp_service
 from .workspace_manager import WorkspaceManager
 from .plugins import get_plugin_manager
 from .plugins.detector import PluginDetector
-from .plugins.health_monitor import PluginHealthMonitor
+from .plugins.health_monitor import get_health_monitor
 from .templates.extension_creator import ExtensionCreator
 from datetime import datetime
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# Replies with no per-request fields, encoded once
+_PONG_FRAME = encode_message({"type": "pong"})
+_BAD_JSON_FRAME = encode_message({"error": "Invalid JSON"})
+
+
+async def _send_json(websocket, payload: dict) -> None:
+    """Encode a reply once and send it as a text frame."""
+    await websocket.send(encode_message(payload), text=True)
+
 
 class WebSocketServer:
     """WebSocket server for dashboard communication."""
@@ -31,535 +47,600 @@ class WebSocketServer:
         config = get_config()
         self.executor = ShellExecutor(
             guardrails=config.guardrails,
-            log_handler=lambda level, msg: asyncio.create_task(
-                self.state_manager.log(level, msg, "websocket-executor")
+            log_handler=lambda level, msg: self.state_manager.log_nowait(
+                level, msg, "websocket-executor"
             )
         )
 
         # Create workspace manager
         self.workspace_manager = WorkspaceManager()
 
+        # Looked up once rather than per approve/reject message; imported
+        # here instead of at module level to avoid a circular import
+        from .server import resolve_approval
+        self._resolve_approval = resolve_approval
+
+        # Message type -> handler, built once instead of an if/elif ladder
+        self._handlers = {
+            "get_state": self._handle_get_state,
+            "approve": self._handle_approve,
+            "reject": self._handle_reject,
+            "run_command": self._handle_run_command,
+            "stop_service": self._handle_stop_service,
+            "switch_project": self._handle_switch_project,
+            "clear_logs": self._handle_clear_logs,
+            "save_command": self._handle_save_command,
+            "delete_saved_command": self._handle_delete_saved_command,
+            "list_plugins": self._handle_list_plugins,
+            "install_plugin": self._handle_install_plugin,
+            "uninstall_plugin": self._handle_uninstall_plugin,
+            "toggle_plugin": self._handle_toggle_plugin,
+            "toggle_plugin_tool": self._handle_toggle_plugin_tool,
+            "detect_plugins": self._handle_detect_plugins,
+            "check_plugin_health": self._handle_check_plugin_health,
+            "check_all_plugins_health": self._handle_check_all_plugins_health,
+            "configure_nlp": self._handle_configure_nlp,
+            "test_nlp_provider": self._handle_test_nlp_provider,
+            "get_nlp_config": self._handle_get_nlp_config,
+            "get_nlp_status": self._handle_get_nlp_status,
+            "execute_tool": self._handle_execute_tool,
+            "ping": self._handle_ping,
+        }
+
     async def handler(self, websocket):
         """Handle WebSocket connections."""
         # Check client count and log warning if too many
         client_count = len(self.state_manager.clients)
         if client_count >= 5:
-            await self.state_manager.log(
+            self.state_manager.log_nowait(
                 "WARN",
                 f"High number of WebSocket clients connected: {client_count}. Consider closing unused browser tabs."
             )
 
         await self.state_manager.add_client(websocket)
-        await self.state_manager.log("INFO", f"Dashboard client connected from {websocket.remote_address} (total: {len(self.state_manager.clients)})")
+        self.state_manager.log_nowait("INFO", f"Dashboard client connected from {websocket.remote_address} (total: {len(self.state_manager.clients)})")
 
         try:
-            async for message in websocket:
+            while True:
+                # Raw bytes skip the UTF-8 decode; the JSON parser validates it
+                message = await websocket.recv(decode=False)
                 try:
-                    data = json.loads(message)
+                    data = decode_message(message)
                     await self.handle_message(websocket, data)
                 except json.JSONDecodeError:
-                    await websocket.send(json.dumps({"error": "Invalid JSON"}))
+                    await websocket.send(_BAD_JSON_FRAME, text=True)
         except ConnectionClosed:
             pass
         finally:
             self.state_manager.remove_client(websocket)
-            await self.state_manager.log("INFO", f"Dashboard client disconnected (remaining: {len(self.state_manager.clients)})")
+            self.state_manager.log_nowait("INFO", f"Dashboard client disconnected (remaining: {len(self.state_manager.clients)})")
 
     async def handle_message(self, websocket, data: dict):
         """Handle incoming WebSocket messages."""
         msg_type = data.get("type")
+        handler = self._handlers.get(msg_type)
+        if handler is None:
+            return
 
         try:
-            await self._handle_message_internal(websocket, data, msg_type)
+            await handler(websocket, data)
         except Exception as e:
             await self.state_manager.log("ERROR", f"Error handling message type '{msg_type}': {str(e)}")
             import traceback
             traceback.print_exc()
 
-    async def _handle_message_internal(self, websocket, data: dict, msg_type: str):
-        """Internal message handler with error handling."""
-        if msg_type == "get_state":
-            # Fetch workspace data
+    async def _handle_get_state(self, websocket, data: dict):
+        """Handle the "get_state" message."""
+        # Fetch workspace data
+        try:
+            workspace_summary = self.workspace_manager.get_workspace_summary()
+            await self.state_manager.set_workspace(workspace_summary)
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to get workspace: {e}")
+
+        # Clients that already hold a revision only need what changed
+        since = data.get("since")
+        if not isinstance(since, int):
+            since = None
+        epoch = data.get("epoch")
+        if not isinstance(epoch, str):
+            epoch = None
+        await self.state_manager.send_state(websocket, since, epoch)
+
+    async def _handle_approve(self, websocket, data: dict):
+        """Handle the "approve" message."""
+        approval_id = data.get("approval_id")
+        if self._resolve_approval(approval_id, True):
+            await _send_json(websocket, {"type": "approved", "id": approval_id})
+
+    async def _handle_reject(self, websocket, data: dict):
+        """Handle the "reject" message."""
+        approval_id = data.get("approval_id")
+        if self._resolve_approval(approval_id, False):
+            await _send_json(websocket, {"type": "rejected", "id": approval_id})
+
+    async def _handle_run_command(self, websocket, data: dict):
+        """Handle the "run_command" message."""
+        command = data.get("command")
+        cwd = data.get("cwd", ".")
+        use_nlp = data.get("use_nlp", False)
+
+        if command:
             try:
-                workspace_summary = self.workspace_manager.get_workspace_summary()
-                await self.state_manager.set_workspace(workspace_summary)
-            except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to get workspace: {e}")
-
-            state_dict = await self.state_manager._get_state_dict()
-            await websocket.send(json.dumps({
-                "type": "state",
-                "data": state_dict
-            }))
-
-        elif msg_type == "approve":
-            approval_id = data.get("approval_id")
-            # Import here to avoid circular import
-            from .server import approval_futures
-            if approval_id in approval_futures:
-                approval_futures[approval_id].set_result(True)
-                await websocket.send(json.dumps({"type": "approved", "id": approval_id}))
-
-        elif msg_type == "reject":
-            approval_id = data.get("approval_id")
-            from .server import approval_futures
-            if approval_id in approval_futures:
-                approval_futures[approval_id].set_result(False)
-                await websocket.send(json.dumps({"type": "rejected", "id": approval_id}))
-
-        elif msg_type == "run_command":
-            command = data.get("command")
-            cwd = data.get("cwd", ".")
-            use_nlp = data.get("use_nlp", False)
-
-            if command:
-                try:
-                    # If NLP is enabled, translate natural language to command
-                    if use_nlp:
-                        nlp_service = get_nlp_service()
-                        intent = await nlp_service.parse_natural_language(command, cwd)
-
-                        await self.state_manager.log(
-                            "INFO",
-                            f"NLP: '{command}' -> {intent.type} (confidence: {intent.confidence:.2f})"
-                        )
-
-                        # Handle different intent types
-                        if intent.type == "shell":
-                            # Execute as shell command
-                            command = intent.command
-                        elif intent.type in ["detect_project", "start_service", "stop_service", "git_status", "list_services", "run_tests", "check_ports"]:
-                            # MCP tool - inform user to use MCP server
-                            await websocket.send(json.dumps({
-                                "type": "command_result",
-                                "status": "info",
-                                "exit_code": 0,
-                                "stdout": f"Detected MCP tool request: {intent.type}\nParameters: {intent.parameters}\nPlease use the MCP server to execute this tool.",
-                                "stderr": ""
-                            }))
-                            return
-                        else:
-                            # Unknown intent - fallback to shell
-                            await self.state_manager.log("WARN", f"Unknown intent type: {intent.type}, treating as shell")
-                            command = intent.command
-
-                    # Execute command
-                    result = await self.executor.execute(command, cwd)
-                    await self.state_manager.add_command({
-                        "command": command,
-                        "cwd": cwd,
-                        "status": result.status.value,
-                        "exit_code": result.exit_code,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                    await websocket.send(json.dumps({
-                        "type": "command_result",
-                        "status": result.status.value,
-                        "exit_code": result.exit_code,
-                        "stdout": result.stdout[:1000] if result.stdout else "",
-                        "stderr": result.stderr[:500] if result.stderr else ""
-                    }))
-                except Exception as e:
-                    await self.state_manager.log("ERROR", f"Command execution error: {str(e)}")
-                    await websocket.send(json.dumps({
-                        "type": "command_error",
-                        "error": str(e)
-                    }))
-
-        elif msg_type == "stop_service":
-            service_id = data.get("service_id")
-            if service_id:
-                success = self.executor.process_manager.stop_process(service_id)
-                if success:
-                    await self.state_manager.remove_service(service_id)
-                await websocket.send(json.dumps({
-                    "type": "service_stopped",
-                    "success": success,
-                    "service_id": service_id
-                }))
-
-        elif msg_type == "switch_project":
-            repo_name = data.get("repo_name")
-            if repo_name:
-                try:
-                    # Find the repo
-                    repo = self.workspace_manager.find_repo_by_name(repo_name)
-                    if repo:
-                        # Import here to avoid issues
-                        import os
-                        from .detector import ProjectDetector
-
-                        # Change directory
-                        os.chdir(repo.path)
-
-                        # Detect project
-                        detector = ProjectDetector(repo.path)
-                        profile = detector.detect()
-
-                        # Update state
-                        await self.state_manager.set_project(profile)
-                        await self.state_manager.log("INFO", f"Switched to project: {repo_name}")
-
-                        await websocket.send(json.dumps({
-                            "type": "project_switched",
-                            "success": True,
-                            "project": profile.model_dump(mode='json')
-                        }))
+                # If NLP is enabled, translate natural language to command
+                if use_nlp:
+                    nlp_service = get_nlp_service()
+                    intent = await nlp_service.parse_natural_language(command, cwd)
+
+                    await self.state_manager.log(
+                        "INFO",
+                        f"NLP: '{command}' -> {intent.type} (confidence: {intent.confidence:.2f})"
+                    )
+
+                    # Handle different intent types
+                    if intent.type == "shell":
+                        # Execute as shell command
+                        command = intent.command
+                    elif intent.type in ["detect_project", "start_service", "stop_service", "git_status", "list_services", "run_tests", "check_ports"]:
+                        # MCP tool - inform user to use MCP server
+                        await _send_json(websocket, {
+                            "type": "command_result",
+                            "status": "info",
+                            "exit_code": 0,
+                            "stdout": f"Detected MCP tool request: {intent.type}\nParameters: {intent.parameters}\nPlease use the MCP server to execute this tool.",
+                            "stderr": ""
+                        })
+                        return
                     else:
-                        await websocket.send(json.dumps({
-                            "type": "project_switched",
-                            "success": False,
-                            "error": f"Repository '{repo_name}' not found"
-                        }))
-                except Exception as e:
-                    await self.state_manager.log("ERROR", f"Failed to switch project: {str(e)}")
-                    await websocket.send(json.dumps({
-                        "type": "project_switched",
-                        "success": False,
-                        "error": str(e)
-                    }))
-
-        elif msg_type == "clear_logs":
-            await self.state_manager.clear_logs()
-            await websocket.send(json.dumps({"type": "logs_cleared", "success": True}))
-
-        elif msg_type == "save_command":
-            command = data.get("command")
-            cwd = data.get("cwd", ".")
-            name = data.get("name")
-            description = data.get("description")
-
-            if command and name:
-                import uuid
-                command_data = {
-                    "id": str(uuid.uuid4()),
-                    "name": name,
+                        # Unknown intent - fallback to shell
+                        await self.state_manager.log("WARN", f"Unknown intent type: {intent.type}, treating as shell")
+                        command = intent.command
+
+                # Execute command
+                result = await self.executor.execute(command, cwd)
+                await self.state_manager.add_command({
                     "command": command,
                     "cwd": cwd,
-                    "description": description,
-                    "created_at": datetime.now().isoformat()
-                }
-                await self.state_manager.add_saved_command(command_data)
-                await websocket.send(json.dumps({
-                    "type": "command_saved",
-                    "success": True,
-                    "command": command_data
-                }))
-
-        elif msg_type == "delete_saved_command":
-            command_id = data.get("id")
-            if command_id:
-                await self.state_manager.remove_saved_command(command_id)
-                await websocket.send(json.dumps({
-                    "type": "command_deleted",
-                    "success": True,
-                    "id": command_id
-                }))
-
-        elif msg_type == "list_plugins":
-            plugin_manager = get_plugin_manager()
-            plugins = await plugin_manager.list_installed()
-            await websocket.send(json.dumps({
-                "type": "plugins",
-                "data": [p.model_dump(mode="json") for p in plugins]
-            }))
-
-        elif msg_type == "install_plugin":
-            git_url = data.get("git_url")
-            if git_url:
-                plugin_manager = get_plugin_manager()
-                result = await plugin_manager.install(git_url)
-                await websocket.send(json.dumps({
-                    "type": "plugin_installed",
-                    "success": result.success,
-                    "message": result.message,
-                    "error": result.error
-                }))
-                if result.success:
-                    await self.state_manager.log("INFO", f"Plugin installed: {result.message}")
-
-        elif msg_type == "uninstall_plugin":
-            plugin_id = data.get("plugin_id")
-            if plugin_id:
-                plugin_manager = get_plugin_manager()
-                result = await plugin_manager.uninstall(plugin_id)
-                await websocket.send(json.dumps({
-                    "type": "plugin_uninstalled",
-                    "success": result.success,
-                    "message": result.message
-                }))
-                if result.success:
-                    await self.state_manager.log("INFO", f"Plugin uninstalled: {result.message}")
-
-        elif msg_type == "toggle_plugin":
-            plugin_id = data.get("plugin_id")
-            enabled = data.get("enabled")
-            if plugin_id is not None and enabled is not None:
-                plugin_manager = get_plugin_manager()
-                success = await plugin_manager.toggle(plugin_id, enabled)
-                await websocket.send(json.dumps({
-                    "type": "plugin_toggled",
-                    "success": success
-                }))
-                if success:
-                    await self.state_manager.log("INFO", f"Plugin {'enabled' if enabled else 'disabled'}")
-
-        elif msg_type == "toggle_plugin_tool":
-            plugin_id = data.get("plugin_id")
-            tool_name = data.get("tool_name")
-            enabled = data.get("enabled")
-            if plugin_id and tool_name and enabled is not None:
-                plugin_manager = get_plugin_manager()
-                success = await plugin_manager.toggle_tool(plugin_id, tool_name, enabled)
-                await websocket.send(json.dumps({
-                    "type": "plugin_tool_toggled",
-                    "success": success
-                }))
-                if success:
-                    await self.state_manager.log("INFO", f"Tool {tool_name} {'enabled' if enabled else 'disabled'}")
-
-        elif msg_type == "detect_plugins":
-            try:
-                detector = PluginDetector()
-                plugins = await detector.detect_installed_plugins()
-                await self.state_manager.log("INFO", f"Detected {len(plugins)} installed MCP servers")
-                await websocket.send(json.dumps({
-                    "type": "detected_plugins",
-                    "data": plugins
-                }))
+                    "status": result.status.value,
+                    "exit_code": result.exit_code,
+                    "timestamp": datetime.now().isoformat()
+                })
+                await _send_json(websocket, {
+                    "type": "command_result",
+                    "status": result.status.value,
+                    "exit_code": result.exit_code,
+                    "stdout": result.stdout[:1000] if result.stdout else "",
+                    "stderr": result.stderr[:500] if result.stderr else ""
+                })
             except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to detect plugins: {str(e)}")
-                await websocket.send(json.dumps({
-                    "type": "detected_plugins",
-                    "data": [],
+                await self.state_manager.log("ERROR", f"Command execution error: {str(e)}")
+                await _send_json(websocket, {
+                    "type": "command_error",
                     "error": str(e)
-                }))
+                })
+
+    async def _handle_stop_service(self, websocket, data: dict):
+        """Handle the "stop_service" message."""
+        service_id = data.get("service_id")
+        if service_id:
+            success = self.executor.process_manager.stop_process(service_id)
+            if success:
+                await self.state_manager.remove_service(service_id)
+            await _send_json(websocket, {
+                "type": "service_stopped",
+                "success": success,
+                "service_id": service_id
+            })
+
+    async def _handle_switch_project(self, websocket, data: dict):
+        """Handle the "switch_project" message."""
+        repo_name = data.get("repo_name")
+        if repo_name:
+            try:
+                # Find the repo
+                repo = self.workspace_manager.find_repo_by_name(repo_name)
+                if repo:
+                    # Import here to avoid issues
+                    import os
+                    from .detector import ProjectDetector
 
-        elif msg_type == "check_plugin_health":
-            plugin_id = data.get("plugin_id")
-            if plugin_id:
-                try:
-                    detector = PluginDetector()
-                    plugins = await detector.detect_installed_plugins()
-                    plugin_info = next((p for p in plugins if p['id'] == plugin_id), None)
-
-                    if plugin_info:
-                        monitor = PluginHealthMonitor()
-                        health = await monitor.check_plugin_health(plugin_info)
-                        await self.state_manager.log("INFO", f"Health check for {plugin_id}: {health.status.value}")
-                        await websocket.send(json.dumps({
-                            "type": "plugin_health",
-                            "data": health.to_dict()
-                        }))
-                    else:
-                        await websocket.send(json.dumps({
-                            "type": "plugin_health",
-                            "data": None,
-                            "error": f"Plugin '{plugin_id}' not found"
-                        }))
-                except Exception as e:
-                    await self.state_manager.log("ERROR", f"Failed to check plugin health: {str(e)}")
-                    await websocket.send(json.dumps({
-                        "type": "plugin_health",
-                        "data": None,
-                        "error": str(e)
-                    }))
+                    # Change directory
+                    os.chdir(repo.path)
 
-        elif msg_type == "check_all_plugins_health":
-            try:
-                detector = PluginDetector()
-                plugins = await detector.detect_installed_plugins()
-                monitor = PluginHealthMonitor()
-                health_checks = await monitor.check_all_plugins_health(plugins)
-
-                health_data = [health.to_dict() for health in health_checks]
-                await self.state_manager.log("INFO", f"Checked health of {len(health_data)} plugins")
-                await websocket.send(json.dumps({
-                    "type": "all_plugins_health",
-                    "data": health_data
-                }))
-            except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to check all plugins health: {str(e)}")
-                await websocket.send(json.dumps({
-                    "type": "all_plugins_health",
-                    "data": [],
-                    "error": str(e)
-                }))
+                    # Detect project
+                    detector = ProjectDetector(repo.path)
+                    profile = detector.detect()
 
-        elif msg_type == "configure_nlp":
-            # Configure NLP settings
-            config = data.get("config")
-            if config:
-                try:
-                    nlp_service = get_nlp_service()
-                    await nlp_service.update_config(config)
-                    await self.state_manager.log("INFO", f"NLP configured with provider: {config.get('primary_provider')}")
-                    await websocket.send(json.dumps({
-                        "type": "nlp_configured",
-                        "success": True
-                    }))
-                except Exception as e:
-                    await self.state_manager.log("ERROR", f"Failed to configure NLP: {str(e)}")
-                    await websocket.send(json.dumps({
-                        "type": "nlp_configured",
-                        "success": False,
-                        "error": str(e)
-                    }))
+                    # Update state
+                    await self.state_manager.set_project(profile)
+                    await self.state_manager.log("INFO", f"Switched to project: {repo_name}")
 
-        elif msg_type == "test_nlp_provider":
-            # Test NLP provider connection
-            provider_name = data.get("provider")
-            try:
-                nlp_service = get_nlp_service()
-                test_results = await nlp_service.test_connection()
-
-                if provider_name:
-                    # Test specific provider
-                    result = test_results.get(provider_name, False)
-                    await websocket.send(json.dumps({
-                        "type": "nlp_provider_tested",
-                        "provider": provider_name,
-                        "success": result
-                    }))
+                    await _send_json(websocket, {
+                        "type": "project_switched",
+                        "success": True,
+                        "project": profile.model_dump(mode='json')
+                    })
                 else:
-                    # Test all providers
-                    await websocket.send(json.dumps({
-                        "type": "nlp_providers_tested",
-                        "results": test_results
-                    }))
+                    await _send_json(websocket, {
+                        "type": "project_switched",
+                        "success": False,
+                        "error": f"Repository '{repo_name}' not found"
+                    })
             except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to test NLP provider: {str(e)}")
-                await websocket.send(json.dumps({
-                    "type": "nlp_provider_tested",
+                await self.state_manager.log("ERROR", f"Failed to switch project: {str(e)}")
+                await _send_json(websocket, {
+                    "type": "project_switched",
                     "success": False,
                     "error": str(e)
-                }))
-
-        elif msg_type == "get_nlp_config":
-            # Get current NLP configuration
+                })
+
+    async def _handle_clear_logs(self, websocket, data: dict):
+        """Handle the "clear_logs" message."""
+        await self.state_manager.clear_logs()
+        await _send_json(websocket, {"type": "logs_cleared", "success": True})
+
+    async def _handle_save_command(self, websocket, data: dict):
+        """Handle the "save_command" message."""
+        command = data.get("command")
+        cwd = data.get("cwd", ".")
+        name = data.get("name")
+        description = data.get("description")
+
+        if command and name:
+            import uuid
+            command_data = {
+                "id": str(uuid.uuid4()),
+                "name": name,
+                "command": command,
+                "cwd": cwd,
+                "description": description,
+                "created_at": datetime.now().isoformat()
+            }
+            await self.state_manager.add_saved_command(command_data)
+            await _send_json(websocket, {
+                "type": "command_saved",
+                "success": True,
+                "command": command_data
+            })
+
+    async def _handle_delete_saved_command(self, websocket, data: dict):
+        """Handle the "delete_saved_command" message."""
+        command_id = data.get("id")
+        if command_id:
+            await self.state_manager.remove_saved_command(command_id)
+            await _send_json(websocket, {
+                "type": "command_deleted",
+                "success": True,
+                "id": command_id
+            })
+
+    async def _handle_list_plugins(self, websocket, data: dict):
+        """Handle the "list_plugins" message."""
+        plugin_manager = get_plugin_manager()
+        plugins = await plugin_manager.list_installed()
+        await _send_json(websocket, {
+            "type": "plugins",
+            "data": [p.model_dump(mode="json") for p in plugins]
+        })
+
+    async def _handle_install_plugin(self, websocket, data: dict):
+        """Handle the "install_plugin" message."""
+        git_url = data.get("git_url")
+        if git_url:
+            plugin_manager = get_plugin_manager()
+            result = await plugin_manager.install(git_url)
+            await _send_json(websocket, {
+                "type": "plugin_installed",
+                "success": result.success,
+                "message": result.message,
+                "error": result.error
+            })
+            if result.success:
+                await self.state_manager.log("INFO", f"Plugin installed: {result.message}")
+
+    async def _handle_uninstall_plugin(self, websocket, data: dict):
+        """Handle the "uninstall_plugin" message."""
+        plugin_id = data.get("plugin_id")
+        if plugin_id:
+            plugin_manager = get_plugin_manager()
+            result = await plugin_manager.uninstall(plugin_id)
+            await _send_json(websocket, {
+                "type": "plugin_uninstalled",
+                "success": result.success,
+                "message": result.message
+            })
+            if result.success:
+                await self.state_manager.log("INFO", f"Plugin uninstalled: {result.message}")
+
+    async def _handle_toggle_plugin(self, websocket, data: dict):
+        """Handle the "toggle_plugin" message."""
+        plugin_id = data.get("plugin_id")
+        enabled = data.get("enabled")
+        if plugin_id is not None and enabled is not None:
+            plugin_manager = get_plugin_manager()
+            success = await plugin_manager.toggle(plugin_id, enabled)
+            await _send_json(websocket, {
+                "type": "plugin_toggled",
+                "success": success
+            })
+            if success:
+                await self.state_manager.log("INFO", f"Plugin {'enabled' if enabled else 'disabled'}")
+
+    async def _handle_toggle_plugin_tool(self, websocket, data: dict):
+        """Handle the "toggle_plugin_tool" message."""
+        plugin_id = data.get("plugin_id")
+        tool_name = data.get("tool_name")
+        enabled = data.get("enabled")
+        if plugin_id and tool_name and enabled is not None:
+            plugin_manager = get_plugin_manager()
+            success = await plugin_manager.toggle_tool(plugin_id, tool_name, enabled)
+            await _send_json(websocket, {
+                "type": "plugin_tool_toggled",
+                "success": success
+            })
+            if success:
+                await self.state_manager.log("INFO", f"Tool {tool_name} {'enabled' if enabled else 'disabled'}")
+
+    async def _handle_detect_plugins(self, websocket, data: dict):
+        """Handle the "detect_plugins" message."""
+        try:
+            detector = PluginDetector()
+            plugins = await detector.detect_installed_plugins()
+            await self.state_manager.log("INFO", f"Detected {len(plugins)} installed MCP servers")
+            await _send_json(websocket, {
+                "type": "detected_plugins",
+                "data": plugins
+            })
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to detect plugins: {str(e)}")
+            await _send_json(websocket, {
+                "type": "detected_plugins",
+                "data": [],
+                "error": str(e)
+            })
+
+    async def _handle_check_plugin_health(self, websocket, data: dict):
+        """Handle the "check_plugin_health" message."""
+        plugin_id = data.get("plugin_id")
+        if plugin_id:
             try:
-                nlp_service = get_nlp_service()
-                config = nlp_service.get_config()
-                await websocket.send(json.dumps({
-                    "type": "nlp_config",
-                    "config": config
-                }))
+                detector = PluginDetector()
+                plugins = await detector.detect_installed_plugins()
+                plugin_info = next((p for p in plugins if p['id'] == plugin_id), None)
+
+                if plugin_info:
+                    monitor = get_health_monitor()
+                    health = await monitor.check_plugin_health(plugin_info)
+                    await self.state_manager.log("INFO", f"Health check for {plugin_id}: {health.status.value}")
+                    await _send_json(websocket, {
+                        "type": "plugin_health",
+                        "data": health.to_dict()
+                    })
+                else:
+                    await _send_json(websocket, {
+                        "type": "plugin_health",
+                        "data": None,
+                        "error": f"Plugin '{plugin_id}' not found"
+                    })
             except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to get NLP config: {str(e)}")
-                await websocket.send(json.dumps({
-                    "type": "nlp_config",
+                await self.state_manager.log("ERROR", f"Failed to check plugin health: {str(e)}")
+                await _send_json(websocket, {
+                    "type": "plugin_health",
+                    "data": None,
                     "error": str(e)
-                }))
+                })
 
-        elif msg_type == "get_nlp_status":
-            # Get NLP providers status
+    async def _handle_check_all_plugins_health(self, websocket, data: dict):
+        """Handle the "check_all_plugins_health" message."""
+        try:
+            detector = PluginDetector()
+            plugins = await detector.detect_installed_plugins()
+            monitor = get_health_monitor()
+            health_checks = await monitor.check_all_plugins_health(plugins)
+
+            health_data = [health.to_dict() for health in health_checks]
+            await self.state_manager.log("INFO", f"Checked health of {len(health_data)} plugins")
+            await _send_json(websocket, {
+                "type": "all_plugins_health",
+                "data": health_data
+            })
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to check all plugins health: {str(e)}")
+            await _send_json(websocket, {
+                "type": "all_plugins_health",
+                "data": [],
+                "error": str(e)
+            })
+
+    async def _handle_configure_nlp(self, websocket, data: dict):
+        """Handle the "configure_nlp" message."""
+        # Configure NLP settings
+        config = data.get("config")
+        if config:
             try:
                 nlp_service = get_nlp_service()
-                status = nlp_service.get_status()
-                await websocket.send(json.dumps({
-                    "type": "nlp_status",
-                    "status": status
-                }))
+                await nlp_service.update_config(config)
+                await self.state_manager.log("INFO", f"NLP configured with provider: {config.get('primary_provider')}")
+                await _send_json(websocket, {
+                    "type": "nlp_configured",
+                    "success": True
+                })
             except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to get NLP status: {str(e)}")
-                await websocket.send(json.dumps({
-                    "type": "nlp_status",
+                await self.state_manager.log("ERROR", f"Failed to configure NLP: {str(e)}")
+                await _send_json(websocket, {
+                    "type": "nlp_configured",
+                    "success": False,
                     "error": str(e)
-                }))
+                })
 
-        elif msg_type == "execute_tool":
-            # Execute MCP tools (extensions creation, etc.)
-            tool_name = data.get("tool")
-            arguments = data.get("arguments", {})
-
-            if not tool_name:
-                await websocket.send(json.dumps({
-                    "type": "tool_result",
-                    "success": False,
-                    "error": "Tool name is required"
-                }))
-                return
+    async def _handle_test_nlp_provider(self, websocket, data: dict):
+        """Handle the "test_nlp_provider" message."""
+        # Test NLP provider connection
+        provider_name = data.get("provider")
+        try:
+            nlp_service = get_nlp_service()
+            test_results = await nlp_service.test_connection()
 
-            try:
-                extension_creator = ExtensionCreator()
-
-                if tool_name == "create_widget":
-                    result = extension_creator.create_widget(
-                        name=arguments["name"],
-                        description=arguments.get("description", "A custom widget"),
-                        author=arguments.get("author", "Anonymous"),
-                        category=arguments.get("category", "utility"),
-                        template_type=arguments.get("template_type", "basic"),
-                    )
-                    await self.state_manager.log("INFO", f"Created widget: {arguments['name']}")
-                    await websocket.send(json.dumps({
-                        "type": "tool_result",
-                        "success": True,
-                        "data": result
-                    }))
-
-                elif tool_name == "create_workflow":
-                    result = extension_creator.create_workflow(
-                        name=arguments["name"],
-                        description=arguments.get("description", "A custom workflow"),
-                        author=arguments.get("author", "User"),
-                        version=arguments.get("version", "1.0.0"),
-                    )
-                    await self.state_manager.log("INFO", f"Created workflow: {arguments['name']}")
-                    await websocket.send(json.dumps({
-                        "type": "tool_result",
-                        "success": True,
-                        "data": {"workflow_path": result}
-                    }))
-
-                elif tool_name == "create_integration":
-                    result = extension_creator.create_integration(
-                        name=arguments["name"],
-                        service_type=arguments.get("service_type", "custom"),
-                        config=arguments.get("config", {}),
-                    )
-                    await self.state_manager.log("INFO", f"Created integration: {arguments['name']}")
-                    await websocket.send(json.dumps({
-                        "type": "tool_result",
-                        "success": True,
-                        "data": result
-                    }))
+            if provider_name:
+                # Test specific provider
+                result = test_results.get(provider_name, False)
+                await _send_json(websocket, {
+                    "type": "nlp_provider_tested",
+                    "provider": provider_name,
+                    "success": result
+                })
+            else:
+                # Test all providers
+                await _send_json(websocket, {
+                    "type": "nlp_providers_tested",
+                    "results": test_results
+                })
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to test NLP provider: {str(e)}")
+            await _send_json(websocket, {
+                "type": "nlp_provider_tested",
+                "success": False,
+                "error": str(e)
+            })
+
+    async def _handle_get_nlp_config(self, websocket, data: dict):
+        """Handle the "get_nlp_config" message."""
+        # Get current NLP configuration
+        try:
+            nlp_service = get_nlp_service()
+            config = nlp_service.get_config()
+            await _send_json(websocket, {
+                "type": "nlp_config",
+                "config": config
+            })
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to get NLP config: {str(e)}")
+            await _send_json(websocket, {
+                "type": "nlp_config",
+                "error": str(e)
+            })
+
+    async def _handle_get_nlp_status(self, websocket, data: dict):
+        """Handle the "get_nlp_status" message."""
+        # Get NLP providers status
+        try:
+            nlp_service = get_nlp_service()
+            status = nlp_service.get_status()
+            await _send_json(websocket, {
+                "type": "nlp_status",
+                "status": status
+            })
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to get NLP status: {str(e)}")
+            await _send_json(websocket, {
+                "type": "nlp_status",
+                "error": str(e)
+            })
+
+    async def _handle_execute_tool(self, websocket, data: dict):
+        """Handle the "execute_tool" message."""
+        # Execute MCP tools (extensions creation, etc.)
+        tool_name = data.get("tool")
+        arguments = data.get("arguments", {})
+
+        if not tool_name:
+            await _send_json(websocket, {
+                "type": "tool_result",
+                "success": False,
+                "error": "Tool name is required"
+            })
+            return
 
-                else:
-                    await websocket.send(json.dumps({
-                        "type": "tool_result",
-                        "success": False,
-                        "error": f"Unknown tool: {tool_name}"
-                    }))
+        try:
+            extension_creator = ExtensionCreator()
+
+            if tool_name == "create_widget":
+                result = await asyncio.to_thread(
+                    extension_creator.create_widget,
+                    name=arguments["name"],
+                    description=arguments.get("description", "A custom widget"),
+                    author=arguments.get("author", "Anonymous"),
+                    category=arguments.get("category", "utility"),
+                    template_type=arguments.get("template_type", "basic"),
+                )
+                await self.state_manager.log("INFO", f"Created widget: {arguments['name']}")
+                await _send_json(websocket, {
+                    "type": "tool_result",
+                    "success": True,
+                    "data": result
+                })
+
+            elif tool_name == "create_workflow":
+                result = await asyncio.to_thread(
+                    extension_creator.create_workflow,
+                    name=arguments["name"],
+                    description=arguments.get("description", "A custom workflow"),
+                    author=arguments.get("author", "User"),
+                    version=arguments.get("version", "1.0.0"),
+                )
+                await self.state_manager.log("INFO", f"Created workflow: {arguments['name']}")
+                await _send_json(websocket, {
+                    "type": "tool_result",
+                    "success": True,
+                    "data": {"workflow_path": result}
+                })
+
+            elif tool_name == "create_integration":
+                result = await asyncio.to_thread(
+                    extension_creator.create_integration,
+                    name=arguments["name"],
+                    service_type=arguments.get("service_type", "custom"),
+                    config=arguments.get("config", {}),
+                )
+                await self.state_manager.log("INFO", f"Created integration: {arguments['name']}")
+                await _send_json(websocket, {
+                    "type": "tool_result",
+                    "success": True,
+                    "data": result
+                })
 
-            except Exception as e:
-                await self.state_manager.log("ERROR", f"Failed to execute tool {tool_name}: {str(e)}")
-                await websocket.send(json.dumps({
+            else:
+                await _send_json(websocket, {
                     "type": "tool_result",
                     "success": False,
-                    "error": str(e)
-                }))
+                    "error": f"Unknown tool: {tool_name}"
+                })
+
+        except Exception as e:
+            await self.state_manager.log("ERROR", f"Failed to execute tool {tool_name}: {str(e)}")
+            await _send_json(websocket, {
+                "type": "tool_result",
+                "success": False,
+                "error": str(e)
+            })
+
+    async def _handle_ping(self, websocket, data: dict):
+        """Handle the "ping" message."""
+        await websocket.send(_PONG_FRAME, text=True)
+
+    @staticmethod
+    async def _ping_client(client) -> bool:
+        """Return True if the client answers a ping within five seconds."""
+        pong = await client.ping()
+        await asyncio.wait_for(pong, timeout=5.0)  # Wait for pong response
+        return True
 
-        elif msg_type == "ping":
-            await websocket.send(json.dumps({"type": "pong"}))
-    
     async def cleanup_dead_connections(self):
         """Periodically ping clients and remove dead connections."""
         while True:
             await asyncio.sleep(30)  # Check every 30 seconds
 
-            dead_clients = []
-            for client in list(self.state_manager.clients):
-                try:
-                    # Send ping to check if connection is alive
-                    pong = await asyncio.wait_for(
-                        client.ping(),
-                        timeout=5.0
-                    )
-                    await pong  # Wait for pong response
-                except Exception:
-                    # Connection is dead, mark for removal
-                    dead_clients.append(client)
+            # Ping every client at once so one dead socket's timeout
+            # doesn't delay checking the rest
+            clients = list(self.state_manager.clients)
+            results = await asyncio.gather(
+                *(self._ping_client(client) for client in clients),
+                return_exceptions=True
+            )
+            dead_clients = [
+                client for client, result in zip(clients, results)
+                if result is not True
+            ]
 
             # Remove dead clients
             for client in dead_clients:
@@ -583,6 +664,7 @@ class WebSocketServer:
         if self._server:
             self._server.close()
             await self._server.wait_closed()
+        await get_health_monitor().close()
 
 
 async def run_websocket_server():
@@ -603,4 +685,7 @@ async def run_websocket_server():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_websocket_server())
+    # uvloop isn't available on Windows; fall back to the default loop
+    loop_factory = uvloop.new_event_loop if UVLOOP_AVAILABLE else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(run_websocket_server())
@@ -4,7 +4,7 @@ import os
 import subprocess
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 
 @dataclass
@@ -39,6 +39,8 @@ class WorkspaceManager:
         """
         root = workspace_root if workspace_root is not None else str(Path.cwd().parent)
         self.workspace_root = Path(root).resolve()
+        # max_depth -> (mtime_ns of every directory walked, repo paths found)
+        self._repo_paths_cache: Dict[int, Tuple[Dict[str, int], List[Path]]] = {}
 
     def discover_repos(self, max_depth: int = 2) -> List[RepoInfo]:
         """
@@ -50,13 +52,51 @@ class WorkspaceManager:
         Returns:
             List of RepoInfo objects for discovered repos
         """
-        repos = []
+        # Repo status changes without touching directory mtimes, so only
+        # the walk is cached; git info is always read fresh
+        repos = [self._get_repo_info(path) for path in self._find_repo_paths(max_depth)]
+
+        # Sort by name
+        repos.sort(key=lambda r: r.name)
+        return repos
+
+    def _find_repo_paths(self, max_depth: int) -> List[Path]:
+        """
+        Find git repository directories, reusing the previous walk when no
+        walked directory has changed.
+
+        A directory's mtime changes when entries are added, removed or
+        renamed in it, so comparing the mtimes of every directory the walk
+        listed is enough to tell whether the walk would find the same repos.
+
+        Args:
+            max_depth: Maximum directory depth to search
+
+        Returns:
+            Paths of discovered repositories
+        """
+        cached = self._repo_paths_cache.get(max_depth)
+        if cached is not None:
+            dir_mtimes, repo_paths = cached
+            try:
+                if all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items()):
+                    return repo_paths
+            except OSError:
+                pass
+
+        repo_paths: List[Path] = []
+        dir_mtimes: Dict[str, int] = {}
 
         if not self.workspace_root.exists():
-            return repos
+            return repo_paths
 
         # Search for .git directories
         for root, dirs, _ in os.walk(self.workspace_root):
+            try:
+                dir_mtimes[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                pass
+
             # Calculate current depth
             depth = str(root).count(os.sep) - str(self.workspace_root).count(os.sep)
 
@@ -67,16 +107,13 @@ class WorkspaceManager:
 
             # Check if this directory is a git repo
             if '.git' in dirs:
-                repo_path = Path(root)
-                repo_info = self._get_repo_info(repo_path)
-                repos.append(repo_info)
+                repo_paths.append(Path(root))
 
                 # Don't recurse into this repo
                 dirs.clear()
 
-        # Sort by name
-        repos.sort(key=lambda r: r.name)
-        return repos
+        self._repo_paths_cache[max_depth] = (dir_mtimes, repo_paths)
+        return repo_paths
 
     def _get_repo_info(self, repo_path: Path) -> RepoInfo:
         """
@@ -0,0 +1,112 @@
+"""Tests for StateManager state revisions and deltas."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.state import ServiceInfo, StateManager
+
+
+def _service(service_id: str) -> ServiceInfo:
+    return ServiceInfo(
+        id=service_id,
+        name="web",
+        command="npm run dev",
+        cwd="/tmp",
+        port=3000,
+        pid=1234,
+        started_at=datetime(2024, 1, 1),
+    )
+
+
+class _Client:
+    """Dashboard stand-in that applies "state"/"delta" messages like App.tsx."""
+
+    def __init__(self):
+        self.state = None
+        self.epoch = None
+        self.rev = None
+        self.received = []
+
+    async def send(self, message, text=None):
+        data = json.loads(message)
+        self.received.append(data)
+        if data["type"] == "state":
+            self.state = data["data"]
+        elif data["type"] == "delta":
+            for op in data["patch"]:
+                key = op["path"][1:]
+                if op["op"] == "remove":
+                    self.state.pop(key, None)
+                else:
+                    self.state[key] = op["value"]
+        self.epoch = data.get("epoch")
+        self.rev = data.get("rev")
+
+    async def reconnect(self, state: StateManager):
+        await state.send_state(self, self.rev, self.epoch)
+        return self.received[-1]
+
+
+@pytest.mark.asyncio
+async def test_delta_reports_in_place_service_status_change():
+    state = StateManager()
+    client = _Client()
+    await state.add_service(_service("s1"))
+    await state.send_state(client)
+
+    await state.update_service_status("s1", "stopped")
+    delta = await client.reconnect(state)
+
+    assert delta["type"] == "delta"
+    assert [op["path"] for op in delta["patch"]] == ["/services"]
+    assert client.state["services"]["s1"]["status"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_rebuild_keeps_revision():
+    state = StateManager()
+    client = _Client()
+    await state.set_workspace({"repos": 1})
+    await state.send_state(client)
+    since = client.rev
+    await state.set_workspace({"repos": 1})
+
+    delta = await client.reconnect(state)
+
+    assert delta["rev"] == since
+    assert delta["patch"] == []
+
+
+@pytest.mark.asyncio
+async def test_reconnect_sees_removal_of_incrementally_added_approval():
+    state = StateManager()
+    client = _Client()
+    await state.send_state(client)
+
+    # The client applies "approval_required" itself, then disconnects
+    await state.add_pending_approval({"id": "ap1", "command": "rm -rf build"})
+    client.state["pending_approvals"].append({"id": "ap1"})
+    await state.remove_pending_approval("ap1")
+
+    message = await client.reconnect(state)
+
+    assert message["type"] == "state" or message["patch"] != []
+    assert client.state["pending_approvals"] == []
+
+
+@pytest.mark.asyncio
+async def test_revision_from_another_process_gets_full_state():
+    old = StateManager()
+    client = _Client()
+    await old.add_service(_service("s1"))
+    await old.send_state(client)
+
+    new = StateManager()
+    for _ in range(client.rev):
+        await new.set_workspace({"n": _})
+    message = await client.reconnect(new)
+
+    assert message["type"] == "state"
+    assert client.state["services"] == {}